@@ -28,6 +28,10 @@ class TestCommand(Command):
 def do_cythonize():
     return cythonize(
             [Extension(
+                "*",
+                ["src/ore_algebra/*.pyx"],
+            ),
+            Extension(
                 "*",
                 ["src/ore_algebra/analytic/*.pyx"],
             )],
@@ -66,6 +70,7 @@ setup(
         "ore_algebra",
         "ore_algebra.analytic",
         "ore_algebra.analytic.examples",
+        "ore_algebra.benchmarks",
         "ore_algebra.examples",
     ],
     package_dir = {'': 'src/'},
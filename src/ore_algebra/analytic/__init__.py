@@ -31,10 +31,12 @@ consequence, some features may be undocumented and/or very experimental.
 
     ore_algebra.analytic.bounds
     ore_algebra.analytic.context
+    ore_algebra.analytic.disk_cache
     ore_algebra.analytic.function
     ore_algebra.analytic.monodromy
     ore_algebra.analytic.path
     ore_algebra.analytic.polynomial_approximation
+    ore_algebra.analytic.profiling
     ore_algebra.analytic.ui
 
 .. rubric:: Symbolic-Numeric Factorization
@@ -17,6 +17,7 @@ import logging
 
 from sage.rings.all import  ZZ, QQ, RR
 
+from . import profiling
 from .safe_cmp import safe_lt, safe_le
 
 logger = logging.getLogger(__name__)
@@ -117,6 +118,10 @@ class StopOnRigorousBound(StoppingCriterion):
         self.eps = eps
         self.prec = ZZ(eps.log(2).lower().floor()) - 2
         self.fast_fail = fast_fail
+        # Index at which the last successful check occurred, and index below
+        # which not to attempt to compute rigorous bounds
+        self.last_n = None
+        self.skip_until = 0
 
     def check(self, cb, n, ini_tb, est, next_stride):
         r"""
@@ -160,16 +165,31 @@ class StopOnRigorousBound(StoppingCriterion):
             assert width.is_finite()
             return False, tb
 
-        resid = cb.get_residuals(self, n)
+        if n < self.skip_until:
+            # A previous computation with the same majorant and a larger eps
+            # did not stop before skip_until: computing bounds is most likely
+            # a waste of time.
+            logger.debug("n=%d, est=%s, width=%s, skipping until n=%d",
+                         n, est, width, self.skip_until)
+            return False, tb
+
+        rec = profiling.recorder(self.maj.ctx)
+        rec.note(nterms=n)
+
+        with rec.timer("bounds"):
+            resid = cb.get_residuals(self, n)
 
         while True:
             prev_tb = tb
-            tb = cb.get_bound(self, n, resid)
+            with rec.timer("bounds"):
+                tb = cb.get_bound(self, n, resid)
             logger.debug("n=%d, est=%s, width=%s, tail_bound=%s",
                          n, est, width, tb)
             bound_getting_worse = ini_tb.is_finite() and not safe_lt(tb, ini_tb)
             if safe_lt(tb, eps):
                 logger.debug("--> ok")
+                if eps is self.eps:
+                    self.last_n = n
                 return True, tb
             elif (prev_tb.is_finite() and not safe_le(tb, prev_tb >> 8)
                     or not self.maj.can_refine()):
@@ -198,7 +218,8 @@ class StopOnRigorousBound(StoppingCriterion):
                 # branch, we do not stop asap if the bound is getting worse in
                 # the present case.)
                 logger.debug("--> intervals blowing up or bound getting worse")
-                self.maj.refine()
+                with rec.timer("bounds"):
+                    self.maj.refine()
             else:
                 thr = tb*est**(QQ(next_stride*(self.maj.effort()**2 + 2))/(n+1))
                 if safe_le(thr, eps):
@@ -207,13 +228,23 @@ class StopOnRigorousBound(StoppingCriterion):
                                  thr, eps)
                     break
                 logger.debug("--> bad bound but refining may help")
-                self.maj.refine()
+                with rec.timer("bounds"):
+                    self.maj.refine()
         logger.debug("--> ko")
         return False, tb
 
     def reset(self, eps, fast_fail):
         r"""
         Update internal parameters in view of a new computation.
+
+        When restarting the summation of the same series at a higher working
+        precision with a smaller ``eps``, the point where the previous attempt
+        stopped is remembered, and the new computation does not try to prove
+        error bounds before reaching it. Since the majorant object itself
+        (including any refinement) is kept, the only work that is redone is
+        the computation of the terms.
         """
+        if self.last_n is not None and eps <= self.eps:
+            self.skip_until = self.last_n
         self.eps = eps
         self.fast_fail = fast_fail
@@ -20,18 +20,19 @@ import sage.rings.all as rings
 import sage.rings.real_arb
 import sage.rings.complex_arb
 
-from . import accuracy, bounds, utilities
+from . import accuracy, bounds, profiling, utilities
 
 from sage.matrix.constructor import identity_matrix, matrix
 from sage.rings.complex_arb import ComplexBallField
 from sage.rings.integer_ring import ZZ
+from sage.rings.number_field import number_field_base
 from sage.rings.real_arb import RealBallField
 from sage.structure.element import Matrix, canonical_coercion
 
 from .context import Context as Context  # re-export
 from .context import dctx
 from .monodromy import formal_monodromy
-from .path import EvaluationPoint_step, Path, Step
+from .path import EvaluationPoint_step, Path, Point, Step
 from .utilities import invmat
 
 logger = logging.getLogger(__name__)
@@ -70,6 +71,23 @@ def step_transition_matrix(dop, steps, eps, rows=None, split=0, ctx=dctx):
     else:
         raise ValueError(steps)
 
+    rec = profiling.recorder(ctx)
+    with rec.step(steps, utilities.prec_from_eps(eps), split):
+        return _step_transition_matrix(dop, steps, eps, rows, split, rec, ctx)
+
+def _step_transition_matrix(dop, steps, eps, rows, split, rec, ctx):
+
+    cache = ctx.transition_matrix_cache
+    if cache is not None:
+        prec = utilities.prec_from_eps(eps)
+        keys = [cache.key(dop, step, rows) for step in steps]
+        cached = [None if key is None else cache.get(key, prec)
+                  for key in keys]
+        if all(mat is not None for mat in cached):
+            logger.info("%s: using cached transition matrices", steps)
+            rec.status("cached")
+            return cached
+
     try:
         fail_fast = all(step.max_split > 0 for step in steps)
         mat = step_transition_matrix_bit_burst(dop, steps, eps, rows,
@@ -78,7 +96,8 @@ def step_transition_matrix(dop, steps, eps, rows=None, split=0, ctx=dctx):
         for i, step in enumerate(steps):
             if step.reversed:
                 try:
-                    inv = invmat(mat[i])
+                    with rec.timer("matmul"):
+                        inv = invmat(mat[i])
                     rad, invrad = mat[i].trace().rad(), inv.trace().rad()
                     if invrad**2 > rad:
                         logger.info("precision loss in inverse: rad=%s, inv.rad=%s",
@@ -95,13 +114,20 @@ def step_transition_matrix(dop, steps, eps, rows=None, split=0, ctx=dctx):
         if any(step.max_split <= 0 for step in steps):
             raise
         logger.info("splitting step...")
+        rec.status("split")
         split0, split1 = zip(*(step.split() for step in steps))
         mat0 = step_transition_matrix(dop, tuple(split0),
                                       eps/4, None, split+1, ctx)
         mat1 = [step_transition_matrix(dop, (s,), eps/4, rows, split+1, ctx)[0]
                 for s in split1]
-        mat = [m0*m1 if step.reversed else m1*m0
-               for step, m0, m1 in zip(steps, mat0, mat1)]
+        with rec.timer("matmul"):
+            mat = [m0*m1 if step.reversed else m1*m0
+                   for step, m0, m1 in zip(steps, mat0, mat1)]
+
+    if cache is not None:
+        for key, m, c in zip(keys, mat, cached):
+            if key is not None and c is None:
+                cache.set(key, prec, m)
 
     return mat
 
@@ -138,6 +164,8 @@ def step_transition_matrix_bit_burst(dop, steps, eps, rows, fail_fast, effort,
     Automatic algorithm choice, using the bit-burst method at high precision.
     """
 
+    rec = profiling.recorder(ctx)
+
     # assert all(step.start is steps[0].start for step in steps)
     z0 = steps[0].start
     ldop = dop.shift(steps[0].start)
@@ -170,6 +198,7 @@ def step_transition_matrix_bit_burst(dop, steps, eps, rows, fail_fast, effort,
         if use_binsplit and len(steps) == 1:
             sub = steps[0].bit_burst_split(tgt_prec, bit_burst_prec)
             if sub:
+                rec.count("bit_burst")
                 # Assuming bitsize(step.start) << bitsize(step.end):
                 # * this step should fall into the bb/bs branch again (and in
                 #   the pure bb sub-branch if bitsize(step.start) is small):
@@ -181,39 +210,49 @@ def step_transition_matrix_bit_burst(dop, steps, eps, rows, fail_fast, effort,
                 #   target prec >> prec of endpoints >> 0):
                 (mat1,) = step_transition_matrix_bit_burst(dop, sub[1:], eps>>1,
                         rows, fail_fast, effort, ctx)
-                return (mat1*mat0,)
+                with rec.timer("matmul"):
+                    return (mat1*mat0,)
 
         if steps[0].type == "bit-burst":
             logger.info("%s", steps[0])
 
         if use_binsplit:
+            rec.algorithm("binsplit")
             try:
                 from . import binary_splitting
-                return binary_splitting.fundamental_matrix_regular(
-                    ldop, points, eps, fail_fast, effort, ctx)
+                with rec.timer("sum"):
+                    return binary_splitting.fundamental_matrix_regular(
+                        ldop, points, eps, fail_fast, effort, ctx)
             except NotImplementedError:
                 if not use_fallback:
                     raise
                 logger.info("falling back to direct summation")
+                rec.count("fallbacks")
         else:
             if ctx.prefer_algorithm("naive", "dac"):
                 from . import naive_sum as mod
+                algo = "naive"
             else:
                 try:
                     from . import dac_sum as mod
+                    algo = "dac"
                 except ModuleNotFoundError:
                     if "naive" in ctx.algorithms or "auto" in ctx.algorithms:
                         from . import naive_sum as mod
+                        algo = "naive"
                     else:
                         raise
+            rec.algorithm(algo)
             try:
-                return mod.fundamental_matrix_regular(
-                    ldop, points, eps, fail_fast, effort, ctx)
+                with rec.timer("sum"):
+                    return mod.fundamental_matrix_regular(
+                        ldop, points, eps, fail_fast, effort, ctx)
             except accuracy.PrecisionError:
                 if not use_fallback:
                     raise
                 logger.info("not enough precision, trying binary splitting "
                             "as a fallback")
+                rec.count("fallbacks")
 
         use_binsplit = not use_binsplit
         use_fallback = False
@@ -349,6 +388,7 @@ def analytic_continuation(dop, path, eps, ctx=dctx, ini=None, post=None,
     maybe_push_point_dict(res, z0, path_mat) # value at z0 = identity
     path_mat = invmat(_process_detour(dop, z0, path_mat, eps1, ctx=ctx))
 
+    rec = profiling.recorder(ctx)
     steps = list(path.steps())
     i = 0
     while i < len(steps):
@@ -360,7 +400,8 @@ def analytic_continuation(dop, path, eps, ctx=dctx, ini=None, post=None,
             np = 1
         main_mats = step_transition_matrix(dop, steps[i:i+np], eps1, ctx=ctx)
         for step, main_mat in zip(steps[i:i+np], main_mats):
-            path_mat = main_mat*path_mat
+            with rec.timer("matmul"):
+                path_mat = main_mat*path_mat
             point = step.start if step.reversed else step.end
             branch = point.options.get("outgoing_branch")
             if branch is not None:
@@ -382,6 +423,126 @@ def analytic_continuation(dop, path, eps, ctx=dctx, ini=None, post=None,
 
     return res
 
+def _vertex_key(point):
+    value = point.value
+    parent = value.parent()
+    if isinstance(parent, number_field_base.NumberField):
+        return (parent, value, id(point.detour_to))
+    else:
+        return id(point)
+
+def batch_transition_matrices(dop, base, targets, eps, ctx=dctx):
+    r"""
+    Transition matrices from a common base point to several targets.
+
+    The paths from ``base`` to each of the ``targets`` are organized in a tree.
+    Common prefixes are only traversed once, and the steps from a given
+    vertex of this tree to all its children that lie in the same disk of
+    convergence are computed together, using a single summation of each local
+    expansion at several evaluation points.
+
+    Paths are straight lines subdivided in single-point mode, regardless of
+    ``ctx.two_point_mode``, since the goal is to share expansion points.
+
+    OUTPUT:
+
+    A list of matrices, in the same order as ``targets``.
+
+    EXAMPLES::
+
+        sage: from ore_algebra import DifferentialOperators
+        sage: from ore_algebra.analytic.analytic_continuation import (
+        ....:         batch_transition_matrices)
+        sage: from ore_algebra.analytic.differential_operator import DifferentialOperator
+        sage: Dops, x, Dx = DifferentialOperators()
+        sage: dop = DifferentialOperator((x^2 + 1)*Dx^2 + 2*x*Dx)
+        sage: mats = batch_transition_matrices(dop, 0,
+        ....:             [k/10 for k in range(1, 8)] + [2, 1+i], 1e-20)
+        sage: all(m[0,1].overlaps(RBF(k/10).arctan())
+        ....:     for k, m in enumerate(mats[:7], start=1))
+        True
+        sage: mats[7][0,1]
+        [1.10714871779409050301706546...]
+        sage: mats[8][0,1].overlaps(CBF(1+i).arctan())
+        True
+
+    TESTS::
+
+        sage: batch_transition_matrices(dop, 0, [], 1e-10)
+        []
+        sage: [mat.is_one() for mat in batch_transition_matrices(dop, 1/2, [1/2], 1e-10)]
+        [True]
+    """
+    if dop.is_zero():
+        raise ValueError("operator must be nonzero")
+    _, _, _, dop = dop._normalize_base_ring()
+    if not targets:
+        return []
+
+    ctx = Context(ctx=ctx)
+    ctx.two_point_mode = False
+
+    # A single Point object for the base, so that cached data related to it
+    # (singularities, local basis structure...) is shared by all paths
+    z0 = Point(base, dop)
+    paths = [_process_path(dop, [z0, [tgt]], ctx) for tgt in targets]
+    logger.info("%s paths, max length %s", len(paths),
+                max(len(path) for path in paths))
+
+    eps = ctx.IR(eps)
+    eps1 = (eps/(1 + max(len(path) for path in paths))) >> 4
+
+    # Tree of paths: the nodes are prefixes of the paths, represented by
+    # tuples of vertex keys, and we store the transition matrix from the base
+    # point to the last vertex of each prefix.
+    steps = [list(path.steps()) for path in paths]
+    keys = [[_vertex_key(v) for v in path.vert] for path in paths]
+    path_mats = {}
+    for path, key in zip(paths, keys):
+        # usually a single root, unless the base point needs a detour
+        if (key[0],) not in path_mats:
+            path_mat = identity_matrix(ZZ, dop.order())
+            path_mat = _process_detour(dop, path.vert[0], path_mat, eps1,
+                                       ctx=ctx)
+            path_mats[key[0],] = invmat(path_mat)
+
+    for depth in range(1, max(len(path.vert) for path in paths)):
+        # Group the steps of this level by parent node
+        groups = {}
+        for j, path in enumerate(paths):
+            if depth < len(path.vert):
+                node = tuple(keys[j][:depth+1])
+                children = groups.setdefault(node[:-1], {})
+                children.setdefault(node, steps[j][depth-1])
+        for parent, children in groups.items():
+            direct = [(node, step) for node, step in children.items()
+                      if not step.reversed]
+            if direct:
+                start = direct[0][1].start
+                batch = [Step(start, step.end, type=step.type,
+                              max_split=step.max_split)
+                         for _, step in direct]
+                mats = step_transition_matrix(dop, batch, eps1, ctx=ctx)
+                for (node, _), mat in zip(direct, mats):
+                    path_mats[node] = mat*path_mats[parent]
+            for node, step in children.items():
+                if step.reversed:
+                    [mat] = step_transition_matrix(dop, [step], eps1, ctx=ctx)
+                    path_mats[node] = mat*path_mats[parent]
+
+    res = []
+    for j, path in enumerate(paths):
+        point = path.vert[-1]
+        val_mat = path_mats[tuple(keys[j])]
+        res.append(_process_detour(dop, point, val_mat, eps1, ctx=ctx))
+
+    cm = sage.structure.element.get_coercion_model()
+    real = (rings.RIF.has_coerce_map_from(dop.base_ring().base_ring())
+            and all(v.is_real() for path in paths for v in path.vert))
+    OutputIntervals = cm.common_parent(utilities.ball_field(eps, real),
+                                       *[mat.base_ring() for mat in res])
+    return [mat.change_ring(OutputIntervals) for mat in res]
+
 def normalize_post_transform(dop, post_transform):
     if post_transform is None:
         post_transform = dop.parent().one()
@@ -236,9 +236,11 @@ Miscellaneous examples::
 #
 # http://www.gnu.org/licenses/
 
+import collections
 import copy
 import logging
 import pprint
+import sys
 
 import sage.rings.polynomial.polynomial_element as polyelt
 import sage.rings.polynomial.polynomial_ring as polyring
@@ -254,7 +256,7 @@ from sage.rings.number_field import number_field_base
 from sage.structure.coerce_exceptions import CoercionException
 from sage.structure.sequence import Sequence
 
-from . import accuracy, bounds, utilities
+from . import accuracy, bounds, profiling, utilities
 
 from .context import dctx
 from .local_solutions import (bw_shift_rec, FundamentalSolution,
@@ -279,7 +281,7 @@ class StepMatrix: # pylint: disable=attribute-defined-outside-init
     of the series at once.
     """
 
-    def __init__(self, rec, n0, n1, ord_log):
+    def __init__(self, rec, n0, n1, ord_log, cache_key=None):
 
         self.idx_start = n0
         self.idx_end = n1
@@ -294,42 +296,68 @@ class StepMatrix: # pylint: disable=attribute-defined-outside-init
         if n0 == n1:
             self._init_identity(rec, ord_log)
         elif n0 is not None:
-            self._init_range(rec, n0, n1, ord_log)
+            self._init_range(rec, n0, n1, ord_log, cache_key)
 
     def _init_identity(self, rec, ord_log):
         self.rec_mat = rec.Mat_rec.one()
         self.zero_sum, self.sums_row = rec.Series_sums(ord_log)
 
-    def _init_range(self, rec, n0, n1, ord_log):
+    def _init_range(self, rec, n0, n1, ord_log, cache_key=None):
         r"""
         Naïve unrolling.
+
+        When ``cache_key`` is not ``None``, the part of the computation that
+        only depends on the recurrence (the denominators and the last
+        coefficient of each sequence at each step, along with the resulting
+        ``rec_den`` and ``rec_mat``) is looked up in, or saved to,
+        ``rec.cache``, and only the partial sums need to be recomputed on
+        cache hits.
         """
 
         self.zero_sum, self.sums_row, seqs = self._seq_init(rec, ord_log)
 
+        cached = None if cache_key is None else rec.cache.get(cache_key)
+        trace = [] if cache_key is not None and cached is None else None
+
         for n in range(n0+1, n1+1):
 
             # Order matters!
 
-            bwrec_n, rec_den_n = self._coeff_series_num_den(rec, n, ord_log)
+            if cached is None:
+                bwrec_n, rec_den_n = self._coeff_series_num_den(rec, n, ord_log)
+                lasts = seqs
+            else:
+                rec_den_n, lasts = cached[0][n-n0-1]
 
             # for each evaluation point
             for (sums_row, pow_num, rec_pow_den) in zip(self.sums_row,
                                                      self.pow_num, rec.pow_den):
                 den = rec_pow_den*rec_den_n
                 # for each element of a basis of solutions of the recurrence
-                for (num, psum) in zip(seqs, sums_row):
+                for (num, psum) in zip(lasts, sums_row):
                     self._seq_next_psum(psum, num, pow_num, den, ord_log)
 
-            for num in seqs: # for each solution
-                self._seq_next_num(num, bwrec_n, rec_den_n, ord_log)
+            if cached is None:
+                if trace is not None:
+                    # copies, as _seq_next_num() may work in place
+                    trace.append((rec_den_n, [
+                        [rec.Pols_rec.element_class(rec.Pols_rec,
+                                                    num[-1].list(), check=False)]
+                        for num in seqs]))
+                for num in seqs: # for each solution
+                    self._seq_next_num(num, bwrec_n, rec_den_n, ord_log)
 
             for i in range(len(self.sums_row)): # for each evaluation point
                 self.pow_num[i] = self.pow_num[i]._mul_trunc_(rec.pow_num[i],
                                                               self.ord_diff)
                 self.pow_den[i] *= rec.pow_den[i]
 
-            self.rec_den *= rec_den_n
+            if cached is None:
+                self.rec_den *= rec_den_n
+
+        if cached is not None:
+            _, self.rec_den, self.rec_mat = cached
+            return
 
         # Polynomial of matrices.
         rec_mat = []
@@ -343,6 +371,9 @@ class StepMatrix: # pylint: disable=attribute-defined-outside-init
         self.rec_mat = rec.Mat_rec.element_class(rec.Mat_rec, rec_mat,
                                                  check=False)
 
+        if trace is not None:
+            rec.cache.set(cache_key, (trace, self.rec_den, self.rec_mat))
+
         # TODO: find and remove common factors?
         # self.simplify()
 
@@ -438,14 +469,23 @@ class StepMatrix: # pylint: disable=attribute-defined-outside-init
             res1[j] = res2
         return res1
 
-    def imulleft(low, high): # pylint: disable=no-self-argument
+    def imulleft(low, high, rec_mat=None): # pylint: disable=no-self-argument
+        r"""
+        Replace ``low`` by ``high*low``.
+
+        If ``rec_mat`` is not ``None``, it is taken to be the already known
+        value of ``high.rec_mat*low.rec_mat`` (truncated at order
+        ``high.ord_log``).
+        """
         assert high.idx_start == low.idx_end
         # logger.debug("(%s->%s)*(%s->%s)", high.idx_start, high.idx_end,
         #                                   low.idx_start, low.idx_end)
 
         for i in range(len(low.sums_row)): # must come early
             low.sums_row[i] = low.compute_sums_row(high, i)
-        low.rec_mat = high.rec_mat._mul_trunc_(low.rec_mat, high.ord_log)
+        if rec_mat is None:
+            rec_mat = high.rec_mat._mul_trunc_(low.rec_mat, high.ord_log)
+        low.rec_mat = rec_mat
         for i in range(len(low.pow_num)):
             low.pow_num[i] = low.pow_num[i]._mul_trunc_(high.pow_num[i],
                                                         low.ord_diff)
@@ -717,6 +757,107 @@ class SolutionColumn:
         den = abs(IC_est(self.v.rec_den))*IR(self.v.pow_den[0])
         return num1*num2/den
 
+class StepMatrixCache:
+    r"""
+    Cache of the parts of binary splitting product trees that only depend on
+    the recurrence.
+
+    An object of this class can be passed to the analytic continuation code
+    using the ``binsplit_cache`` option. Step matrices are then computed in
+    such a way that subproducts can be shared between calls that sum the same
+    local expansions (same operator, expansion point, working precision...)
+    at different evaluation points or to different orders. On subsequent
+    calls, only the evaluation-point dependent part of the step matrices
+    (partial sums and powers of the evaluation points) is recomputed. This
+    saves the most time when the recurrence is of high order.
+
+    Entries are evicted in least recently used order once their (roughly
+    estimated) total size exceeds ``max_size`` bytes.
+
+    EXAMPLES::
+
+        sage: from ore_algebra import DifferentialOperators
+        sage: from ore_algebra.analytic.binary_splitting import StepMatrixCache
+        sage: Dops, x, Dx = DifferentialOperators()
+        sage: dop = (x^2 + 1)*Dx^2 + 2*x*Dx
+        sage: cache = StepMatrixCache()
+        sage: mat = dop.numerical_transition_matrix([0, 1/2], 1e-100,
+        ....:         algorithm="binsplit", binsplit_cache=cache)
+        sage: mat[0,1].overlaps(RBF(1/2).arctan())
+        True
+        sage: mat = dop.numerical_transition_matrix([0, 1/3], 1e-100,
+        ....:         algorithm="binsplit", binsplit_cache=cache)
+        sage: cache.hits > 0
+        True
+        sage: mat[0,1].overlaps(RBF(1/3).arctan())
+        True
+        sage: cache
+        <cache of ... step matrices, ... bytes, ... hits, ... misses>
+    """
+
+    def __init__(self, max_size=2**28):
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return "<cache of {} step matrices, {} bytes, {} hits, {} misses>".format(
+                len(self), self.size, self.hits, self.misses)
+
+    def get(self, key):
+        try:
+            value, _ = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        size = _size_estimate(value)
+        if size > self.max_size:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.size -= old[1]
+        self._entries[key] = (value, size)
+        self.size += size
+        while self.size > self.max_size:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.size -= size
+
+    def clear(self):
+        self._entries.clear()
+        self.size = 0
+
+def _size_estimate(obj):
+    r"""
+    Rough estimate of the memory used by a step matrix or part of a step
+    matrix, in bytes.
+    """
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(_size_estimate(a) for a in obj)
+    try:
+        parent = obj.parent()
+    except AttributeError:
+        return sys.getsizeof(obj)
+    if isinstance(parent, (RealBallField, ComplexBallField)):
+        return 48 + parent.precision()//4
+    elif parent is QQ or parent is ZZ:
+        return 32 + (obj.numerator().nbits() + obj.denominator().nbits())//8
+    elif isinstance(parent, number_field_base.NumberField):
+        return sys.getsizeof(obj) + sum(_size_estimate(c) for c in obj.list())
+    elif hasattr(obj, "list"): # polynomials, matrices
+        return sys.getsizeof(obj) + _size_estimate(obj.list())
+    else:
+        return sys.getsizeof(obj)
+
 class MatrixRec:
     r"""
     A matrix recurrence simultaneously generating the coefficients and partial
@@ -798,7 +939,7 @@ class MatrixRec:
     """
 
     def __init__(self, dop, shift, singular_indices,
-                 evpts, derivatives, prec, binsplit_threshold):
+                 evpts, derivatives, prec, binsplit_threshold, cache=None):
 
         # TODO: perhaps dynamically optimize the representation when there are
         # no logs, algebraic exponents, etc.
@@ -880,6 +1021,12 @@ class MatrixRec:
 
         assert len(self.pow_num) == len(self.pow_den) == self.npoints
 
+        # Everything the coefficient-only part of the step matrices depends on
+        self.cache = cache
+        if cache is not None:
+            self._cache_key = (dop, self.shift, self.AlgInts_rec,
+                               tuple(singular_indices))
+
     def Series_sums(self, ord_log):
         zero = self.AlgInts_sums.zero()
         row = [[[[zero]*self.derivatives for _ in range(ord_log)]
@@ -1017,13 +1164,30 @@ class MatrixRec:
         Compute R(high)·R(high-1)···R(low+1) by binary splitting.
         """
         if high - low <= self.binsplit_threshold:
-            mat = self.StepMatrix_class(self, low, high, ord_log)
-        else:
+            key = None
+            if self.cache is not None:
+                key = self._cache_key + ("leaf", low, high, ord_log)
+            mat = self.StepMatrix_class(self, low, high, ord_log, key)
+        elif self.cache is None:
             mid = (low + high) // 2
             mat = self.step_matrix_binsplit(low, mid, ord_log)
             if high - low > 400000//self.ordrec**3:
                 logger.info("(n=%s)", mid)
             mat.imulleft(self.step_matrix_binsplit(mid, high, ord_log))
+        else:
+            # Split at the multiple of the largest possible power of two, so
+            # that the trees for ranges with a common prefix share subtrees
+            b = (int(low) ^ int(high - 1)).bit_length() - 1
+            mid = ((int(high) - 1) >> b) << b
+            mat = self.step_matrix_binsplit(low, mid, ord_log)
+            if high - low > 400000//self.ordrec**3:
+                logger.info("(n=%s)", mid)
+            key = self._cache_key + ("prod", low, high, ord_log)
+            rec_mat = self.cache.get(key)
+            mat.imulleft(self.step_matrix_binsplit(mid, high, ord_log),
+                         rec_mat)
+            if rec_mat is None:
+                self.cache.set(key, mat.rec_mat)
         return mat
 
     def __repr__(self):
@@ -1094,14 +1258,19 @@ class MatrixRecsUnroller(LocalBasisMapper): # pylint: disable=attribute-defined-
         # Generic recurrence matrix
         self.matrix_rec = MatrixRec(self.dop, self.leftmost, self.shifts,
                 self.evpts, self.derivatives, utilities.prec_from_eps(self.eps),
-                min(self.ctx.binsplit_thr, self._est_terms))
+                min(self.ctx.binsplit_thr, self._est_terms),
+                self.ctx.binsplit_cache)
+
+        rec = profiling.recorder(self.ctx)
+        rec.note(prec=utilities.prec_from_eps(self.eps))
 
         # Majorants
-        maj = {rt: bounds.DiffOpBound(self.dop, rt, self.shifts,
-                                      bound_inverse="solve",
-                                      ind_roots=self.all_roots,
-                                      ctx=self.ctx)
-               for rt in self.roots}
+        with rec.timer("bounds"):
+            maj = {rt: bounds.DiffOpBound(self.dop, rt, self.shifts,
+                                          bound_inverse="solve",
+                                          ind_roots=self.all_roots,
+                                          ctx=self.ctx)
+                   for rt in self.roots}
 
         wrapper = bounds.MultiDiffOpBound(maj.values())
         # TODO: switch to fast_fail=True?
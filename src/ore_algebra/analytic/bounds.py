@@ -2441,6 +2441,7 @@ class MultiDiffOpBound:
 
     def __init__(self, majs):
         self.IR = next(iter(majs)).IR
+        self.ctx = next(iter(majs)).ctx
         assert all(maj.IR is self.IR for maj in majs)
         self.majs = majs
 
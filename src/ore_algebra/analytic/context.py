@@ -52,6 +52,12 @@ class Context:
     - ``binsplit_thr`` (int) -- Threshold used in the binary splitting algorithm
       to determine when to use a basecase algorithm for a subproduct.
 
+    - ``binsplit_cache`` -- A
+      :class:`~ore_algebra.analytic.binary_splitting.StepMatrixCache` in which
+      to store the parts of the binary splitting product trees that do not
+      depend on the evaluation point, for reuse in subsequent computations
+      involving the same local expansions, or ``None``.
+
     - ``bit_burst_thr`` (int) -- Minimal bit size to consider using bit-burst
       steps instead of direct binary splitting.
 
@@ -66,11 +72,19 @@ class Context:
 
     - ``force_algorithm`` -- DEPRECATED. See ``algorithm``.
 
+    - ``ncpus`` (int) -- Maximum number of processes to use for summing
+      independent solutions in parallel. Currently only used by the
+      divide-and-conquer summation algorithm and by the computation of
+      monodromy matrices.
+
     - ``recorder`` -- An object that will be used to record various intermediate
-      results for debugging and analysis purposes. At the moment recording just
-      consists in writing data to some fields of the object. Look at the source
-      code to see what fields are available; define those fields as properties
-      to process the data.
+      results for debugging and analysis purposes. A
+      :class:`~ore_algebra.analytic.profiling.ProfilingRecorder` collects
+      timings, working precisions, numbers of terms and restarts for each
+      analytic continuation step. With other objects, recording just consists
+      in writing data to some fields of the object. Look at the source code to
+      see what fields are available; define those fields as properties to
+      process the data.
 
     - ``simple_approx_thr`` (int) -- Bit size above which vertices of the
       analytic continuation path should be replaced by simpler approximations if
@@ -80,6 +94,11 @@ class Context:
       reduce the working precision in the direct summation algorithm, at the
       price of computing additional error bounds.
 
+    - ``transition_matrix_cache`` -- A
+      :class:`~ore_algebra.analytic.disk_cache.TransitionMatrixCache` in which
+      to look up and store the transition matrices associated to individual
+      analytic continuation steps, or ``None``.
+
     - ``two_point_mode`` (boolean) -- If ``True``, when possible, compute series
       expansions at every second point of the integration path and evaluate each
       expansion at two points. If ``False``, prefer evaluating each expansion at
@@ -104,14 +123,17 @@ class Context:
                      algorithm=("auto",),
                      apply_dop="APPLY_DOP_AUTO",
                      assume_analytic=False,
+                     binsplit_cache=None,
                      binsplit_thr=128,
                      bit_burst_thr=32,
                      bounds_prec=53,
                      deform=False,
                      force_algorithm=None,  # deprecated
+                     ncpus=1,
                      recorder=None,
                      simple_approx_thr=64,
                      squash_intervals=False,
+                     transition_matrix_cache=None,
                      two_point_mode=None,
                      **kwds
                      ):
@@ -142,6 +164,8 @@ class Context:
             raise TypeError("assume_analytic", type(assume_analytic))
         self.assume_analytic = assume_analytic
 
+        self.binsplit_cache = binsplit_cache
+
         self.binsplit_thr = int(binsplit_thr)
 
         self.bit_burst_thr = int(bit_burst_thr)
@@ -152,6 +176,10 @@ class Context:
             raise TypeError("deform", type(deform))
         self.deform = deform
 
+        self.ncpus = int(ncpus)
+        if self.ncpus < 1:
+            raise ValueError("ncpus", ncpus)
+
         self.recorder = recorder
 
         self.simple_approx_thr = int(simple_approx_thr)
@@ -160,6 +188,8 @@ class Context:
             raise TypeError("squash_intervals", type(squash_intervals))
         self.squash_intervals = squash_intervals
 
+        self.transition_matrix_cache = transition_matrix_cache
+
         if two_point_mode is None:
             two_point_mode = not deform
         if not isinstance(two_point_mode, bool):
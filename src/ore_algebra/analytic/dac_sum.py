@@ -141,6 +141,7 @@ from itertools import count
 from types import SimpleNamespace
 
 from sage.modules.free_module_element import vector
+from sage.parallel.decorate import parallel
 from sage.matrix.constructor import matrix
 from sage.rings.complex_arb import ComplexBallField
 from sage.rings.integer_ring import ZZ
@@ -150,6 +151,7 @@ from sage.structure.sequence import Sequence
 
 from . import accuracy
 from . import bounds
+from . import profiling
 from . import utilities
 
 from .bounds import DiffOpBound
@@ -209,12 +211,47 @@ class HighestSolMapper_dac(HighestSolMapper):
     def do_sum(self, inis):
 
         # XXX get rid of this if possible?
-        maj = DiffOpBound(self.dop, self.leftmost,
+        with profiling.recorder(self.ctx).timer("bounds"):
+            maj = DiffOpBound(self.dop, self.leftmost,
                         special_shifts=(None if self.ordinary else self.shifts),
                         bound_inverse="solve",
                         ind_roots=self.all_roots,
                         ctx=self.ctx)
 
+        ncpus = min(self.ctx.ncpus, len(inis))
+        if ncpus <= 1:
+            return self._sum_group(maj, inis, range(len(inis)))
+
+        # The solutions are independent, sum them by groups in forked
+        # processes. Each group has its own working precision and stopping
+        # criterion. This duplicates the evaluation of the coefficients of
+        # the recurrence, which the DACUnroller would otherwise share between
+        # all solutions, but leaves fewer cores idle for operators of large
+        # order.
+        @parallel(ncpus=ncpus)
+        def forked_sum(indices):
+            try:
+                return self._sum_group(maj, [inis[j] for j in indices],
+                                       indices)
+            except Exception as exn: # pylint: disable=broad-except
+                return exn
+
+        groups = [list(range(k, len(inis), ncpus)) for k in range(ncpus)]
+        logger.info("summing %s solutions in %s groups", len(inis), ncpus)
+        sols = [None]*len(inis)
+        for ((indices,), _), res in forked_sum(groups):
+            if isinstance(res, Exception):
+                raise res
+            if not isinstance(res, list):
+                # @parallel returns 'NO DATA' when the worker process died
+                raise RuntimeError(f"worker process failed on solutions "
+                                   f"{indices}: {res!r}")
+            for j, sol in zip(indices, res):
+                sols[j] = sol
+        return sols
+
+    def _sum_group(self, maj, inis, indices):
+
         effort = self.effort
 
         # Adapted from naive_sum.RecUnroller_tail_bound.sum_auto, with a little
@@ -249,7 +286,10 @@ class HighestSolMapper_dac(HighestSolMapper):
 
         logger.info("initial working precision = %s bits", bit_prec)
 
+        rec = profiling.recorder(self.ctx)
+
         for attempt in count(1):
+            rec.note(prec=bit_prec)
             logger.debug("attempt #%s (of max %s), bit_prec=%s, sums_prec=%s",
                          attempt, effort + 1, bit_prec, sums_prec)
             ini_are_accurate = 2*input_accuracy > bit_prec
@@ -294,6 +334,7 @@ class HighestSolMapper_dac(HighestSolMapper):
                 logger.info("lost too much precision, restarting with %d bits "
                             "(%d bits for sums)",
                             bit_prec, sums_prec)
+                rec.count("restarts")
                 continue
             if self.fail_fast:
                 raise accuracy.PrecisionError
@@ -307,7 +348,7 @@ class HighestSolMapper_dac(HighestSolMapper):
         sols = []
         for j, sums in enumerate(allsums):
             # fixed solution, entries of sums <-> eval pts
-            mult = self.shifts[j][1]
+            mult = self.shifts[indices[j]][1]
             downshifts = [
                 log_series_values(
                     Jets,
@@ -328,6 +369,16 @@ class HighestSolMapper_dac(HighestSolMapper):
 def fundamental_matrix_regular(dop, evpts, eps, fail_fast, effort, ctx=dctx):
     r"""
     Fundamental matrix at a possibly regular singular point
+
+    TESTS::
+
+        sage: from ore_algebra import DifferentialOperators
+        sage: Dops, x, Dx = DifferentialOperators()
+        sage: dop = (x^2 + 1)*Dx^2 + 2*x*Dx
+        sage: dop.numerical_transition_matrix([0, 1/2], 1e-30, algorithm="dac",
+        ....:                                 ncpus=2)
+        [ [1.000000000000000000000000000...] [0.46364760900080611621425623146...]]
+        [                         [+/- ...]  [0.80000000000000000000000000000...]]
     """
     eps_col = ctx.IR(eps)/ctx.IR(dop.order()).sqrt()
     hsm = HighestSolMapper_dac(dop, evpts, eps_col, fail_fast, effort, ctx=ctx)
@@ -0,0 +1,215 @@
+# vim: tw=80
+r"""
+Persistent cache of transition matrices
+
+A :class:`TransitionMatrixCache` stores the certified transition matrices
+computed during analytic continuation in an SQLite database, so that they can
+be reused in later sessions. Pass it to the analytic continuation code using
+the ``transition_matrix_cache`` option.
+
+EXAMPLES::
+
+    sage: from ore_algebra import DifferentialOperators
+    sage: from ore_algebra.analytic.disk_cache import TransitionMatrixCache
+    sage: Dops, x, Dx = DifferentialOperators()
+    sage: dop = (x^2 + 1)*Dx^2 + 2*x*Dx
+
+    sage: cache = TransitionMatrixCache(tmp_filename(ext=".sqlite"))
+    sage: mat = dop.numerical_transition_matrix([0, 1/2, 1], 1e-40,
+    ....:                                       transition_matrix_cache=cache)
+    sage: len(cache) > 0
+    True
+
+Results computed at a higher precision are used to answer requests at a lower
+one::
+
+    sage: hits = cache.hits
+    sage: mat2 = dop.numerical_transition_matrix([0, 1/2, 1], 1e-20,
+    ....:                                        transition_matrix_cache=cache)
+    sage: cache.hits > hits
+    True
+    sage: mat2[0,1]
+    [0.785398163397448309615...]
+
+The cache survives the object holding it::
+
+    sage: cache2 = TransitionMatrixCache(cache.filename)
+    sage: len(cache2) == len(cache)
+    True
+"""
+
+# Distributed under the terms of the GNU General Public License (GPL) either
+# version 2, or (at your option) any later version
+#
+# http://www.gnu.org/licenses/
+
+import hashlib
+import logging
+import os
+import sqlite3
+
+from sage.misc.persist import dumps, loads
+from sage.rings.number_field import number_field_base
+
+logger = logging.getLogger(__name__)
+
+class TransitionMatrixCache:
+    r"""
+    On-disk cache of transition matrices.
+
+    Entries are indexed by a hash of the operator, the exact endpoints of the
+    step and the number of rows of the transition matrix, and carry the
+    target precision they were computed for. A lookup returns the entry of
+    lowest precision that is at least the requested one, if any. At most
+    ``max_entries`` entries are kept, those not used for the longest time
+    being evicted first.
+
+    Steps with inexact endpoints are never cached.
+
+    INPUT:
+
+    - ``filename`` -- path of the SQLite database, created if necessary
+    - ``max_entries`` (int) -- maximum number of entries
+    """
+
+    def __init__(self, filename, max_entries=100000):
+        self.filename = filename
+        self.max_entries = int(max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._pid = None
+        self._conn = None
+        with self._db:
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS transition_matrices (
+                    key TEXT NOT NULL,
+                    prec INTEGER NOT NULL,
+                    atime INTEGER NOT NULL,
+                    value BLOB NOT NULL,
+                    PRIMARY KEY (key, prec))""")
+        self._clock = self._db.execute(
+                "SELECT COALESCE(MAX(atime), 0) FROM transition_matrices"
+                ).fetchone()[0]
+
+    @property
+    def _db(self):
+        # SQLite connections cannot be shared with forked processes, open a
+        # new one in each process
+        pid = os.getpid()
+        if self._pid != pid:
+            self._conn = sqlite3.connect(self.filename)
+            self._pid = pid
+        return self._conn
+
+    def __len__(self):
+        return self._db.execute(
+                "SELECT COUNT(*) FROM transition_matrices").fetchone()[0]
+
+    def __repr__(self):
+        return "<transition matrix cache at {}, {} entries>".format(
+                self.filename, len(self))
+
+    def _tick(self):
+        self._clock += 1
+        return self._clock
+
+    def key(self, dop, step, rows):
+        r"""
+        Hash of the data determining the transition matrix associated to
+        ``step``, or ``None`` if it should not be cached.
+        """
+        data = [repr(dop.base_ring()), repr(dop), repr(rows),
+                repr(step.reversed)]
+        for pt in (step.start, step.end):
+            parent = pt.value.parent()
+            if (not isinstance(parent, number_field_base.NumberField)
+                    or pt.options.get("outgoing_branch") is not None):
+                return None
+            data.append(repr(parent))
+            data.append(repr(pt.value))
+        return hashlib.sha256("\n".join(data).encode()).hexdigest()
+
+    def get(self, key, prec):
+        r"""
+        Return a cached transition matrix computed at precision at least
+        ``prec`` for ``key``, or ``None``.
+        """
+        row = self._db.execute("""
+                SELECT prec, value FROM transition_matrices
+                WHERE key = ? AND prec >= ?
+                ORDER BY prec LIMIT 1""", (key, int(prec))).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        with self._db:
+            self._db.execute("""
+                UPDATE transition_matrices SET atime = ?
+                WHERE key = ? AND prec = ?""", (self._tick(), key, row[0]))
+        return loads(row[1])
+
+    def set(self, key, prec, mat):
+        r"""
+        Store the transition matrix ``mat`` computed at precision ``prec``.
+        """
+        with self._db:
+            self._db.execute("""
+                INSERT OR REPLACE INTO transition_matrices
+                VALUES (?, ?, ?, ?)""",
+                (key, int(prec), self._tick(), dumps(mat)))
+            # Entries at lower precision are now useless
+            self._db.execute("""
+                DELETE FROM transition_matrices
+                WHERE key = ? AND prec < ?""", (key, int(prec)))
+            excess = len(self) - self.max_entries
+            if excess > 0:
+                logger.debug("evicting %s entries", excess)
+                self._db.execute("""
+                    DELETE FROM transition_matrices WHERE rowid IN (
+                        SELECT rowid FROM transition_matrices
+                        ORDER BY atime LIMIT ?)""", (excess,))
+
+    def clear(self):
+        with self._db:
+            self._db.execute("DELETE FROM transition_matrices")
+
+    def close(self):
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = self._pid = None
+
+    def deferred(self):
+        r"""
+        Return a view of this cache that reads from the database but keeps
+        new entries in memory.
+
+        This is meant for worker processes: the new entries, available as a
+        list of ``(key, prec, mat)`` tuples in the ``pending`` attribute of the
+        view, are supposed to be sent back and stored by the parent process
+        using :meth:`set`.
+
+        EXAMPLES::
+
+            sage: from ore_algebra.analytic.disk_cache import TransitionMatrixCache
+            sage: cache = TransitionMatrixCache(tmp_filename(ext=".sqlite"))
+            sage: view = cache.deferred()
+            sage: view.set("key", 10, matrix(QQ, [[1]]))
+            sage: len(cache), view.pending
+            (0, [('key', 10, [1])])
+        """
+        return _DeferredCache(self)
+
+class _DeferredCache:
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.pending = []
+
+    def key(self, dop, step, rows):
+        return self.cache.key(dop, step, rows)
+
+    def get(self, key, prec):
+        return self.cache.get(key, prec)
+
+    def set(self, key, prec, mat):
+        self.pending.append((key, prec, mat))
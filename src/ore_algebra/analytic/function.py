@@ -17,12 +17,14 @@ D-Finite analytic functions
 import collections
 import logging
 
+import numpy
+
 import sage.plot.all as plot
 
 from sage.misc.cachefunc import cached_method
 from sage.plot.plot import generate_plot_points
-from sage.rings.all import ZZ, QQ, RBF, RIF, CIF
-from sage.rings.complex_arb import ComplexBall
+from sage.rings.all import ZZ, QQ, CBF, RBF, RIF, CIF
+from sage.rings.complex_arb import ComplexBall, ComplexBallField
 try:
     from sage.rings.complex_mpfr import ComplexNumber
 except ImportError:
@@ -30,15 +32,15 @@ except ImportError:
 from sage.rings.infinity import AnInfinity
 from sage.rings.real_arb import RealBall, RealBallField
 from sage.rings.real_mpfi import RealIntervalField
-from sage.rings.real_mpfr import RealNumber
+from sage.rings.real_mpfr import RealField, RealNumber
 
 from . import analytic_continuation as ancont
 from . import polynomial_approximation as polapprox
 
 from .analytic_continuation import normalize_post_transform
 from .differential_operator import DifferentialOperator
-from .path import Point
-from .safe_cmp import safe_le, safe_gt, safe_ge, safe_eq
+from .path import Point, QQi
+from .safe_cmp import safe_lt, safe_le, safe_gt, safe_ge, safe_eq
 
 logger = logging.getLogger(__name__)
 
@@ -48,15 +50,21 @@ logger = logging.getLogger(__name__)
     #   polynomial approximations become too large???
     #
     # - Introduce separate "Cache" objects?
+    #
+    # - Evaluate at several points using multipoint evaluation when the batches
+    #   are large compared to the degree of the approximations?
 
 RealPolApprox = collections.namedtuple('RealPolApprox', ['pol', 'prec'])
 
 class DFiniteFunction:
     r"""
     At the moment, this class just provides a simple caching mechanism for
-    repeated evaluations of a D-Finite function on the real line. It may
-    evolve to support evaluations on the complex plane, branch cuts, ring
-    operations on D-Finite functions, and more. Do not expect any API stability.
+    repeated evaluations of a D-Finite function on the complex plane. It may
+    evolve to support branch cuts, ring operations on D-Finite functions, and
+    more. Do not expect any API stability.
+
+    At most ``max_disks`` polynomial approximations are kept, those that were
+    not used for the longest time being discarded first.
 
     TESTS::
 
@@ -70,6 +78,10 @@ class DFiniteFunction:
         sage: f = DFiniteFunction(Dx - 1, [1], max_rad=7/8)
         sage: f._disk(Point(pi, dop=Dx-1))
         (7/2, 0.5000000000000000)
+        sage: f._disk(Point(pi + I, dop=Dx-1))
+        (5/4*i + 13/4, 0.5000000000000000)
+        sage: f._rad(_[0])
+        0.5000000000000000
 
         sage: f = DFiniteFunction(Dx^2 - x,
         ....:         [1/(gamma(2/3)*3^(2/3)), -1/(gamma(1/3)*3^(1/3))],
@@ -126,13 +138,19 @@ class DFiniteFunction:
     #   and/or a vector of initial conditions at its center, which can then be
     #   reused for subsequent evaluations.
     #
+    # - Off the real axis, we use instead the disks of radius 2^k centered at
+    #   the points (m + 1/2 + (m' + 1/2)·i)·2^k, m, m' ∈ ℤ, i.e., the
+    #   circumscribed disks of the squares of side 2^k with vertices on the
+    #   lattice 2^k·ℤ[i]. The center determines k as one plus the 2-adic
+    #   valuation of its real part.
+    #
     # - We may additionally want to allow disks (of any radius?) centered at
     #   real regular singular points, and perhaps, as a special case, at 0.
     #   These would be used when possible, and one would revert to the other
     #   family otherwise.
 
     def __init__(self, dop, ini, name="dfinitefun",
-                 max_prec=256, max_rad=RBF('inf')):
+                 max_prec=256, max_rad=RBF('inf'), max_disks=1024):
         self.dop = dop = DifferentialOperator(dop)
         if not isinstance(ini, dict):
             ini = {0: ini}
@@ -155,9 +173,11 @@ class DFiniteFunction:
             kappa, alpha = dop.growth_parameters()
             self.max_rad = self.max_rad.min(1/(alpha*RBF(kappa)**kappa))
         self.max_prec = max_prec
+        self.max_disks = max_disks
 
         self._inivecs = {}
-        self._polys = {}
+        # least recently used first
+        self._polys = collections.OrderedDict()
 
         self._sollya_object = None
         self._sollya_domain = RIF('-inf', 'inf')
@@ -173,7 +193,8 @@ class DFiniteFunction:
                 for rt, mult in self.dop.leading_coefficient().roots(CIF))
 
     def _disk(self, pt):
-        assert pt.is_real()
+        if not pt.is_real():
+            return self._complex_disk(pt)
         # Since approximation disks satisfy 2·rad ≤ dist(center, sing), any
         # approximation disk containing pt must have rad ≤ dist(pt, sing)
         max_rad = pt.dist_to_sing().min(self.max_rad)
@@ -211,9 +232,90 @@ class DFiniteFunction:
         center = QQ(center)
         return center, rad
 
+    def _complex_disk(self, pt):
+        max_rad = pt.dist_to_sing().min(self.max_rad)
+        expo = ZZ(max_rad.log(2).upper().ceil()) - 1
+        val = pt.iv()
+        while True:
+            side = QQ(2)**expo
+            re = (val.real()/side).floor().lower().floor()
+            im = (val.imag()/side).floor().lower().floor()
+            center = QQi([(re + QQ(1)/2)*side, (im + QQ(1)/2)*side])
+            rad = RBF.one() << expo
+            dist = Point(center, pt.dop).dist_to_sing()
+            if safe_ge(dist >> 1, rad):
+                break
+            expo -= 1
+        logger.debug("disk for %s: center=%s, rad=%s", pt, center, rad)
+        if not safe_le((val - ComplexBallField(val.prec())(center)).abs(), rad):
+            logger.info("check that |%s - %s| < %s failed", val, center, rad)
+            return None, None
+        if not self._same_branch(center, val):
+            logger.info("singular point close to the path to %s via %s",
+                        val, center)
+            return None, None
+        return center, rad
+
+    @cached_method
+    def _singular_points(self):
+        return [CBF(rt) for rt, _
+                in self.dop.leading_coefficient().roots(CIF)]
+
+    def _same_branch(self, center, val):
+        r"""
+        Check that the value at ``val`` (a complex ball) obtained by analytic
+        continuation along the path ``[start, center, val]`` coincides with
+        that obtained along the straight path ``[start, val]``, i.e., that the
+        triangle formed by these three points certainly contains no singular
+        point.
+        """
+        Balls = val.parent()
+        start = Balls(Point(list(self.ini)[0], self.dop).iv())
+        center = Balls(center)
+        zero = RealBallField(Balls.precision()).zero()
+        def cross(u, v):
+            return u.real()*v.imag() - u.imag()*v.real()
+        edges = [(start, center, val), (center, val, start),
+                 (val, start, center)]
+        for sing in self._singular_points():
+            sing = Balls(sing)
+            # sing lies outside the triangle iff it is separated from the
+            # opposite vertex by the line supporting one of the edges
+            if not any(safe_lt(cross(b - a, sing - a)*cross(b - a, c - a),
+                               zero)
+                       for a, b, c in edges):
+                return False
+        return True
+
     def _rad(self, center):
+        if center.parent() is QQi:
+            return RBF.one() << (QQ(center.real()).valuation(2) + 1)
         return RBF.one() << QQ(center).valuation(2)
 
+    def _cached_disk(self, val):
+        r"""
+        Find a disk with a cached polynomial approximation containing the
+        point ``val`` (a complex ball) without computing the distance to the
+        singularities.
+        """
+        is_real = val.imag().is_zero()
+        levels = set(self._rad(c) for c in self._polys
+                     if (c.parent() is QQ) == is_real)
+        for rad in sorted(levels, reverse=True):
+            side = QQ(rad.mid())
+            if is_real:
+                m = (val.real()/(2*side)).floor().lower().floor()
+                center = (2*m + 1)*side
+            else:
+                re = (val.real()/side).floor().lower().floor()
+                im = (val.imag()/side).floor().lower().floor()
+                center = QQi([(re + QQ(1)/2)*side, (im + QQ(1)/2)*side])
+            if (center in self._polys
+                    and safe_le((val - val.parent()(center)).abs(), rad)
+                    and (is_real or self._same_branch(center, val))):
+                return center
+        return None
+
     def _path_to(self, dest, prec=None):
         r"""
         Find a path from a point with known "initial" values to pt
@@ -242,9 +344,14 @@ class DFiniteFunction:
         logger.info("computing new polynomial approximations: "
                     "ini=%s, path=%s, rad=%s, eps=%s, ord=%s",
                     ini, path, rad, eps, derivatives)
+        if center.parent() is QQ:
+            economization = polapprox.chebyshev_economization
+        else:
+            economization = polapprox.taylor_economization
         polys = polapprox.doit(self.dop, ini=ini, path=path, rad=rad,
-                eps=eps, derivatives=derivatives, x_is_real=True,
-                economization=polapprox.chebyshev_economization, ctx=ctx)
+                eps=eps, derivatives=derivatives,
+                x_is_real=(center.parent() is QQ),
+                economization=economization, ctx=ctx)
         logger.info("...done")
         approx = self._polys.get(center, [])
         new_approx = []
@@ -257,6 +364,19 @@ class DFiniteFunction:
         self._polys[center] = new_approx
         return polys
 
+    def _approx_polys(self, center, rad, prec, derivatives):
+        approx = self._polys.get(center, [])
+        # due to the way the polynomials are recomputed, the precisions attached
+        # to the successive derivatives are nonincreasing
+        if (len(approx) < derivatives or approx[derivatives-1].prec < prec):
+            polys = self._update_approx(center, rad, prec, derivatives)
+        else:
+            polys = [a.pol for a in approx]
+        self._polys.move_to_end(center)
+        while len(self._polys) > self.max_disks:
+            self._polys.popitem(last=False)
+        return polys
+
     def _sollya_annotate(self, center, rad, polys):
         import sagesollya as sollya
         logger = logging.getLogger(__name__ + ".sollya")
@@ -285,8 +405,8 @@ class DFiniteFunction:
         post_transform = normalize_post_transform(self.dop, post_transform)
         Balls = iv.parent()
         Ivs = RealIntervalField(Balls.precision())
-        mid = [c for c in self._polys.keys()
-                 if Balls(c).add_error(self._rad(c)).overlaps(iv)]
+        mid = [c for c in self._polys.keys() if c.parent() is QQ
+                 and Balls(c).add_error(self._rad(c)).overlaps(iv)]
         mid.sort()
         rad = [self._rad(c) for c in mid]
         crude_bound = (Balls(AnInfinity()) if self._is_everywhere_defined()
@@ -334,6 +454,26 @@ class DFiniteFunction:
             sage: f.approx(1/3, prec=40, post_transform=Dx^2)
             [-0.540000000000...]
 
+            sage: z = CBF(1/2, 1/3)
+            sage: (f.approx(z) - z.arctan()).abs() < RBF(1e-14)
+            True
+            sage: f.approx(z, post_transform=Dx)
+            [0.8...] + [-0.3...]*I
+            sage: 1/(1 + z^2)
+            [0.8...] + [-0.3...]*I
+
+        Complex points are evaluated on the same branch as by analytic
+        continuation along a straight path from the initial point::
+
+            sage: dop = (x^2 - 3/5*x + 109/100)*Dx^2 + (2*x - 3/5)*Dx
+            sage: f = DFiniteFunction(dop, [0, 1])
+            sage: z = CBF(91/100, 3)
+            sage: f.approx(z).overlaps(dop.numerical_solution([0, 1], [0, z]))
+            True
+            sage: all(f.approx(z).overlaps(dop.numerical_solution([0, 1], [0, z]))
+            ....:     for z in [CBF(a/4, b/4) for a in range(-4, 8)
+            ....:                             for b in range(5, 16)])
+            True
         """
         pt = Point(pt, self.dop)
         if prec is None:
@@ -342,7 +482,7 @@ class DFiniteFunction:
             post_transform = self.dop.parent().one()
         derivatives = min(post_transform.order() + 1, self._max_derivatives)
         post_transform = normalize_post_transform(self.dop, post_transform)
-        if prec >= self.max_prec or not pt.is_real():
+        if prec >= self.max_prec:
             logger.info("performing high-prec evaluation "
                         "(pt=%s, prec=%s, post_transform=%s)",
                         pt, prec, post_transform)
@@ -358,23 +498,269 @@ class DFiniteFunction:
             eps = RBF.one() >> prec
             return self.dop.numerical_solution(ini, path, eps,
                     post_transform=post_transform)
-        approx = self._polys.get(center, [])
-        Balls = RealBallField(prec)
-        # due to the way the polynomials are recomputed, the precisions attached
-        # to the successive derivatives are nonincreasing
-        if (len(approx) < derivatives or approx[derivatives-1].prec < prec):
-            polys = self._update_approx(center, rad, prec, derivatives)
+        polys = self._approx_polys(center, rad, prec, derivatives)
+        if center.parent() is QQ:
+            Balls = RealBallField(prec)
         else:
-            polys = [a.pol for a in approx]
+            Balls = ComplexBallField(prec)
         bpt = Balls(pt.value)
         reduced_pt = bpt - Balls(center)
         val = sum(ZZ(j).factorial()*coeff(bpt)*polys[j](reduced_pt)
                   for j, coeff in enumerate(post_transform))
         return val
 
+    def approx_many(self, points, prec=None, post_transform=None):
+        r"""
+        Evaluate this function (or ``post_transform`` applied to it) at each
+        element of ``points``.
+
+        This is equivalent to ``[self.approx(pt, prec, post_transform) for pt
+        in points]``, but the points are grouped by approximation disk, each
+        polynomial approximation is prepared once for the whole group, and
+        points contained in disks that are already known are located without
+        computing distances to the singular points.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: from ore_algebra.analytic.function import DFiniteFunction
+            sage: DiffOps, x, Dx = DifferentialOperators()
+            sage: f = DFiniteFunction((x^2 + 1)*Dx^2 + 2*x*Dx, [0, 1])
+
+            sage: pts = [k/10 for k in range(-30, 31)]
+            sage: vals = f.approx_many(pts)
+            sage: all((v - RBF(p).arctan()).abs() < RBF(1e-14)
+            ....:     for v, p in zip(vals, pts))
+            True
+            sage: vals[40].parent()
+            Real ball field with 53 bits of precision
+
+            sage: pts = [CBF(a/4, b/4) for a in range(-8, 8) for b in range(1, 4)]
+            sage: vals = f.approx_many(pts, post_transform=Dx)
+            sage: all((v - 1/(1 + p^2)).abs() < RBF(1e-14)
+            ....:     for v, p in zip(vals, pts))
+            True
+
+        The number of cached approximations is bounded::
+
+            sage: f = DFiniteFunction((x^2 + 1)*Dx^2 + 2*x*Dx, [0, 1],
+            ....:                     max_disks=2)
+            sage: _ = f.approx_many([1/2, 3/2, 5/2, 1/2])
+            sage: len(f._polys)
+            2
+        """
+        points = list(points)
+        if prec is None:
+            prec = max((_guess_prec(pt) for pt in points), default=53)
+        if post_transform is None:
+            post_transform = self.dop.parent().one()
+        if prec >= self.max_prec:
+            return [self.approx(pt, prec, post_transform) for pt in points]
+        derivatives = min(post_transform.order() + 1, self._max_derivatives)
+        post_transform = normalize_post_transform(self.dop, post_transform)
+
+        CBFp = ComplexBallField(prec)
+        res = [None]*len(points)
+        groups = collections.defaultdict(list)
+        for i, pt in enumerate(points):
+            try:
+                val = CBFp(pt)
+            except (TypeError, ValueError):
+                val = CBFp(Point(pt, self.dop).iv())
+            center = self._cached_disk(val)
+            if center is None:
+                center, _ = self._disk(Point(pt, self.dop))
+            if center is None:
+                res[i] = self.approx(pt, prec, post_transform)
+            else:
+                groups[center].append((i, val))
+
+        for center, group in groups.items():
+            polys = self._approx_polys(center, self._rad(center), prec,
+                                       derivatives)
+            # Evaluating the approximations as complex arb polynomials uses
+            # rectangular splitting, also for real disks
+            Pols = CBFp['x']
+            fast = [Pols(ZZ(j).factorial()*polys[j])
+                    for j in range(post_transform.order() + 1)]
+            ctr = CBFp(center)
+            real = center.parent() is QQ
+            for i, val in group:
+                reduced = val - ctr
+                y = sum(coeff(val)*fast[j](reduced)
+                        for j, coeff in enumerate(post_transform))
+                res[i] = y.real() if real else y
+        return res
+
+    def fast_float(self, a, b, post_transform=None, prec=64):
+        r"""
+        Return a fast evaluator in double precision of this function (or of
+        ``post_transform`` applied to it) on the real interval ``[a, b]``.
+
+        The evaluator is built from certified polynomial approximations
+        computed at precision ``prec`` on a family of disks covering the
+        interval. It accepts Python floats, for which it returns a float, and
+        NumPy arrays, for which it returns an array of the same shape, with
+        ``nan`` at points outside ``[a, b]``.
+
+        For any double ``x`` in ``[a, b]``, the value computed by the evaluator
+        differs from the exact value at ``x`` by at most its attribute
+        ``error``. This bound accounts for the error of the approximations,
+        for the rounding of their coefficients to doubles, and for the rounding
+        errors in the evaluation by Horner's rule (barring underflow).
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: from ore_algebra.analytic.function import DFiniteFunction
+            sage: DiffOps, x, Dx = DifferentialOperators()
+            sage: f = DFiniteFunction((x^2 + 1)*Dx^2 + 2*x*Dx, [0, 1],
+            ....:                     name='my_atan')
+
+            sage: ff = f.fast_float(-2, 3); ff
+            Fast float evaluator for my_atan on [-2, 3]
+            sage: ff.error < 1e-14
+            True
+            sage: abs(ff(1.) - RR(pi/4)) < 1e-15
+            True
+
+            sage: import numpy
+            sage: xs = numpy.linspace(-2, 3, 1001)
+            sage: ys = ff(xs); type(ys), ys.shape
+            (<class 'numpy.ndarray'>, (1001,))
+            sage: numpy.max(numpy.abs(ys - numpy.arctan(xs))) < ff.error + 1e-15
+            True
+            sage: numpy.isnan(ff(numpy.array([4., 0.])))
+            array([ True, False])
+            sage: ff(4.)
+            Traceback (most recent call last):
+            ...
+            ValueError: 4.0 is outside [-2, 3]
+
+            sage: dff = f.fast_float(0, 1, post_transform=Dx)
+            sage: abs(dff(0.5) - 0.8) < 1e-14
+            True
+
+            sage: from scipy.integrate import quad
+            sage: abs(quad(ff, 0, 1)[0] - RR(pi/4 - log(2)/2)) < 1e-12
+            True
+
+        TESTS::
+
+            sage: f.fast_float(1, 0)
+            Traceback (most recent call last):
+            ...
+            ValueError: empty interval
+            sage: DFiniteFunction((x - 1/2)*Dx - 1, [1]).fast_float(-1, 1)
+            Traceback (most recent call last):
+            ...
+            ValueError: singular point in [-1, 1]
+            sage: f.fast_float(0, 1, post_transform=Dx^2)
+            Traceback (most recent call last):
+            ...
+            ValueError: post_transform must reduce to an operator with polynomial...
+        """
+        a, b = QQ(a), QQ(b)
+        if not a < b:
+            raise ValueError("empty interval")
+        dom = RIF(a, b)
+        if any(rt.imag().contains_zero() and rt.real().overlaps(dom)
+               for rt, _ in self.dop.leading_coefficient().roots(CIF)):
+            raise ValueError(f"singular point in [{a}, {b}]")
+        if post_transform is None:
+            post_transform = self.dop.parent().one()
+        derivatives = min(post_transform.order() + 1, self._max_derivatives)
+        post_transform = normalize_post_transform(self.dop, post_transform)
+        Pol = self.dop.base_ring()
+        try:
+            post_coeffs = [Pol(coeff) for coeff in post_transform]
+        except (TypeError, ValueError):
+            raise ValueError("post_transform must reduce to an operator with "
+                             "polynomial coefficients modulo the equation")
+
+        Balls = RealBallField(prec)
+        Pols = Balls['t']
+        t = Pols.gen()
+        u = Balls.one() >> 53
+
+        starts, centers, coeffs, errors = [], [], [], []
+        x = a
+        while x < b:
+            center, rad = self._disk(Point(x, self.dop))
+            if center is None:
+                raise ValueError(f"unable to cover [{a}, {b}] by disks")
+            polys = self._approx_polys(center, rad, prec, derivatives)
+            pol = sum(ZZ(j).factorial()*coeff(t + center)*Pols(polys[j].list())
+                      for j, coeff in enumerate(post_coeffs))
+            dbl = [float(c.mid()) for c in pol] or [0.]
+            # Bound the error on t = x - center computed in double precision,
+            # the evaluation error, and the approximation error
+            fcenter = float(center)
+            delta = (Balls(center) - Balls(fcenter)).abs()
+            rad = Balls(rad)
+            dt = delta + u*(rad + delta)
+            radt = rad + dt
+            n = len(dbl)
+            gamma = 2*n*u/(1 - 2*n*u)
+            err = sum((((c - Balls(d)).abs() + gamma*Balls(abs(d)))*radt**k
+                       + k*Balls(abs(d))*radt**(k-1)*dt
+                       for k, (c, d) in enumerate(zip(pol, dbl))),
+                      Balls.zero())
+            starts.append(max(a, center - QQ(rad.mid())))
+            centers.append(fcenter)
+            coeffs.append(dbl)
+            errors.append(err.upper())
+            x = center + QQ(rad.mid())
+        return FastFloatEvaluator(self.name, a, b, starts, centers, coeffs,
+                                  errors)
+
     def __call__(self, x, prec=None):
         return self.approx(x, prec=prec)
 
+class FastFloatEvaluator:
+    r"""
+    Evaluator in double precision produced by
+    :meth:`DFiniteFunction.fast_float`.
+
+    The attribute ``error`` is a bound on the absolute error of the evaluator
+    on its whole domain, ``errors`` contains a bound for each of the
+    polynomial approximations.
+    """
+
+    def __init__(self, name, a, b, starts, centers, coeffs, errors):
+        self.name = name
+        self.a, self.b = a, b
+        Up = RealField(53, rnd='RNDU')
+        self.errors = [float(Up(e)) for e in errors]
+        self.error = max(self.errors)
+        self._a, self._b = float(a), float(b)
+        self._starts = numpy.array([float(s) for s in starts])
+        self._centers = numpy.array(centers)
+        deg = max(len(c) for c in coeffs)
+        self._coeffs = numpy.zeros((len(coeffs), deg))
+        for i, c in enumerate(coeffs):
+            self._coeffs[i, :len(c)] = c
+
+    def __repr__(self):
+        return f"Fast float evaluator for {self.name} on [{self.a}, {self.b}]"
+
+    def __call__(self, x):
+        scalar = numpy.ndim(x) == 0
+        x = numpy.asarray(x, dtype=float)
+        inside = (x >= self._a) & (x <= self._b)
+        if scalar and not inside:
+            raise ValueError(f"{x} is outside [{self.a}, {self.b}]")
+        idx = numpy.searchsorted(self._starts, x, side="right") - 1
+        idx = numpy.clip(idx, 0, len(self._starts) - 1)
+        t = x - self._centers[idx]
+        coeffs = self._coeffs[idx]
+        y = coeffs[..., -1]
+        for k in range(self._coeffs.shape[1] - 2, -1, -1):
+            y = y*t + coeffs[..., k]
+        if scalar:
+            return float(y)
+        return numpy.where(inside, y, numpy.nan)
+
     def plot(self, x_range, **options):
         r"""
         Plot this function.
@@ -422,6 +808,8 @@ class DFiniteFunction:
         """
         g = plot.Graphics()
         for center, polys in self._polys.items():
+            if center.parent() is not QQ:
+                continue
             center, rad = self._disk(Point(center, self.dop))
             x_range = (center - rad).mid(), (center + rad).mid()
             for i, a in enumerate(polys):
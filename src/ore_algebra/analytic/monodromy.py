@@ -28,6 +28,7 @@ in the handling of algebraic numbers in the binary splitting code::
 # http://www.gnu.org/licenses/
 
 import collections
+import copy
 import logging
 
 import sage.matrix.special as matrix
@@ -36,6 +37,7 @@ from sage.graphs.graph import Graph
 from sage.matrix.matrix_complex_ball_dense import Matrix_complex_ball_dense
 from sage.misc.cachefunc import cached_method
 from sage.misc.misc_c import prod
+from sage.parallel.decorate import parallel
 from sage.rings.all import (CC, CBF, ComplexBallField, QQ, QQbar,
         QuadraticField, RBF)
 from sage.symbolic.all import pi, SR
@@ -247,6 +249,9 @@ def _local_monodromy_loop(x, eps, ctx, effort=3):
         [-1.0907799857818368151501817928994979524542825249884040984277371301954332475924993671608411858764307809823591665306474900630885106316087831863249971763581367813...e+1158 +/- ...]*I
     """
     polygon = path.polygon_around(x)
+    return polygon, _loop_transition_matrices(x, polygon, eps, ctx, effort)
+
+def _loop_transition_matrices(x, polygon, eps, ctx, effort=3):
     n = len(polygon)
     mats = []
     for i in range(n):
@@ -265,7 +270,7 @@ def _local_monodromy_loop(x, eps, ctx, effort=3):
             eps /= (1 << (prec - accuracy))
             logger.debug("decreasing eps to %s...", eps)
         mats.append(mat)
-    return polygon, mats
+    return mats
 
 class TodoItem:
 
@@ -323,13 +328,9 @@ def _closest_unsafe(lst, x):
     x = CC(x.alg)
     return min(enumerate(lst), key=lambda y: abs(CC(y[1].value) - x))
 
-def _extend_path_mat(dop, path_mat, inv_path_mat, x, y, eps, matprod, ctx):
-    anchor_index_x, anchor_x = _closest_unsafe(x.polygon, y)
-    anchor_index_y, anchor_y = _closest_unsafe(y.polygon, x)
-    bypass_mat_x = matprod(x.local_monodromy[:anchor_index_x])
-    bypass_mat_y = matprod(y.local_monodromy[anchor_index_y:]
-                           if anchor_index_y > 0
-                           else [])
+def _edge_transition_matrices(dop, x, y, eps, ctx):
+    _, anchor_x = _closest_unsafe(x.polygon, y)
+    _, anchor_y = _closest_unsafe(y.polygon, x)
     if anchor_y.is_singular():
         # Avoid computing inverses of inverses
         path = [anchor_y, anchor_x]
@@ -343,6 +344,19 @@ def _extend_path_mat(dop, path_mat, inv_path_mat, x, y, eps, matprod, ctx):
     inv_edge_mat = invmat(edge_mat)
     if invert:
         edge_mat, inv_edge_mat = inv_edge_mat, edge_mat
+    return edge_mat, inv_edge_mat
+
+def _extend_path_mat(dop, path_mat, inv_path_mat, x, y, eps, matprod, ctx,
+                     edge_mats=None):
+    anchor_index_x, _ = _closest_unsafe(x.polygon, y)
+    anchor_index_y, _ = _closest_unsafe(y.polygon, x)
+    bypass_mat_x = matprod(x.local_monodromy[:anchor_index_x])
+    bypass_mat_y = matprod(y.local_monodromy[anchor_index_y:]
+                           if anchor_index_y > 0
+                           else [])
+    if edge_mats is None:
+        edge_mats = _edge_transition_matrices(dop, x, y, eps, ctx)
+    edge_mat, inv_edge_mat = edge_mats
     ext_mat = bypass_mat_y*edge_mat*bypass_mat_x
     inv_ext_mat = invmat(bypass_mat_x)*inv_edge_mat*invmat(bypass_mat_y)
     new_path_mat = ext_mat*path_mat
@@ -350,6 +364,78 @@ def _extend_path_mat(dop, path_mat, inv_path_mat, x, y, eps, matprod, ctx):
     assert isinstance(new_path_mat, Matrix_complex_ball_dense)
     return new_path_mat, new_inv_path_mat
 
+def _parallel_transition_matrices(dop, base, tree, eps, ctx):
+    r"""
+    Compute in parallel the local monodromy loops still missing at the
+    vertices of ``tree`` and the transition matrices attached to its edges.
+
+    The loops are stored in the vertices. Return a dictionary mapping each edge
+    ``(x, y)``, oriented away from ``base``, to the pair of the transition
+    matrix from ``x`` to ``y`` and its inverse.
+    """
+    edges = []
+    seen = {base}
+    stack = [base]
+    while stack:
+        x = stack.pop()
+        for y in tree.neighbors(x):
+            if y not in seen:
+                seen.add(y)
+                edges.append((x, y))
+                stack.append(y)
+    # The polygons are cheap to compute and needed by both kinds of tasks;
+    # computing them here ensures that all workers agree on the anchors.
+    loops = [y for _, y in edges if y.local_monodromy is None]
+    for y in loops:
+        y.polygon = path.polygon_around(y.point())
+    tasks = ([("loop", i) for i in range(len(loops))]
+             + [("edge", i) for i in range(len(edges))])
+    ncpus = min(ctx.ncpus, len(tasks))
+    # Avoid forking again when summing series in the worker processes
+    wctx = copy.copy(ctx)
+    wctx.ncpus = 1
+    cache = ctx.transition_matrix_cache
+
+    @parallel(ncpus=ncpus)
+    def forked_task(kind, i):
+        # The workers only read from the persistent cache, the matrices they
+        # compute are stored by the parent process.
+        if cache is not None:
+            wctx.transition_matrix_cache = cache.deferred()
+        try:
+            if kind == "loop":
+                y = loops[i]
+                res = _loop_transition_matrices(y.point(), y.polygon, eps,
+                                                wctx)
+            else:
+                x, y = edges[i]
+                res = _edge_transition_matrices(dop, x, y, eps, wctx)
+        except Exception as exn: # pylint: disable=broad-except
+            return exn
+        pending = ([] if cache is None
+                   else wctx.transition_matrix_cache.pending)
+        return res, pending
+
+    logger.info("computing %s local loops and %s edges using %s processes",
+                len(loops), len(edges), ncpus)
+    edge_mats = {}
+    pending = []
+    for ((kind, i), _), res in forked_task(tasks):
+        if isinstance(res, Exception):
+            raise res
+        if not isinstance(res, tuple):
+            # @parallel returns 'NO DATA' when the worker process died
+            raise RuntimeError(f"worker process failed on {kind} {i}: {res!r}")
+        res, new_entries = res
+        pending.extend(new_entries)
+        if kind == "loop":
+            loops[i].local_monodromy = res
+        else:
+            edge_mats[edges[i]] = res
+    for key, prec, mat in pending:
+        cache.set(key, prec, mat)
+    return edge_mats
+
 LocalMonodromyData = collections.namedtuple("LocalMonodromyData",
         ["point", "monodromy", "is_scalar"])
 
@@ -515,6 +601,13 @@ def _monodromy_matrices(dop, base, eps=1e-16, sing=None, **kwds):
 
     tree = _spanning_tree(base, todo.values())
 
+    # In parallel mode, compute all the expensive transition matrices upfront;
+    # the traversal below then only assembles them, in the same order as in
+    # the sequential case.
+    edge_mats = {}
+    if ctx.ncpus > 1 and tree.num_verts() > 1:
+        edge_mats = _parallel_transition_matrices(dop, base, tree, eps, ctx)
+
     def dfs(x, path, path_mat, inv_path_mat):
 
         logger.info("Computing local monodromy around %s via %s", x, path)
@@ -540,7 +633,8 @@ def _monodromy_matrices(dop, base, eps=1e-16, sing=None, **kwds):
                 y.polygon, y.local_monodromy = _local_monodromy_loop(y.point(),
                                                                      eps, ctx)
             new_path_mat, new_inv_path_mat = _extend_path_mat(dop, path_mat,
-                                          inv_path_mat, x, y, eps, matprod, ctx)
+                                          inv_path_mat, x, y, eps, matprod, ctx,
+                                          edge_mats.get((x, y)))
             yield from dfs(y, path + [y], new_path_mat, new_inv_path_mat)
 
     yield from dfs(base, [base], id_mat, id_mat)
@@ -558,6 +652,14 @@ def monodromy_matrices(dop, base, eps=1e-16, sing=None, **kwds):
     - ``sing`` (optional) - list of singularities to consider ; each entry must
       coerce into ``QQbar``. By default, all except maybe some apparent ones,
       i.e., compute generators of the monodromy group.
+    - ``ncpus`` (optional) - maximum number of processes to use; when greater
+      than one, the local monodromy loops around irregular singular points and
+      the transition matrices between neighbouring singular points are
+      computed in parallel before being assembled. The output does not depend
+      on ``ncpus``.
+
+    Other keyword arguments are passed to
+    :class:`~ore_algebra.analytic.context.Context`.
 
     OUTPUT:
 
@@ -634,6 +736,18 @@ def monodromy_matrices(dop, base, eps=1e-16, sing=None, **kwds):
         [-9.310...] + [+/- ...]*I
         sage: mon[1].trace()
         [4.000...] + [+/- ...]*I
+
+    The computation of the transition matrices can be distributed over several
+    processes::
+
+        sage: dop = (x^2 + 1)*Dx^2 + 2*x*Dx
+        sage: mon2 = monodromy_matrices(dop, 1/2, ncpus=2)
+        sage: mon1 = monodromy_matrices(dop, 1/2)
+        sage: all(m1.overlaps(m2) for m1, m2 in zip(mon1, mon2))
+        True
+        sage: mon2 = monodromy_matrices(fcc.dop5, 0, sing=[0, 1], ncpus=2)
+        sage: mon2[1].trace()
+        [4.000...] + [+/- ...]*I
     """
     it = _monodromy_matrices(dop, base, eps, sing, **kwds)
     return [mat for _, mat, _ in it]
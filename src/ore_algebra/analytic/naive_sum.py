@@ -133,7 +133,7 @@ from sage.rings.polynomial import polynomial_element
 from sage.rings.real_arb import RealBallField, RBF
 from sage.structure.sequence import Sequence
 
-from . import accuracy, bounds, utilities
+from . import accuracy, bounds, profiling, utilities
 from .context import Context, dctx
 from .differential_operator import DifferentialOperator
 from .local_solutions import (bw_shift_rec, LogSeriesInitialValues,
@@ -687,8 +687,11 @@ class RecUnroller_tail_bound(RecUnroller):
             # |ind(n)| = cst·|monic_ind(n)|
             self.rnd_maj *= abs(self.ctx.IC(maj.dop.leading_coefficient()[0]))
 
+        rec = profiling.recorder(self.ctx)
+
         for attempt in count(1):
             logger.debug("attempt #%d (of max %d)", attempt, effort)
+            rec.note(prec=bit_prec)
 
             ini_are_accurate = 2*input_accuracy > bit_prec
             # Strictly decrease eps every time to avoid situations where doit
@@ -718,6 +721,7 @@ class RecUnroller_tail_bound(RecUnroller):
             if attempt <= effort and bit_prec < max_prec:
                 logger.info("lost too much precision, restarting with %d bits",
                             bit_prec)
+                rec.count("restarts")
                 continue
             if fail_fast:
                 raise accuracy.PrecisionError
@@ -1042,7 +1046,8 @@ class HighestSolMapper_tail_bound(HighestSolMapper):
         self.effort = effort
 
     def do_sum(self, inis):
-        maj = bounds.DiffOpBound(self.dop, self.leftmost,
+        with profiling.recorder(self.ctx).timer("bounds"):
+            maj = bounds.DiffOpBound(self.dop, self.leftmost,
                         special_shifts=(None if self.ordinary else self.shifts),
                         bound_inverse="solve",
                         pol_part_len=(4 if self.ordinary else None),
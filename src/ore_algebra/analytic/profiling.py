@@ -0,0 +1,269 @@
+# vim: tw=80
+r"""
+Profiling of analytic continuation
+
+A :class:`ProfilingRecorder` collects structured timing and accuracy data on
+the steps of analytic continuation. Pass it to the analytic continuation code
+using the ``recorder`` option.
+
+For each call to the transition matrix computation of a step (or of a group of
+steps with a common starting point), the recorder stores a dictionary with the
+following entries:
+
+- ``index`` -- position of the record in the order of creation;
+- ``step`` -- string representation of the step(s);
+- ``depth`` -- number of times the original step has been split;
+- ``tgt_prec`` -- target precision in bits;
+- ``algorithm`` -- comma-separated list of the summation algorithms used
+  (``naive``, ``dac``, ``binsplit``), in the order they were tried;
+- ``prec`` -- largest working precision used by the summation algorithms;
+- ``nterms`` -- largest number of terms summed;
+- ``restarts`` -- number of restarts of the summation at a higher working
+  precision;
+- ``fallbacks`` -- number of switches to another summation algorithm;
+- ``bit_burst`` -- number of bit-burst subdivisions;
+- ``status`` -- ``"ok"``, ``"cached"`` (matrix found in the
+  ``transition_matrix_cache``) or ``"split"`` (the computation failed and the
+  step was split, the substeps having their own records);
+- ``time_bounds``, ``time_sum``, ``time_matmul`` -- wall-clock time (in
+  seconds) spent computing error bounds (including the construction of
+  :class:`~ore_algebra.analytic.bounds.DiffOpBound` objects), summing series
+  (excluding the computation of bounds), and multiplying or inverting
+  matrices;
+- ``time`` -- total wall-clock time of the computation.
+
+The times in the ``time_*`` columns are exclusive, while ``time`` includes
+the time spent in the records of substeps. Time spent outside of any step (such
+as products of transition matrices along the path) is accumulated in
+:attr:`ProfilingRecorder.unattributed`. When solutions are summed in parallel
+(``ncpus > 1``), the bounds computed in worker processes count as summation
+time.
+
+EXAMPLES::
+
+    sage: from ore_algebra import DifferentialOperators
+    sage: from ore_algebra.analytic.profiling import ProfilingRecorder
+    sage: Dops, x, Dx = DifferentialOperators()
+    sage: dop = (x^2 + 1)*Dx^2 + 2*x*Dx
+
+    sage: rec = ProfilingRecorder()
+    sage: mat = dop.numerical_transition_matrix([0, 1/2, 1], 1e-100,
+    ....:                                       recorder=rec)
+    sage: len(rec.records()) >= 2
+    True
+    sage: r = rec.records()[0]
+    sage: r['algorithm'] in ['naive', 'dac', 'binsplit'], r['status']
+    (True, 'ok')
+    sage: r['tgt_prec'] >= 330, r['prec'] >= r['tgt_prec'], r['nterms'] > 0
+    (True, True, True)
+    sage: r['time'] >= r['time_sum']
+    True
+
+The records can be exported in JSON format, or converted to a pandas data
+frame using ``pandas.DataFrame(rec.records())``::
+
+    sage: import json
+    sage: json.loads(rec.to_json())[0]['step'] == r['step']
+    True
+    sage: sorted(rec.summary())
+    ['restarts', 'steps', 'time_bounds', 'time_matmul', 'time_sum']
+"""
+
+# Distributed under the terms of the GNU General Public License (GPL) either
+# version 2, or (at your option) any later version
+#
+# http://www.gnu.org/licenses/
+
+import json
+import time
+
+from contextlib import contextmanager
+
+CATEGORIES = ("bounds", "sum", "matmul")
+
+class ProfilingRecorder:
+    r"""
+    Recorder of per-step profiling data.
+
+    See :mod:`ore_algebra.analytic.profiling`.
+
+    Besides the profiling data, the analytic continuation code stores the
+    subdivided integration path in the ``path`` attribute.
+    """
+
+    def __init__(self):
+        self.path = None
+        self._records = []
+        self._open = []     # stack of records under construction
+        self._clocks = []   # stack of [record, category, start] lists
+        self.unattributed = {cat: 0. for cat in CATEGORIES}
+
+    def __repr__(self):
+        return "Profiling recorder ({} records)".format(len(self._records))
+
+    @contextmanager
+    def step(self, steps, tgt_prec, depth=0):
+        r"""
+        Context manager delimiting the computation of the transition matrices
+        associated to ``steps``.
+        """
+        rec = {
+            "index": len(self._records),
+            "step": ", ".join(str(s) for s in steps),
+            "depth": int(depth),
+            "tgt_prec": int(tgt_prec),
+            "algorithm": "",
+            "prec": 0,
+            "nterms": 0,
+            "restarts": 0,
+            "fallbacks": 0,
+            "bit_burst": 0,
+            "status": "ok",
+        }
+        for cat in CATEGORIES:
+            rec["time_" + cat] = 0.
+        rec["time"] = 0.
+        self._records.append(rec)
+        self._open.append(rec)
+        start = time.perf_counter()
+        try:
+            yield rec
+        finally:
+            rec["time"] = time.perf_counter() - start
+            self._open.pop()
+
+    @contextmanager
+    def timer(self, category):
+        r"""
+        Context manager accounting the time spent in the block to
+        ``category`` (one of ``"bounds"``, ``"sum"``, ``"matmul"``) for the
+        current step.
+
+        The clock of the enclosing timer, if any, is stopped meanwhile.
+        """
+        now = time.perf_counter()
+        if self._clocks:
+            self._stop_clock(self._clocks[-1], now)
+        rec = self._open[-1] if self._open else None
+        self._clocks.append([rec, category, now])
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            self._stop_clock(self._clocks.pop(), now)
+            if self._clocks:
+                self._clocks[-1][2] = now
+
+    def _stop_clock(self, clock, now):
+        rec, category, start = clock
+        if rec is None:
+            self.unattributed[category] += now - start
+        else:
+            rec["time_" + category] += now - start
+
+    def _current(self):
+        return self._open[-1] if self._open else {}
+
+    def algorithm(self, name):
+        r"""
+        Record that the summation algorithm ``name`` is used for the current
+        step.
+        """
+        rec = self._current()
+        if rec:
+            rec["algorithm"] += ("," if rec["algorithm"] else "") + name
+
+    def note(self, *, prec=None, nterms=None):
+        r"""
+        Record a working precision and/or a number of terms for the current
+        step, only keeping the largest values.
+        """
+        rec = self._current()
+        if not rec:
+            return
+        if prec is not None:
+            rec["prec"] = max(rec["prec"], int(prec))
+        if nterms is not None:
+            rec["nterms"] = max(rec["nterms"], int(nterms))
+
+    def count(self, what):
+        r"""
+        Increment the counter ``what`` (``"restarts"``, ``"fallbacks"`` or
+        ``"bit_burst"``) of the current step.
+        """
+        rec = self._current()
+        if rec:
+            rec[what] += 1
+
+    def status(self, status):
+        r"""
+        Set the status of the current step.
+        """
+        rec = self._current()
+        if rec:
+            rec["status"] = status
+
+    def records(self):
+        r"""
+        Return the list of records, as dictionaries with the same keys.
+
+        The output is suitable for building a ``pandas.DataFrame``.
+        """
+        return [dict(rec) for rec in self._records]
+
+    def to_json(self, fp=None, **kwds):
+        r"""
+        Export the records in JSON format.
+
+        Write them to the file object ``fp`` if specified, otherwise return
+        them as a string. Additional keyword arguments are passed to
+        :func:`json.dump`.
+        """
+        if fp is None:
+            return json.dumps(self.records(), **kwds)
+        json.dump(self.records(), fp, **kwds)
+
+    def summary(self):
+        r"""
+        Return the number of records, the total number of restarts, and the
+        total time spent in each category (including unattributed time).
+        """
+        res = {"steps": len(self._records),
+               "restarts": sum(rec["restarts"] for rec in self._records)}
+        for cat in CATEGORIES:
+            res["time_" + cat] = (self.unattributed[cat]
+                                  + sum(rec["time_" + cat]
+                                        for rec in self._records))
+        return res
+
+class _NullRecorder:
+
+    @contextmanager
+    def step(self, steps, tgt_prec, depth=0):
+        yield None
+
+    @contextmanager
+    def timer(self, category):
+        yield
+
+    def algorithm(self, name):
+        pass
+
+    def note(self, *, prec=None, nterms=None):
+        pass
+
+    def count(self, what):
+        pass
+
+    def status(self, status):
+        pass
+
+_null_recorder = _NullRecorder()
+
+def recorder(ctx):
+    r"""
+    Return the profiling recorder of the context ``ctx``, or a recorder that
+    ignores all data if ``ctx.recorder`` is not a :class:`ProfilingRecorder`.
+    """
+    rec = ctx.recorder
+    return rec if isinstance(rec, ProfilingRecorder) else _null_recorder
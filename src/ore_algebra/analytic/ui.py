@@ -49,6 +49,34 @@ def transition_matrices(dop, path, eps=1e-16):
     sol = ancont.analytic_continuation(dop, path, eps, ctx)
     return [(s["point"], s["value"]) for s in sol]
 
+def transition_matrices_from(dop, base, targets, eps=1e-16):
+    r"""
+    Compute the transition matrices from a common base point to several
+    targets.
+
+    Unlike :func:`transition_matrices`, this does not follow a single path
+    through all the points, but shares the work between the paths from
+    ``base`` to each target as far as possible. In particular, all targets
+    lying in the same disk of convergence are handled using a single
+    summation of each local expansion.
+
+    EXAMPLES::
+
+        sage: from ore_algebra.analytic.ui import *
+        sage: Dops, x, Dx = DifferentialOperators()
+
+        sage: tms = transition_matrices_from(Dx - 1, 0, [i/5 for i in range(6)], 1e-10)
+        sage: tms[-1]
+        (1, [[2.718281828...]])
+        sage: tms[2]
+        (2/5, [[1.491824697...]])
+    """
+    from .differential_operator import DifferentialOperator
+    dop = DifferentialOperator(dop)
+    ctx = ancont.Context()
+    mats = ancont.batch_transition_matrices(dop, base, targets, eps, ctx)
+    return list(zip(targets, mats))
+
 def _value_from_mat(mat):
     if mat.nrows():
         return mat[0][0]
@@ -0,0 +1,165 @@
+# vim: tw=80
+r"""
+Benchmarks
+
+This package provides a small, reproducible benchmark suite for ore_algebra.
+The benchmarks are based on operators from :mod:`ore_algebra.examples` and
+:mod:`ore_algebra.analytic.examples` and cover guessing, the nullspace solvers,
+lclm and symmetric products, numerical transition matrices at several
+precisions and with each summation algorithm, monodromy matrices, and
+coefficient bounds.
+
+The suite can be run from the command line using::
+
+    sage -python -m ore_algebra.benchmarks --output timings.json
+
+and a later run can be compared against the stored timings using::
+
+    sage -python -m ore_algebra.benchmarks --baseline timings.json
+
+See ``sage -python -m ore_algebra.benchmarks --help`` for more options.
+
+From Sage::
+
+    sage: from ore_algebra import benchmarks
+    sage: res = benchmarks.run(pattern="nullspace.gauss", repeat=1)
+    sage: [r["name"] for r in res]
+    ['nullspace.gauss']
+    sage: benchmarks.compare(res, res)
+    []
+
+Each benchmark consists of a setup phase, which is not timed, and of a function
+which is timed ``repeat`` times. The random seed is reset before the setup
+phase, so that all runs solve the same problems.
+"""
+
+# Distributed under the terms of the GNU General Public License (GPL) either
+# version 2, or (at your option) any later version
+#
+# http://www.gnu.org/licenses/
+
+import collections
+import fnmatch
+import json
+import platform
+import time
+
+from datetime import datetime
+
+Benchmark = collections.namedtuple("Benchmark", ["name", "group", "setup"])
+
+_registry = collections.OrderedDict()
+
+def benchmark(group, name=None):
+    r"""
+    Decorator registering a benchmark.
+
+    The decorated function performs the setup of the benchmark and returns a
+    function without arguments that runs the computation to be timed. The name
+    of the benchmark is ``group.name``, where ``name`` defaults to the name of
+    the decorated function.
+    """
+    def decorator(setup):
+        full_name = group + "." + (name or setup.__name__)
+        if full_name in _registry:
+            raise ValueError("duplicate benchmark: " + full_name)
+        _registry[full_name] = Benchmark(full_name, group, setup)
+        return setup
+    return decorator
+
+def all_benchmarks():
+    r"""
+    Return the list of registered benchmarks.
+
+    EXAMPLES::
+
+        sage: from ore_algebra.benchmarks import all_benchmarks
+        sage: len(all_benchmarks()) > 10
+        True
+        sage: 'summation.dac' in [b.name for b in all_benchmarks()]
+        True
+    """
+    from . import suite # registers the benchmarks
+    return list(_registry.values())
+
+def select(groups=None, pattern=None):
+    r"""
+    Return the benchmarks belonging to one of ``groups`` (all if ``None``)
+    whose name matches the shell-style ``pattern`` (all if ``None``).
+    """
+    return [b for b in all_benchmarks()
+            if (groups is None or b.group in groups)
+            and (pattern is None or fnmatch.fnmatchcase(b.name, pattern))]
+
+def run_benchmark(bench, repeat=3):
+    r"""
+    Run a single benchmark and return the results as a dictionary.
+    """
+    from sage.misc.randstate import set_random_seed
+    set_random_seed(0)
+    fun = bench.setup()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fun()
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return {
+        "name": bench.name,
+        "group": bench.group,
+        "repeat": repeat,
+        "min": times[0],
+        "median": times[len(times)//2],
+        "times": times,
+    }
+
+def run(groups=None, pattern=None, repeat=3, verbose=False):
+    r"""
+    Run the selected benchmarks (see :func:`select`) and return the list of
+    results.
+    """
+    res = []
+    for bench in select(groups, pattern):
+        if verbose:
+            print(bench.name, end=" ", flush=True)
+        res.append(run_benchmark(bench, repeat))
+        if verbose:
+            print("{:.3f} s".format(res[-1]["min"]))
+    return res
+
+def metadata():
+    r"""
+    Information on the environment in which benchmarks are run.
+    """
+    from sage.version import version
+    return {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "sage": version,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "node": platform.node(),
+    }
+
+def dump(results, fp):
+    r"""
+    Write ``results`` to the file object ``fp`` in JSON format.
+    """
+    json.dump({"metadata": metadata(), "results": results}, fp, indent=2)
+
+def load(fp):
+    r"""
+    Read results written by :func:`dump` from the file object ``fp``.
+    """
+    return json.load(fp)["results"]
+
+def compare(results, baseline, tolerance=0.25):
+    r"""
+    Compare ``results`` against ``baseline``.
+
+    Return the list of tuples ``(name, old, new)`` for the benchmarks whose
+    minimal running time increased by more than a factor ``1 + tolerance``.
+    Benchmarks absent from the baseline are ignored.
+    """
+    old = {r["name"]: r["min"] for r in baseline}
+    return [(r["name"], old[r["name"]], r["min"]) for r in results
+            if r["name"] in old and r["min"] > (1 + tolerance)*old[r["name"]]]
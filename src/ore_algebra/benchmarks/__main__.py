@@ -0,0 +1,69 @@
+# vim: tw=80
+r"""
+Command line interface to the benchmark suite
+
+Run ``sage -python -m ore_algebra.benchmarks --help`` for usage information.
+"""
+
+# Distributed under the terms of the GNU General Public License (GPL) either
+# version 2, or (at your option) any later version
+#
+# http://www.gnu.org/licenses/
+
+import argparse
+import sys
+
+import sage.all # initialize Sage when run as a script
+
+from . import compare, dump, load, run, select
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m ore_algebra.benchmarks",
+            description="Run the ore_algebra benchmark suite.")
+    parser.add_argument("--list", action="store_true",
+            help="list the available benchmarks and exit")
+    parser.add_argument("-g", "--group", action="append",
+            help="only run the benchmarks of this group (can be repeated)")
+    parser.add_argument("-k", "--pattern",
+            help="only run the benchmarks whose name matches this shell-style "
+                 "pattern")
+    parser.add_argument("-r", "--repeat", type=int, default=3,
+            help="number of timed runs of each benchmark (default: 3)")
+    parser.add_argument("-o", "--output",
+            help="write the results to this file in JSON format ('-' for "
+                 "standard output)")
+    parser.add_argument("-b", "--baseline",
+            help="compare the results against those stored in this file")
+    parser.add_argument("-t", "--tolerance", type=float, default=0.25,
+            help="relative slowdown with respect to the baseline reported as "
+                 "a regression (default: 0.25)")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for bench in select(args.group, args.pattern):
+            print(bench.name)
+        return 0
+
+    results = run(args.group, args.pattern, args.repeat,
+                  verbose=(args.output != "-"))
+
+    if args.output == "-":
+        dump(results, sys.stdout)
+    elif args.output is not None:
+        with open(args.output, "w") as fp:
+            dump(results, fp)
+
+    if args.baseline is not None:
+        with open(args.baseline) as fp:
+            baseline = load(fp)
+        regressions = compare(results, baseline, args.tolerance)
+        for name, old, new in regressions:
+            print("regression: {}: {:.3f} s -> {:.3f} s".format(name, old, new),
+                  file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
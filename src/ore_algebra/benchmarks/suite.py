@@ -0,0 +1,150 @@
+# vim: tw=80
+r"""
+Definitions of the benchmarks run by :mod:`ore_algebra.benchmarks`
+
+Each function below prepares the data of a benchmark and returns the function
+to be timed.
+"""
+
+# Distributed under the terms of the GNU General Public License (GPL) either
+# version 2, or (at your option) any later version
+#
+# http://www.gnu.org/licenses/
+
+from sage.arith.misc import binomial
+from sage.combinat.combinat import fibonacci
+from sage.matrix.matrix_space import MatrixSpace
+from sage.rings.finite_rings.finite_field_constructor import GF
+from sage.rings.integer_ring import ZZ
+from sage.rings.polynomial.polynomial_ring_constructor import PolynomialRing
+from sage.rings.rational_field import QQ
+
+from . import benchmark
+
+### Guessing
+
+@benchmark("guessing")
+def guess_rec():
+    from .. import OreAlgebra, guess
+    data = [binomial(2*n, n)*fibonacci(n)**3 for n in range(300)]
+    A = OreAlgebra(ZZ['n'], 'Sn')
+    return lambda: guess(data, A)
+
+@benchmark("guessing")
+def guess_deq():
+    from .. import OreAlgebra, guess
+    data = [binomial(2*n, n)*fibonacci(n)**3 for n in range(300)]
+    A = OreAlgebra(ZZ['x'], 'Dx')
+    return lambda: guess(data, A)
+
+@benchmark("guessing")
+def guess_hp():
+    from .. import OreAlgebra
+    from ..guessing import guess_hp
+    K = GF(1091)
+    A = OreAlgebra(K['x'], 'Dx')
+    data = [binomial(2*n, n)*fibonacci(n)**3 for n in range(2000)]
+    return lambda: guess_hp(data, A, order=4, degree=4, lift=K)
+
+@benchmark("guessing")
+def guess_mult():
+    from .. import OreAlgebra
+    from ..guessing import guess_mult
+    data = [[binomial(n, k) for n in range(30)] for k in range(30)]
+    A = OreAlgebra(ZZ['n', 'k'], 'Sn', 'Sk')
+    return lambda: guess_mult(data, A, order=1, degree=1)
+
+### Nullspace solvers
+
+def _random_matrix(ring, n=8, degree=4):
+    return MatrixSpace(ring, n, n + 1).random_element(degree=degree)
+
+@benchmark("nullspace")
+def gauss():
+    from ..nullspace import gauss
+    mat = _random_matrix(ZZ['x'])
+    return lambda: gauss()(mat)
+
+@benchmark("nullspace")
+def kronecker():
+    from ..nullspace import kronecker, gauss
+    mat = _random_matrix(ZZ['x', 'y'], 6, 2)
+    return lambda: kronecker(gauss())(mat)
+
+@benchmark("nullspace")
+def cra():
+    from ..nullspace import cra, kronecker, gauss
+    mat = _random_matrix(ZZ['x', 'y'], 6, 2)
+    return lambda: cra(kronecker(gauss()))(mat)
+
+@benchmark("nullspace")
+def hermite():
+    from ..nullspace import hermite
+    mat = _random_matrix(GF(1093)['x'], 12, 6)
+    return lambda: hermite()(mat)
+
+@benchmark("nullspace")
+def sage_native():
+    from ..nullspace import sage_native
+    mat = _random_matrix(QQ['x'])
+    return lambda: sage_native(mat)
+
+### Operator arithmetic
+
+@benchmark("operators")
+def lclm():
+    from ..examples import fcc
+    return lambda: fcc.dop4.lclm(fcc.dop5)
+
+@benchmark("operators")
+def lclm_modular():
+    from ..examples import fcc
+    return lambda: fcc.dop4.lclm(fcc.dop5, algorithm="modular")
+
+@benchmark("operators")
+def symmetric_product():
+    from ..examples import fcc
+    return lambda: fcc.dop4.symmetric_product(fcc.dop4)
+
+### Analytic continuation
+
+def _transition_matrix(eps, **kwds):
+    from ..examples import fcc
+    dop = fcc.dop4
+    return lambda: dop.numerical_transition_matrix([0, 1/QQ(2), 1], eps, **kwds)
+
+for _eps in [10, 100, 1000]:
+    benchmark("transition_matrix", "prec_1e-{}".format(_eps))(
+            lambda _eps=_eps: _transition_matrix(QQ(10)**-_eps))
+
+def _summation(algorithm):
+    from ..examples import fcc
+    dop = fcc.dop5
+    return lambda: dop.numerical_transition_matrix([1/QQ(4), 1/QQ(2)], 1e-300,
+                                                  algorithm=[algorithm])
+
+for _algo in ["naive", "binsplit", "dac"]:
+    benchmark("summation", _algo)(lambda _algo=_algo: _summation(_algo))
+
+@benchmark("monodromy")
+def monodromy_matrices():
+    from .. import DifferentialOperators
+    from ..analytic.monodromy import monodromy_matrices
+    _, z, Dz = DifferentialOperators()
+    dop = (z**2*(14*z-3)*(23*z**3+128*z**2+128*z-256)*Dz**3
+           + 2*z*(1449*z**4+5255*z**3+1744*z**2-2208*z+672)*Dz**2
+           + 2*(2898*z**4+5513*z**3-1081*z**2-414*z+48)*Dz
+           + 1932*z**3+344*z**2-690*z-12)
+    dop = dop.annihilator_of_composition(z - 1)
+    return lambda: monodromy_matrices(dop, 0, eps=1e-50)
+
+@benchmark("bounds")
+def bound_coefficients():
+    from .. import DifferentialOperators
+    from ..analytic.singularity_analysis import bound_coefficients
+    _, z, Dz = DifferentialOperators()
+    dop = (z**2*(4*z - 1)*(4*z + 1)*Dz**3 + 2*z*(4*z+1)*(16*z-3)*Dz**2
+           + 2*(112*z**2 + 14*z - 3)*Dz + 4*(16*z + 3))
+    return lambda: bound_coefficients(dop, [1, 2, 6], order=3)
+
+del _eps, _algo
@@ -1754,6 +1754,9 @@ class UnivariateDFiniteSequence(DFiniteFunction):
         - ``initial_val`` -- either a dictionary (or a list if no singularities occur) which contains the first r sequence terms (and all singularities if
           there are some) of ``self``, where r is the order of ``ann``
 
+        - ``cache`` (default: ``True``) -- if ``True``, the terms computed by ``expand`` and ``__getitem__`` are kept, and later requests
+          extend them incrementally instead of starting over from the initial conditions
+
         OUTPUT:
 
         An object consisting of ``ann`` and a dictionary that represents the D-finite sequence which is annihilated by ``ann``, has the initial values that
@@ -1775,6 +1778,8 @@ class UnivariateDFiniteSequence(DFiniteFunction):
         if not parent.ore_algebra().is_S():
             raise TypeError("Not the Shift Operator")
         super().__init__(parent, ann, initial_val, is_gen, construct, cache)
+        self._terms = [] if cache else None
+        self._backward = None
 
 #action
 
@@ -2169,9 +2174,11 @@ class UnivariateDFiniteSequence(DFiniteFunction):
             if n >= min_degree:
                 int_val_sum.update({(n-min_degree)+ord:self[(n-min_degree)+ord] + right[(n-min_degree)+ord] if (self[(n-min_degree)+ord] is not None and right[(n-min_degree)+ord] is not None) else None})
 
-        sum = UnivariateDFiniteSequence(self.parent(), sum_ann, int_val_sum)
+        sum = UnivariateDFiniteSequence(self.parent(), sum_ann, int_val_sum).compress()
+        a, b = self._cached_terms(), right._cached_terms()
+        sum._seed_terms([x + y for x, y in zip(a, b)])
 
-        return sum.compress()
+        return sum
 
     def _neg_(self):
         r"""
@@ -2191,7 +2198,9 @@ class UnivariateDFiniteSequence(DFiniteFunction):
 
         """
         neg_int_val = {key:(-self._initial_values[key]) if (self._initial_values[key] is not None) else None for key in self._initial_values}
-        return UnivariateDFiniteSequence(self.parent(), self.ann(), neg_int_val)
+        neg = UnivariateDFiniteSequence(self.parent(), self.ann(), neg_int_val)
+        neg._seed_terms([-x for x in self._cached_terms()])
+        return neg
 
     def _mul_(self, right):
         r"""
@@ -2259,6 +2268,8 @@ class UnivariateDFiniteSequence(DFiniteFunction):
                 int_val_prod.update({(n-min_degree)+ord:self[(n-min_degree)+ord] * right[(n-min_degree)+ord] if (self[(n-min_degree)+ord] is not None and right[(n-min_degree)+ord] is not None) else None})
 
         prod = UnivariateDFiniteSequence(self.parent(), prod_ann, int_val_prod)
+        a, b = self._cached_terms(), right._cached_terms()
+        prod._seed_terms([x*y for x, y in zip(a, b)])
         return prod
 
 
@@ -2540,6 +2551,64 @@ class UnivariateDFiniteSequence(DFiniteFunction):
 
 #evaluation
 
+    def _offset(self):
+        r"""
+        Return the number of zeros prepended to the terms of ``self`` when it comes from a D-finite function
+        (see ``expand``).
+        """
+        if self.parent()._backward_calculation is False and min(self.initial_conditions(), default=0) < 0:
+            return -min(self.initial_conditions())
+        return 0
+
+    def _term_list(self, n):
+        r"""
+        Return a list of at least ``n`` consecutive terms of ``self``, starting with the prepended zeros (if any).
+
+        If caching is enabled, the list is the cache of ``self`` itself, extended as needed, and must not be modified
+        by the caller.
+        """
+        ord = self.ann().order()
+        start = self._offset()
+        r = self._terms if self._terms is not None else []
+        if len(r) < ord:
+            r = self.initial_values()
+
+        if len(r) < n:
+            #singularities in the range of new terms are taken from the initial conditions
+            s = sorted(x for x in self.initial_conditions() if len(r) <= x < n)
+            for m in s:
+                if len(r) < m:
+                    r2 = self.ann().to_list( r[len(r)-ord:], m-len(r)+ord, -start+len(r)-ord,True)
+                    r = r + r2[ord:]
+                r = r + [self._initial_values[m]]
+
+            if len(r) < n:
+                r2 = self.ann().to_list( r[len(r)-ord:], n-len(r)+ord, -start+len(r)-ord,True)
+                r = r + r2[ord:]
+
+        if self._terms is not None:
+            self._terms = r
+        return r
+
+    def _cached_terms(self):
+        r"""
+        Return the terms of ``self`` of index 0, 1, ... that are currently cached, up to the first ``None`` entry.
+        """
+        if not self._terms:
+            return []
+        r = self._terms[self._offset():]
+        k = next((i for i, x in enumerate(r) if x is None), len(r))
+        return r[:k]
+
+    def _seed_terms(self, terms):
+        r"""
+        Store ``terms``, the terms of index 0, 1, ... of ``self`` computed by other means, in the cache of ``self``.
+        """
+        if self._terms is None or self._offset() != 0:
+            return
+        if len(terms) > len(self._terms) and len(terms) >= self.ann().order():
+            self._terms = list(terms)
+
     def expand(self, n):
         r"""
         Return all the terms of ``self`` between 0 and ``n``
@@ -2563,43 +2632,18 @@ class UnivariateDFiniteSequence(DFiniteFunction):
             sage: a.expand(-10)
             [0, 1, -1, 2, -3, 5, -8, 13, -21, 34, -55]
 
+        The computed terms are cached, so that asking for more terms later only computes the new ones::
+
+            sage: a.expand(12)
+            [0, 1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144]
+
         """
         ord = self.ann().order()
-        start = 0
 
         if n >= 0:
-            n = n+1
             #check if self is coming from a d-finite function that contains added zeros:
-            if self.parent()._backward_calculation is False and min(self.initial_conditions()) < 0:
-                start = -min(self.initial_conditions())
-                n = n + start
-
-            #1st case: n is smaller than the order - so all needed terms are already given
-            if n < ord:
-                return self.initial_values()[start:n]
-
-
-            #2nd case: n is smaller than all relevant singularities - nothing to worry about
-            s = [x for x in self.initial_conditions() if ord <= x]
-            if all(n < x for x in s):
-                return self.ann().to_list(self.initial_values(),n, -start)[start:]
-
-            #3rd case: there is at least one singularity in the first n terms of the sequence
-            s = {x for x in self.initial_conditions() if ord <= x < n}
-            r = self.initial_values()
-            while s:
-                m = min(s)
-                if len(r) == m:
-                    r.append(self._initial_values[m])
-                else:
-                    r2 = self.ann().to_list( r[len(r)-ord:], m-len(r)+ord, -start+len(r)-ord,True)
-                    r = r + r2[ord:] + [self._initial_values[m]]
-                s.remove(m)
-
-            r2 = self.ann().to_list( r[len(r)-ord:], n-len(r)+ord, -start+len(r)-ord,True)
-            r = r + r2[ord:]
-
-            return r[start:]
+            start = self._offset()
+            return self._term_list(n+1+start)[start:n+1+start]
 
         if n < 0:
             if self.parent()._backward_calculation is False:
@@ -2607,16 +2651,18 @@ class UnivariateDFiniteSequence(DFiniteFunction):
 
             if ord != 0:
                 ord = self.ann().order()-1
-            N = self.parent().base_ring().gen()
-
-            A = self.ann().annihilator_of_composition(ord-N)
 
-            int_val = {ord-i:self[i] for i in self.initial_conditions() if i <= ord}
-            if int_val:
-                b = UnivariateDFiniteSequence(self.parent().change_domain(NN), A, int_val)
-                return b.expand(-(n+1)+ord+1)[ord:]
-            else:
-                return (-n+1)*[0]
+            b = self._backward
+            if b is None:
+                N = self.parent().base_ring().gen()
+                A = self.ann().annihilator_of_composition(ord-N)
+                int_val = {ord-i:self[i] for i in self.initial_conditions() if i <= ord}
+                if not int_val:
+                    return (-n+1)*[0]
+                b = UnivariateDFiniteSequence(self.parent().change_domain(NN), A, int_val, cache=self._terms is not None)
+                if self._terms is not None:
+                    self._backward = b
+            return b.expand(-(n+1)+ord+1)[ord:]
 
 
     def __getitem__(self,n):
@@ -2642,7 +2688,22 @@ class UnivariateDFiniteSequence(DFiniteFunction):
             sage: a[-100]
             -354224848179261915075
 
+        Slices return the list of terms with indices in the given range::
+
+            sage: a[3:8]
+            [2, 3, 5, 8, 13]
+            sage: a[-4:0]
+            [-3, 2, -1, 1]
+
         """
+        if isinstance(n, slice):
+            if n.stop is None:
+                raise ValueError("slices of sequences must have an end")
+            i, j, step = n.start or 0, n.stop, n.step or 1
+            if 0 <= i < j:
+                return self.expand(j-1)[i:j:step]
+            return [self[k] for k in range(i, j, step)]
+
         try:
             return self.initial_conditions()[n]
         except Exception:
@@ -2656,6 +2717,12 @@ class UnivariateDFiniteSequence(DFiniteFunction):
         if n < 0:
             return self.expand(n)[-n]
 
+        #terms close to those already computed are obtained by extending the cache, others by binary splitting
+        if self._terms is not None:
+            offset = self._offset()
+            if n + offset < 2*len(self._terms) + 64:
+                return self._term_list(n+offset+1)[n+offset]
+
         #normal case: n >= 0
         if self.parent()._backward_calculation is False and min(self.initial_conditions()) < 0:
             start = min(self.initial_conditions())
@@ -31,6 +31,7 @@ except:
 #######################################
 
 import math
+import multiprocessing
 from datetime import datetime
 
 from sage.arith.all import previous_prime
@@ -42,7 +43,7 @@ from sage.rings.finite_rings.all import GF
 from sage.matrix.constructor import matrix
 from sage.matrix.matrix_space import MatrixSpace
 from sage.misc.lazy_string import lazy_string
-from sage.parallel.decorate import parallel
+from sage.misc.prandom import sample
 from sage.rings.polynomial.polynomial_ring import PolynomialRing_general
 from sage.rings.polynomial.polynomial_ring_constructor import PolynomialRing
 from sage.modules.free_module_element import vector
@@ -106,7 +107,10 @@ def guess(data, algebra, **kwargs):
     - ``ensure`` -- if `N` is the minimum number of terms needed for some particular
       choice of order and degree, and if ``len(data)`` is less than ``N+ensure``,
       raise an error. This must be a nonnegative integer. Default: 0.
-    - ``ncpus`` -- number of processors to be used. Default: 1.
+    - ``ncpus`` -- number of processors to be used. Default: 1. When the
+      method works with homomorphic images (i.e., over ZZ, ZZ[t], or GF(p)[t]),
+      a pool of ``ncpus`` worker processes is started after the first rounds and
+      kept alive until the end of the computation.
     - ``order`` -- bounds the order of the operators being searched for.
       Default: infinity.
     - ``min_order`` -- smallest order to be considered in the search. The output
@@ -121,7 +125,17 @@ def guess(data, algebra, **kwargs):
       path is chosen which examines all the `(r, d)` which can be tested with the
       given amount of data.
     - ``solver`` -- function to be used for computing the right kernel of a matrix
-      with elements in `K`.
+      with elements in `K` (resp. in its homomorphic images).
+    - ``dims`` -- if ``data`` is a callable, a list or tuple specifying the number of
+      terms available in each direction.
+    - ``sparse`` -- if ``True``, the linear systems are set up as sparse matrices,
+      and only their nonzero entries are stored. Default: ``False``.
+    - ``sample`` -- if ``True`` and more points than needed are available, the points
+      to be used are chosen at random among them rather than taking the first ones.
+      Default: ``False``.
+    - ``ncpus`` -- number of processes to be used for solving the linear systems
+      modulo several primes (resp. at several evaluation points) in parallel.
+      Default: 1.
     - ``infolevel`` -- an integer specifying the level of details of progress
       reports during the calculation.
     - ``method`` -- either "linalg" (for linear algebra) or "hp" (for Hermite-Pade) or "automatic"
@@ -443,7 +457,7 @@ def guess_raw(data, A, order=-1, degree=-1, lift=None, solver=None, cut=25, ensu
 
 ###########################################################################################
 
-def guess_hp(data, A, order=-1, degree=-1, lift=None, cut=25, ensure=0, infolevel=0):
+def guess_hp(data, A, order=-1, degree=-1, lift=None, cut=25, ensure=0, infolevel=0, certificate=False):
     """
     Guesses differential equations or algebraic equations for a given sample of terms.
 
@@ -464,6 +478,9 @@ def guess_hp(data, A, order=-1, degree=-1, lift=None, cut=25, ensure=0, infoleve
       raise an error. This must be a nonnegative integer.
     - ``infolevel`` (optional) -- an integer indicating the desired amount of
       progress report to be printed during the calculation. Default: 0 (no output).
+    - ``certificate`` (optional) -- if set to ``True``, also return a bound
+      certifying the absence of solutions of smaller degree, see below.
+      Default: ``False``.
 
     OUTPUT:
 
@@ -471,6 +488,14 @@ def guess_hp(data, A, order=-1, degree=-1, lift=None, cut=25, ensure=0, infoleve
     at most ``order`` and degree at most ``degree`` such that `L` applied to
     the truncated power series with ``data`` as terms gives the zero power series.
 
+    If ``certificate`` is ``True``, the output is a pair consisting of this
+    basis and the smallest degree `b` of an element of the minimal approximant
+    basis computed by the algorithm. By the predictable degree property of such
+    bases, there is no operator of order at most ``order`` and degree less than
+    `b` which annihilates the truncated power series. The pairs `(r, d)` with
+    `r \le` ``order`` and `d < b` are thus infeasible for the (possibly
+    truncated) data at hand, regardless of ``degree``.
+
     An error is raised in the following situations:
 
     * the algebra ``A`` has more than one generator, or its unique generator
@@ -481,7 +506,10 @@ def guess_hp(data, A, order=-1, degree=-1, lift=None, cut=25, ensure=0, infoleve
 
     ALGORITHM:
 
-    Hermite-Pade approximation.
+    Hermite-Pade approximation, using a divide-and-conquer computation of a
+    minimal approximant basis over `K[x]` which only involves truncated
+    products of polynomial matrices, so that the cost is quasi-linear in the
+    number of terms for fixed order.
 
     .. NOTE::
 
@@ -498,10 +526,13 @@ def guess_hp(data, A, order=-1, degree=-1, lift=None, cut=25, ensure=0, infoleve
       [(x^4 + 819*x^3 + 136*x^2 + 17*x + 635)*Dx^4 + (14*x^3 + 417*x^2 + 952*x + 605)*Dx^3 + (598*x^2 + 497*x + 99)*Dx^2 + (598*x + 794)*Dx + 893]
       sage: len(guess_hp(data, OreAlgebra(R, 'C'), order=16, degree=64, lift=K))
       1
+      sage: sols, b = guess_hp(data, OreAlgebra(R, 'Dx'), order=3, degree=20, lift=K, certificate=True)
+      sage: sols, b > 20
+      ([], True)
     """
 
     if min(order, degree) < 0:
-        return []
+        return ([], 0) if certificate else []
 
     R = A.base_ring()
     K = R.base_ring()
@@ -544,13 +575,14 @@ def guess_hp(data, A, order=-1, degree=-1, lift=None, cut=25, ensure=0, infoleve
             series.append((series[1]*series[-1]).truncate(truncate))
 
     info(2, lazy_string(lambda: datetime.today().ctime() + ": matrix construction completed."))
-    sol = _hermite(True, matrix(R, [series]), [degree], infolevel - 2, truncate = truncate - 1)
+    sol, degrees = _hermite(True, matrix(R, [series]), [degree], infolevel - 2, truncate = truncate - 1,
+                            return_degrees=True)
     info(2, lazy_string(lambda: datetime.today().ctime() + ": hermite pade approximation completed."))
 
     sol = [A(list(map(R, s))) for s in sol]
     sol = [(~L.leading_coefficient().leading_coefficient())*L for L in sol]
 
-    return sol
+    return (sol, min(degrees)) if certificate else sol
 
 ###########################################################################################
 
@@ -607,6 +639,7 @@ def _guess_via_hom(data, A, modulus, to_hom, **kwargs):
     nn = 0
     path = []
     ncpus = 1
+    pool = None
     return_short_path = 'return_short_path' in kwargs and kwargs['return_short_path'] is True
 
     def op2vec(L, r, d):
@@ -617,146 +650,145 @@ def _guess_via_hom(data, A, modulus, to_hom, **kwargs):
             c.extend(p[j] for j in range(d + 1))
         return vector(K, c)
 
+    def list2vec(c, r, d):
+        # like op2vec, but for an operator given as list of coefficient lists (as delivered by the pool workers)
+        c = c + [[]]*(r + 1 - len(c))
+        return vector(K, [c[i][j] if j < len(c[i]) else 0 for i in range(r + 1) for j in range(d + 1)])
+
     def vec2op(v, r, d):
         # convert a vector of dimension (r+1)*(d+1) into an operator of order <=r and degree <=d.
         c = [R([v[(d + 1)*i + j] for j in range(d + 1)])
              for i in range(r + 1)]
         return A(c)
 
-    while mod != 0:
+    try:
+        while mod != 0:
 
-        nn += 1 # iteration counter
+            nn += 1 # iteration counter
 
-        if nn == 1:
-            # 1st iteration: use the path specified by the user (or a default path)
-            kwargs['return_short_path'] = True
+            if nn == 1:
+                # 1st iteration: use the path specified by the user (or a default path)
+                kwargs['return_short_path'] = True
 
-        elif nn == 2 and atomic and path[0][0] >= Lp.order() + 2:
-            # 2nd iteration: try to optimize the path obtained in the 1st iteration
-            r0 = Lp.order()
-            d0 = Lp.degree()
-            r1, d1 = path[0]
-            # determine the hyperbola through (r0,d0) and (r1,d1) and
-            # choose (r2,d2) as the point on this hyperbola for which (r2+1)*(d2+1) is minimized
-            try:
-                r2 = r0 - 1 + math.sqrt(abs((d0-d1)*r0*(r0-1.-r1)/(d0+r0+d1*(r0-1.-r1)-r1)))
-                d2 = (d1*(r0-1-r1)*(r0-r2) + d0*(r1-r2))/((r0-r1)*(r0-1-r2))
-                r2 = int(math.ceil(r2))
-                d2 = int(math.ceil(d2))
-                if abs(r2 - r1) >= 2 and abs(d2 - d1) >= 2:
-                    path = [ (i, d2 + ((d1-d2)*(i-r2))//(r1-r2)) for i in range(r2, r1, 1 if r1 >= r2 else -1) ] + path
-                    kwargs['path'] = path
-                else:
+            elif nn == 2 and atomic and path[0][0] >= Lp.order() + 2:
+                # 2nd iteration: try to optimize the path obtained in the 1st iteration
+                r0 = Lp.order()
+                d0 = Lp.degree()
+                r1, d1 = path[0]
+                # determine the hyperbola through (r0,d0) and (r1,d1) and
+                # choose (r2,d2) as the point on this hyperbola for which (r2+1)*(d2+1) is minimized
+                try:
+                    r2 = r0 - 1 + math.sqrt(abs((d0-d1)*r0*(r0-1.-r1)/(d0+r0+d1*(r0-1.-r1)-r1)))
+                    d2 = (d1*(r0-1-r1)*(r0-r2) + d0*(r1-r2))/((r0-r1)*(r0-1-r2))
+                    r2 = int(math.ceil(r2))
+                    d2 = int(math.ceil(d2))
+                    if abs(r2 - r1) >= 2 and abs(d2 - d1) >= 2:
+                        path = [ (i, d2 + ((d1-d2)*(i-r2))//(r1-r2)) for i in range(r2, r1, 1 if r1 >= r2 else -1) ] + path
+                        kwargs['path'] = path
+                    else:
+                        del kwargs['return_short_path']
+                except:
                     del kwargs['return_short_path']
-            except:
-                del kwargs['return_short_path']
 
-            if A.is_C():
-                kwargs['path'] = [(Lp.order(), Lp.degree())] # there is no curve for algebraic equations
+                if A.is_C():
+                    kwargs['path'] = [(Lp.order(), Lp.degree())] # there is no curve for algebraic equations
 
-        elif 'return_short_path' in kwargs:
-            # subsequent iterations: stick to the path we have.
-            del kwargs['return_short_path']
+            elif 'return_short_path' in kwargs:
+                # subsequent iterations: stick to the path we have.
+                del kwargs['return_short_path']
 
-        if 'path' not in kwargs:
-            kwargs['return_short_path'] = True
+            if 'path' not in kwargs:
+                kwargs['return_short_path'] = True
 
-        if ncpus == 1:
-            # sequential version
+            if ncpus == 1:
+                # sequential version
 
-            imgs = []
-            for i in range(max(1, nn - 3)): # do several imgs before proceeding with a reconstruction attempt
+                imgs = []
+                for i in range(max(1, nn - 3)): # do several imgs before proceeding with a reconstruction attempt
 
-                data_mod = None
-                while data_mod is None:
-                    p = next(modulus)
-                    hom = to_hom(p)
-                    info(2, "modulus = " + str(p))
-                    try:
-                        data_mod = list(map(hom, data))
-                    except ArithmeticError:
-                        info(2, "unlucky modulus discarded.")
+                    data_mod = None
+                    while data_mod is None:
+                        p = next(modulus)
+                        hom = to_hom(p)
+                        info(2, "modulus = " + str(p))
+                        try:
+                            data_mod = list(map(hom, data))
+                        except ArithmeticError:
+                            info(2, "unlucky modulus discarded.")
 
-                qq = A.is_Q()
-                if not qq:
-                    Lp = guess(data_mod, A.change_ring(hom(K.one()).parent()[x]), **kwargs)
-                else:
-                    qq = hom(qq[1])
-                    Lp = guess(data_mod, OreAlgebra(hom(K.one()).parent()[x], (A.var(), {x:qq*x}, {}), q=qq), **kwargs)
+                    Lp = guess(data_mod, _hom_image_algebra(A, hom), **kwargs)
 
-                if type(Lp) is tuple and len(Lp) == 2:  ## this implies nn < 3
-                    Lp, path = Lp
-                    kwargs['path'] = path
+                    if type(Lp) is tuple and len(Lp) == 2:  ## this implies nn < 3
+                        Lp, path = Lp
+                        kwargs['path'] = path
 
-                imgs.append((Lp, p))
+                    imgs.append((Lp, p))
+
+                if len(imgs) == 1:
+                    Lp, p = imgs[0]
+                    r = Lp.order()
+                    d = Lp.degree()
+                else:
+                    Lp = A.zero()
+                    p = K.one()
+                    for Lpp, pp in imgs:
+                        try:
+                            Lp, p = _merge_homomorphic_images(op2vec(Lp, r, d), p, op2vec(Lpp, r, d), pp, reconstruct=False)
+                            Lp = vec2op(Lp, r, d)
+                        except:
+                            info(2, "unlucky modulus " + str(pp) + " discarded")
 
-            if len(imgs) == 1:
-                Lp, p = imgs[0]
-                r = Lp.order()
-                d = Lp.degree()
             else:
+                # we can assume at this point that nn >= 3 and 'return_short_path' is switched off.
+                if pool is None:
+                    # the workers receive the data once and are kept alive for all subsequent rounds
+                    pool = _GuessingPool(ncpus, data, A, to_hom, kwargs)
+                primes = [next(modulus) for i in range(max(ncpus, nn - 3))]
+                info(2, "moduli = " + str(primes))
                 Lp = A.zero()
                 p = K.one()
-                for Lpp, pp in imgs:
+                for pp, coeffs in pool.images(primes): # images arrive in the order in which they are completed
+                    if coeffs is None:
+                        info(2, "unlucky modulus " + str(pp) + " discarded")
+                        continue
                     try:
-                        Lp, p = _merge_homomorphic_images(op2vec(Lp, r, d), p, op2vec(Lpp, r, d), pp, reconstruct=False)
+                        Lp, p = _merge_homomorphic_images(op2vec(Lp, r, d), p, list2vec(coeffs, r, d), pp, reconstruct=False)
                         Lp = vec2op(Lp, r, d)
                     except:
                         info(2, "unlucky modulus " + str(pp) + " discarded")
 
-        else:
-            # we can assume at this point that nn >= 3 and 'return_short_path' is switched off.
-            primes = [next(modulus) for i in range(ncpus)]
-            info(2, "moduli = " + str(primes))
-            primes = [ (p, to_hom(p)) for p in primes ]
-            primes = [ (p, hom, A.change_ring(hom(K.one()).parent()[x])) for p, hom in primes ]
-            Lp = A.zero()
-            p = K.one()
-            out = [ (arg[0][0], arg[0][2], Lpp) for arg, Lpp in forked_guess(primes) ]
-            for pp, alg, Lpp in out:
-                Lpp = alg(Lpp)
-                try:
-                    Lp, p = _merge_homomorphic_images(op2vec(Lp, r, d), p, vec2op(Lpp, r, d), pp, reconstruct=False)
-                    Lp = vec2op(Lp, r, d)
-                except:
-                    info(2, "unlucky modulus " + str(pp) + " discarded")
-
-        if nn == 1:
-            r = Lp.order()
-            d = Lp.degree()
-            info(2, "solution of order " + str(r) + " and degree " + str(d) + " predicted")
-
-        elif nn == 2 and 'ncpus' in kwargs and kwargs['ncpus'] > 1:
-            info(2, "Switching to multiprocessor code.")
-            ncpus = kwargs['ncpus']
-            del kwargs['ncpus']
-            kwargs['infolevel'] = 0
+            if nn == 1:
+                r = Lp.order()
+                d = Lp.degree()
+                info(2, "solution of order " + str(r) + " and degree " + str(d) + " predicted")
 
-            @parallel(ncpus=ncpus)
-            def forked_guess(p, hom, alg):
-                try:
-                    return guess(list(map(hom, data)), alg, **kwargs).polynomial()
-                except ArithmeticError:
-                    return None
+            elif nn == 2 and 'ncpus' in kwargs and kwargs['ncpus'] > 1:
+                info(2, "Switching to multiprocessor code.")
+                ncpus = kwargs['ncpus']
+                del kwargs['ncpus']
+                kwargs['infolevel'] = 0
 
-        elif nn == 3 and 'infolevel' in kwargs:
-            kwargs['infolevel'] = kwargs['infolevel'] - 2
+            elif nn == 3 and 'infolevel' in kwargs:
+                kwargs['infolevel'] = kwargs['infolevel'] - 2
 
-        if not Lp.is_zero():
-            info(2, "Reconstruction attempt...")
-            s = Lp.parent().sigma()
-            if not s.is_identity() and mod.parent() is ZZ:
-                try:
-                    if order_adjustment is None:
-                        order_adjustment = Lp.order() // ZZ(2)
-                    Lp = Lp.map_coefficients(lambda p: s(p, -order_adjustment))
-                except:
-                    L = A.zero()
-                    mod = K.one() if atomic else ZZ.one()
-                    order_adjustment = 0
+            if not Lp.is_zero():
+                info(2, "Reconstruction attempt...")
+                s = Lp.parent().sigma()
+                if not s.is_identity() and mod.parent() is ZZ:
+                    try:
+                        if order_adjustment is None:
+                            order_adjustment = Lp.order() // ZZ(2)
+                        Lp = Lp.map_coefficients(lambda p: s(p, -order_adjustment))
+                    except:
+                        L = A.zero()
+                        mod = K.one() if atomic else ZZ.one()
+                        order_adjustment = 0
 
-            L, mod = _merge_homomorphic_images(op2vec(L, r, d), mod, op2vec(Lp, r, d), p)
-            L = vec2op(L, r, d)
+                L, mod = _merge_homomorphic_images(op2vec(L, r, d), mod, op2vec(Lp, r, d), p)
+                L = vec2op(L, r, d)
+    finally:
+        if pool is not None:
+            pool.close()
 
     if order_adjustment:
         s = L.parent().sigma()
@@ -764,6 +796,89 @@ def _guess_via_hom(data, A, modulus, to_hom, **kwargs):
 
     return (L, path) if return_short_path else L
 
+def _hom_image_algebra(A, hom):
+    """
+    Returns the algebra in which the images of operators of ``A`` under ``hom`` live,
+    where ``hom`` is a map from the base ring of the base ring of ``A`` to some other ring.
+    """
+    R = A.base_ring()
+    x = R.gen()
+    Kp = hom(R.base_ring().one()).parent()
+    qq = A.is_Q()
+    if not qq:
+        return A.change_ring(Kp[x])
+    qq = hom(qq[1])
+    Rp = Kp[x]
+    xp = Rp.gen()
+    return OreAlgebra(Rp, (A.var(), {xp:qq*xp}, {}), q=qq)
+
+# state of a worker process of a _GuessingPool; it is set once by _guessing_pool_init
+# when the worker is started and then used for all the moduli the worker is asked to process.
+_guessing_pool_state = None
+
+def _guessing_pool_init(data, A, to_hom, kwargs):
+    global _guessing_pool_state
+    _guessing_pool_state = (data, A, to_hom, kwargs)
+
+def _guessing_pool_task(p):
+    data, A, to_hom, kwargs = _guessing_pool_state
+    try:
+        hom = to_hom(p)
+        Lp = guess(list(map(hom, data)), _hom_image_algebra(A, hom), **kwargs)
+    except ArithmeticError:
+        return p, None
+    # a list of coefficient lists is cheaper to send back than the operator itself
+    return p, [Lp[i].list() for i in range(Lp.order() + 1)]
+
+class _GuessingPool:
+    """
+    Persistent pool of worker processes computing homomorphic images of a guessing problem.
+
+    The worker processes are forked once. Each of them receives ``data`` only at startup,
+    and afterwards only moduli are sent to the workers and coefficient lists of the modular
+    operators are sent back. This avoids forking new processes and pickling the data in
+    every round of the chinese remaindering/interpolation loop in ``_guess_via_hom``.
+
+    INPUT:
+
+    - ``ncpus`` -- number of worker processes
+    - ``data``, ``A``, ``to_hom`` -- as in ``_guess_via_hom``
+    - ``kwargs`` -- the options to be passed to ``guess`` for the modular problems
+
+    EXAMPLES::
+
+        sage: from ore_algebra import OreAlgebra
+        sage: from ore_algebra.guessing import _GuessingPool
+        sage: A = OreAlgebra(ZZ['n'], 'Sn')
+        sage: pool = _GuessingPool(2, [binomial(2*i, i) for i in range(50)], A, GF, {})
+        sage: sorted(pool.images([1009, 1013]))
+        [(1009, [[1007, 1005], [1, 1]]), (1013, [[1011, 1009], [1, 1]])]
+        sage: pool.close()
+    """
+
+    def __init__(self, ncpus, data, A, to_hom, kwargs):
+        # the fork start method hands the initial arguments to the workers
+        # without pickling them, and it also accepts closures such as to_hom.
+        context = multiprocessing.get_context('fork')
+        self._pool = context.Pool(ncpus, initializer=_guessing_pool_init,
+                                  initargs=(data, A, to_hom, dict(kwargs)))
+
+    def images(self, moduli):
+        """
+        Returns an iterator over the pairs ``(p, coeffs)`` for all ``p`` in ``moduli``,
+        where ``coeffs`` is the list of coefficient lists of the operator guessed for
+        the image of the data mod ``p``, or ``None`` if ``p`` turned out to be unlucky.
+        The pairs are produced in the order in which the workers complete them.
+        """
+        return self._pool.imap_unordered(_guessing_pool_task, moduli)
+
+    def close(self):
+        """
+        Terminates the worker processes.
+        """
+        self._pool.terminate()
+        self._pool.join()
+
 ###########################################################################################
 
 def _guess_via_gcrd(data, A, **kwargs):
@@ -883,11 +998,16 @@ def _guess_via_gcrd(data, A, **kwargs):
     # search equation
 
     neg_probes = []
+    infeasible = [] # pairs (r, b) such that there are no solutions of order <= r and degree < b
     def probe(r, d):
-        if (r, d) in neg_probes:
+        if (r, d) in neg_probes or any(r <= r1 and d < b1 for r1, b1 in infeasible):
             return []
         kwargs['order'], kwargs['degree'] = r, d
-        sols = subguesser(data, A, **kwargs)
+        if subguesser is guess_hp:
+            sols, b = subguesser(data, A, certificate=True, **kwargs)
+            infeasible.append((r, b))
+        else:
+            sols = subguesser(data, A, **kwargs)
         info(2, str(len(sols)) + " sols for (r, d)=" + str((r, d)))
         if len(sols) == 0:
             neg_probes.append((r, d))
@@ -1261,6 +1381,17 @@ def _power_factory(domain):
 
 ###########################################################################################
 
+# function computing the modular images in the worker processes of guess_mult,
+# set once by _guess_mult_pool_init when the worker is started.
+_guess_mult_pool_image = None
+
+def _guess_mult_pool_init(image):
+    global _guess_mult_pool_image
+    _guess_mult_pool_image = image
+
+def _guess_mult_pool_task(p):
+    return p, _guess_mult_pool_image(p)
+
 def guess_mult(data, algebra, **kwargs):
     """
     Searches for elements of the algebra which annihilates the given data.
@@ -1270,6 +1401,8 @@ def guess_mult(data, algebra, **kwargs):
     - ``data`` -- a nested list of elements of the algebra's base ring's base ring `K` (or at least
       of objects which can be casted into this ring).
       The depth of the nesting must match the number of generators of the algebra.
+      Alternatively, a callable which maps index tuples to such elements; the terms
+      are then only computed when they are needed, and the option ``dims`` must be given.
     - ``algebra`` -- an Ore algebra over a polynomial ring all of whose generators are
       the standard derivation, the standard shift, or a q-shift.
 
@@ -1322,6 +1455,12 @@ def guess_mult(data, algebra, **kwargs):
       sage: guess_mult(data, OreAlgebra(ZZ['x','k'], 'Dx', 'Sk'), order=1, degree=1)
       Left Ideal (Dx*Sk + (-x - 1)*Dx - 1, x*Dx*Sk + (x + 1)*Dx + (-k)*Sk - x, (x + 1)*Dx - k, (x + 1)*Dx*Sk + (-k - 1)*Sk) of Multivariate Ore algebra in Dx, Sk over Fraction Field of Multivariate Polynomial Ring in x, k over Integer Ring
 
+    The same, with lazily computed terms and sparse linear systems solved in parallel::
+
+      sage: guess_mult(lambda i, j: binomial(j, i), OreAlgebra(ZZ['n','k'], 'Sn', 'Sk'), dims=(10, 10),
+      ....:            order=1, degree=0, sparse=True, sample=True, ncpus=2)
+      Left Ideal (Sn*Sk - Sn - 1) of Multivariate Ore algebra in Sn, Sk over Fraction Field of Multivariate Polynomial Ring in n, k over Integer Ring
+
     """
 
     infolevel = kwargs.setdefault('infolevel', 0)
@@ -1331,11 +1470,16 @@ def guess_mult(data, algebra, **kwargs):
             print(msg)
 
     # 1. extract configuration from options and check input for plausibility
-    l = data
-    dims = []
-    while isinstance(l, (list, tuple)):
-        dims.append(len(l))
-        l = l[0]
+    if callable(data):
+        if 'dims' not in kwargs:
+            raise ValueError("dims must be specified when data is a callable")
+        dims = list(kwargs['dims'])
+    else:
+        l = data
+        dims = []
+        while isinstance(l, (list, tuple)):
+            dims.append(len(l))
+            l = l[0]
     dim = len(dims)
     range_dim = list(range(dim))
 
@@ -1396,7 +1540,10 @@ def guess_mult(data, algebra, **kwargs):
 
     cut = kwargs.setdefault("cut", 100)
     if cut is not None and len(points) > len(terms) + cut:
-        points = points[:len(terms) + cut]
+        if kwargs.setdefault("sample", False):
+            points = sorted(sample(points, len(terms) + cut))
+        else:
+            points = points[:len(terms) + cut]
         info(1, "keeping " + str(len(points)) + " points.")
     else:
         info(1, "keeping all " + str(len(points)) + " points.")
@@ -1427,17 +1574,15 @@ def guess_mult(data, algebra, **kwargs):
         R = ZZ if C is QQ else C.base()
         mod = [R.one()]
         sol = None
-        power = [None]*dim
         imgs = []
         kwargs['infolevel'] = infolevel - 2
+        ncpus = kwargs.setdefault('ncpus', 1)
 
-        while not all(m.is_zero() for m in mod):
-
-            p = next(modulus_generator)
-            info(1, "modulus = " + str(p))
+        def image(p): # modular image for the current terms and points
             C_mod = GF(p) if C is QQ else C.base_ring()
             phi = to_hom(p)
-
+            A_mod = list(A)
+            power = [None]*dim
             for i in range_dim:
                 if algebra.is_D(i):
                     power[i] = _ff_factory(C_mod)
@@ -1445,63 +1590,85 @@ def guess_mult(data, algebra, **kwargs):
                     power[i] = _power_factory(C_mod)
                 elif algebra.is_Q(i):
                     _, q = algebra.is_Q(i)
-                    A[i] = lambda n, u, v: (phi(q), n*u)
+                    A_mod[i] = lambda n, u, v, q=phi(q): (q, n*u)
                     power[i] = _power_factory(C_mod)
+            return guess_mult_raw(C_mod, data, terms, points, power, A_mod, B, phi=phi, **kwargs)
 
-            ## compute modular image
-            kwargs['phi'] = phi
-            solp = guess_mult_raw(C_mod, data, terms, points, power, A, B, **kwargs)
-            del kwargs['phi']
-
-            if sol is None: ## initialization
-
-                ## early termination check
-                if len(solp) == 0:
-                    info(1, lazy_string(lambda: datetime.today().ctime() + " : multivariate guessing completed by early termination."))
-                    return algebra.ideal([])
-
-                ## extract support of solutions
-                for i in range(len(terms)):
-                    if all(v[i].is_zero() for v in solp):
-                        terms[i] = None
-
-                sol = [[] for i in range(len(solp))]
-                new_terms = []
-                for i in range(len(terms)):
-                    if terms[i] is not None:
-                        new_terms.append(terms[i])
-                        for j in range(len(solp)):
-                            sol[j].append(R(solp[j][i]))
-                terms = new_terms
-                sol = [vector(R, s) for s in sol]
-                mod = [p]*len(sol)
-
-                if cut is not None and len(points) > len(terms) + cut:
-                    points = points[:len(terms) + cut]
-
-            else: ## subsequent iterations
-
-                try: ## save
-                    imgs[imgs.index(None)] = ([vector(R, s) for s in solp], p)
-                except: ## merge, merge, and reconstruct
-
-                    p = [p]*len(solp)
-                    solp = [vector(R, s) for s in solp]
-                    for solpp, pp in imgs:
-                        for i in range(len(solp)):
-                            try:
-                                solp[i], p[i] = _merge_homomorphic_images(solp[i], p[i], solpp[i], pp, reconstruct=False)
-                            except:
-                                info(2, "unlucky modulus " + str(pp) + " discarded")
-
-                    imgs = [None]*(len(imgs) + 1)
-
-                    for i in range(len(sol)):
-                        try:
-                            # if all mod[i] are zero in the end, this will terminate the while loop
-                            sol[i], mod[i] = _merge_homomorphic_images(sol[i], mod[i], solp[i], p[i], reconstruct=True)
-                        except:
-                            info(2, "unlucky modulus " + str(p[i]) + " discarded")
+        pool = None
+        try:
+            while not all(m.is_zero() for m in mod):
+
+                if pool is None:
+                    p = next(modulus_generator)
+                    images = [(p, image(p))]
+                else:
+                    images = pool.imap_unordered(_guess_mult_pool_task,
+                                                 [next(modulus_generator) for i in range(ncpus)])
+
+                for p, solp in images:
+
+                    if all(m.is_zero() for m in mod):
+                        break
+                    info(1, "modulus = " + str(p))
+
+                    if sol is None: ## initialization
+
+                        ## early termination check
+                        if len(solp) == 0:
+                            info(1, lazy_string(lambda: datetime.today().ctime() + " : multivariate guessing completed by early termination."))
+                            return algebra.ideal([])
+
+                        ## extract support of solutions
+                        for i in range(len(terms)):
+                            if all(v[i].is_zero() for v in solp):
+                                terms[i] = None
+
+                        sol = [[] for i in range(len(solp))]
+                        new_terms = []
+                        for i in range(len(terms)):
+                            if terms[i] is not None:
+                                new_terms.append(terms[i])
+                                for j in range(len(solp)):
+                                    sol[j].append(R(solp[j][i]))
+                        terms = new_terms
+                        sol = [vector(R, s) for s in sol]
+                        mod = [p]*len(sol)
+
+                        if cut is not None and len(points) > len(terms) + cut:
+                            points = points[:len(terms) + cut]
+
+                        if ncpus > 1:
+                            # terms and points are fixed from now on
+                            context = multiprocessing.get_context('fork')
+                            pool = context.Pool(ncpus, initializer=_guess_mult_pool_init, initargs=(image,))
+
+                    else: ## subsequent iterations
+
+                        try: ## save
+                            imgs[imgs.index(None)] = ([vector(R, s) for s in solp], p)
+                        except: ## merge, merge, and reconstruct
+
+                            p = [p]*len(solp)
+                            solp = [vector(R, s) for s in solp]
+                            for solpp, pp in imgs:
+                                for i in range(len(solp)):
+                                    try:
+                                        solp[i], p[i] = _merge_homomorphic_images(solp[i], p[i], solpp[i], pp, reconstruct=False)
+                                    except:
+                                        info(2, "unlucky modulus " + str(pp) + " discarded")
+
+                            imgs = [None]*(len(imgs) + 1)
+
+                            for i in range(len(sol)):
+                                try:
+                                    # if all mod[i] are zero in the end, this will terminate the while loop
+                                    sol[i], mod[i] = _merge_homomorphic_images(sol[i], mod[i], solp[i], p[i], reconstruct=True)
+                                except:
+                                    info(2, "unlucky modulus " + str(p[i]) + " discarded")
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
 
     elif C.base_ring().fraction_field() is QQ and isinstance(C.base(), PolynomialRing_general) and len(C.base().gens()) == 1:
         ### C = QQ(t)
@@ -1557,6 +1724,11 @@ def guess_mult_raw(C, data, terms, points, power, A, B, **kwargs):
     all(sum(prod(f[i][A[i][n[i],u[i],v[i]]]*a[B[i][n[i],u[i],v[i]]] for i in range(len(A)))
     for u,v in terms) == 0 for n in points)
 
+    The list `data` may also be a callable mapping index tuples to elements of C.
+    If the option `sparse` is set to True, the matrix of the linear system is set up
+    as a sparse matrix. If the option `solver` is set, it is used for computing its
+    right kernel.
+
     SIDE EFFECT:
 
     Elements of the list `points` which lead to a zero equation will be discarded.
@@ -1569,36 +1741,47 @@ def guess_mult_raw(C, data, terms, points, power, A, B, **kwargs):
             print(msg)
 
     phi = kwargs.setdefault('phi', lambda x: x)
+    sparse = kwargs.setdefault('sparse', False)
     C = C.fraction_field()
     mat = []
     info(1, lazy_string(lambda: datetime.today().ctime() + " : setting up modular system..."))
     monomial_cache = {}
     range_dim = list(range(len(A)))
 
+    if callable(data):
+        term = lambda idx: data(*idx)
+    else:
+        def term(idx):
+            d = data
+            for i in idx:
+                d = d[i]
+            return d
+
     for k, n in enumerate(points):
 
-        row = []
-        for u, v in terms:
+        row = {} if sparse else []
+        for j, (u, v) in enumerate(terms):
 
             idx = tuple(B[i](n[i], u[i], v[i]) for i in range_dim)
             if min(idx) < 0:
-                row.append(phi(C.zero()))
+                if not sparse:
+                    row.append(phi(C.zero()))
             else:
                 exp = tuple(A[i](n[i], u[i], v[i]) for i in range_dim)
-                d = data
                 try:
                     factor = monomial_cache[exp]
-                    for i in idx:
-                        d = d[i]
                 except KeyError:
                     factor = phi(C.one())
-                    for p, i, e in zip(*(power, idx, exp)):
-                        d = d[i]
+                    for p, e in zip(power, exp):
                         factor *= p(e[0], e[1])
                     monomial_cache[exp] = factor
-                row.append(phi(d) * factor)
+                e = phi(term(idx)) * factor
+                if not sparse:
+                    row.append(e)
+                elif not e.is_zero():
+                    row[j] = e
 
-        if all(e.is_zero() for e in row):
+        if (not row) if sparse else all(e.is_zero() for e in row):
             points[k] = None
         else:
             mat.append(row)
@@ -1614,7 +1797,14 @@ def guess_mult_raw(C, data, terms, points, power, A, B, **kwargs):
         raise ValueError("not enough data, or too many zeros")
 
     info(1, lazy_string(lambda: datetime.today().ctime() + " : solving modular system..."))
-    sol = MatrixSpace(C, len(points), len(terms))(mat).right_kernel().basis()
+    if sparse:
+        mat = matrix(C, len(mat), len(terms), {(i, j): e for i, row in enumerate(mat) for j, e in row.items()},
+                     sparse=True)
+    else:
+        mat = MatrixSpace(C, len(points), len(terms))(mat)
+    solver = kwargs.get('solver')
+    sol = mat.right_kernel().basis() if solver is None else solver(mat)
+    del mat
 
     info(1, lazy_string(lambda: datetime.today().ctime() + " : " + str(len(sol)) + " solutions detected."))
     return sol
@@ -16,7 +16,11 @@ from datetime import datetime
 from functools import cmp_to_key, reduce
 
 from sage.rings.noncommutative_ideals import Ideal_nc
-from sage.arith.all import gcd
+from sage.arith.all import gcd, lcm, crt, previous_prime
+from sage.arith.multi_modular import MAX_MODULUS
+from sage.parallel.decorate import parallel
+from sage.rings.finite_rings.finite_field_constructor import GF
+from sage.rings.integer_ring import ZZ
 from sage.misc.all import prod, add
 from sage.rings.rational_field import QQ
 from sage.modules.free_module_element import vector
@@ -208,7 +212,7 @@ class OreLeftIdeal(Ideal_nc):
         mat = [[m[b.exp()] for b in B] for m in mat]
         return matrix(self.ring().base_ring(), mat).transpose()
 
-    def groebner_basis(self, infolevel=0, update_hook=None):
+    def groebner_basis(self, infolevel=0, update_hook=None, algorithm="buchberger", solver=None, ncpus=1):
         """
         Returns the Groebner basis of this ideal.
 
@@ -223,6 +227,17 @@ class OreLeftIdeal(Ideal_nc):
           b. The hook facility gives a possibility to interfere with the
           computation. Fiddling with the lists G and C may destroy correctness
           or termination.
+        - ``algorithm`` -- either ``"buchberger"`` (default), which reduces the
+          S-polynomials one at a time, ``"f4"``, which treats all critical
+          pairs of minimal sugar at once, or ``"modular"``, which reconstructs
+          the basis from its images modulo several primes, see below.
+        - ``solver`` -- callable to be used for finding right kernels of
+          matrices over the base ring of the ambient algebra (only used by the
+          ``"f4"`` algorithm). Modular solvers such as
+          ``nullspace.cra(nullspace.kronecker(nullspace.gauss()))`` are
+          admissible. Defaults to the ambient algebra's preferred solver.
+        - ``ncpus`` -- number of primes to process in parallel (only used by the
+          ``"modular"`` algorithm)
 
         OUTPUT:
 
@@ -233,6 +248,28 @@ class OreLeftIdeal(Ideal_nc):
         ring is treated as a field, even if it is in fact only a polynomial
         ring.
 
+        In the ``"f4"`` algorithm, all critical pairs of minimal sugar are
+        selected in each step. The two multiples of the operators of each pair
+        whose leading monomials agree with the lcm of the pair are collected,
+        and, for every monomial occurring in them that is a multiple of a
+        leading monomial of the current basis, a suitable multiple of the
+        corresponding basis element is added (symbolic preprocessing). The new
+        basis elements are then read off from the left kernel of the matrix of
+        coefficients of these operators at the monomials which are leading
+        monomials of some of them, which is computed by ``solver``.
+
+        The ``"modular"`` algorithm applies when the coefficients of the
+        generators are polynomials over ``ZZ`` or ``QQ``. It computes the
+        Groebner bases of the images of the ideal modulo several word-size
+        primes, discards the primes for which the leading monomials differ
+        from those found for the majority of them, and combines the others by
+        Chinese remaindering and rational reconstruction until the result
+        stabilizes. The candidate is accepted if the generators of the ideal
+        reduce to zero with respect to it and if it passes Buchberger's
+        criterion. In other cases, the ``"buchberger"`` algorithm is used
+        instead. Since the result is cached, it is also used by subsequent
+        calls to methods such as :meth:`intersection` or :meth:`eliminate`.
+
         EXAMPLES::
 
             sage: from ore_algebra import *
@@ -251,7 +288,43 @@ class OreLeftIdeal(Ideal_nc):
             [(n - 2*k + 3)*Sn + Sk - n + 2*k - 5,
              (n - 2*k + 3)*Sk^2 + (-3*n + 6*k - 7)*Sk + 2*n - 4*k + 2]
 
+        The same bases, computed by matrix reduction::
+
+            sage: R.<x,y> = ZZ[]
+            sage: A.<Dx,Dy> = OreAlgebra(R)
+            sage: sorted(A.ideal([Dy^3*(Dx + (-1 + 2*x - 2*y)*Dy - 1), Dx^2*((-2 + 2*x - 2*y)*Dy^2 - 3*Dy)]).groebner_basis(algorithm="f4"))
+            [3*Dx^2*Dy + (-4)*Dx*Dy^2 + (-7)*Dy^3,
+             (2*x - 2*y - 2)*Dy^4 + (-7)*Dy^3,
+             (2*x - 2*y - 2)*Dx*Dy^3 + 7*Dy^3]
+
+            sage: from ore_algebra.nullspace import cra, kronecker, gauss
+            sage: R.<n,k> = ZZ[]
+            sage: A.<Sn,Sk> = OreAlgebra(R)
+            sage: I = A.ideal([-5+2*k-n + Sk + (3-2*k+n)*Sn, -2+4*k-2*n + (7-6*k+3*n)*Sk + (-3+2*k-n)*Sk^2])
+            sage: I.groebner_basis(algorithm="f4", solver=cra(kronecker(gauss())))
+            [(n - 2*k + 3)*Sn + Sk - n + 2*k - 5,
+             (n - 2*k + 3)*Sk^2 + (-3*n + 6*k - 7)*Sk + 2*n - 4*k + 2]
+
+        The same bases, computed modulo primes::
+
+            sage: R.<x,y> = ZZ[]
+            sage: A.<Dx,Dy> = OreAlgebra(R)
+            sage: sorted(A.ideal([Dy^3*(Dx + (-1 + 2*x - 2*y)*Dy - 1), Dx^2*((-2 + 2*x - 2*y)*Dy^2 - 3*Dy)]).groebner_basis(algorithm="modular"))
+            [3*Dx^2*Dy + (-4)*Dx*Dy^2 + (-7)*Dy^3,
+             (2*x - 2*y - 2)*Dy^4 + (-7)*Dy^3,
+             (2*x - 2*y - 2)*Dx*Dy^3 + 7*Dy^3]
+
+            sage: R.<n,k> = ZZ[]
+            sage: A.<Sn,Sk> = OreAlgebra(R)
+            sage: I = A.ideal([-5+2*k-n + Sk + (3-2*k+n)*Sn, -2+4*k-2*n + (7-6*k+3*n)*Sk + (-3+2*k-n)*Sk^2])
+            sage: I.groebner_basis(algorithm="modular", ncpus=2)
+            [(n - 2*k + 3)*Sn + Sk - n + 2*k - 5,
+             (n - 2*k + 3)*Sk^2 + (-3*n + 6*k - 7)*Sk + 2*n - 4*k + 2]
+
         """
+        if algorithm not in ("buchberger", "f4", "modular"):
+            raise ValueError("unknown algorithm: " + str(algorithm))
+
         try:
             return list(self.__gb)
         except AttributeError:
@@ -266,6 +339,13 @@ class OreLeftIdeal(Ideal_nc):
         A = A.change_ring(A.base_ring().ring())
         gens = list(map(A, gens))
 
+        if algorithm == "modular":
+            G = _modular_groebner_basis(A, gens, ncpus=ncpus, infolevel=infolevel)
+            if G is not None:
+                self.__gb = tuple(G)
+                return G
+            algorithm = "buchberger"
+
         # ~~~ relatively naive code ~~~
 
         # tools
@@ -320,16 +400,87 @@ class OreLeftIdeal(Ideal_nc):
             g.sugar = g.tdeg()
             G, C = update(G, C, g.reduce(G, normalize=True, coerce=False))
 
-        # buchberger loop
-        info(1, "main loop...")
-        while len(C) > 0:
-            t, u, v, s = C.pop()
-            info(2, datetime.today().ctime() + ": " + str(len(C) + 1) + " pairs left; taking pair with lcm(lm,lm)=" + str(t))
-            uterm = v.lc()*maketerm(t.exp().esub(u.exp()))
-            vterm = u.lc()*maketerm(t.exp().esub(v.exp()))
-            spol = uterm*u - vterm*v
-            spol.sugar = s
-            G, C = update(G, C, spol.reduce(G, normalize=True, infolevel=infolevel-2, coerce=False))
+        def f4_reduce(G, pairs):  # normal forms of the S-polynomials of the given pairs, up to linear combinations
+            rows = []
+            seen = set()
+
+            def add_row(e, g):
+                if (e, g) not in seen:
+                    seen.add((e, g))
+                    rows.append(maketerm(e)*g)
+                    return True
+                return False
+
+            for t, u, v, _ in pairs:
+                add_row(t.exp().esub(u.exp()), u)
+                add_row(t.exp().esub(v.exp()), v)
+            # symbolic preprocessing
+            pivots = set(r.exp() for r in rows)
+            terms = set()
+            k = 0
+            while k < len(rows):
+                for e in rows[k].exponents():
+                    if e in terms:
+                        continue
+                    terms.add(e)
+                    if e in pivots:
+                        continue
+                    for g in G:
+                        if min(e.esub(g.exp())) >= 0:
+                            add_row(e.esub(g.exp()), g)
+                            pivots.add(e)
+                            break
+                k += 1
+            others = [e for e in terms if e not in pivots]
+            if len(others) == 0:
+                info(2, "all S-polynomials reduce to zero")
+                return []
+            # combinations of the rows in which all the leading monomials cancel
+            index = {e: i for i, e in enumerate(pivots)}
+            data = [r.dict() for r in rows]
+            entries = {}
+            for j, d in enumerate(data):
+                for e, c in d.items():
+                    if e in index:
+                        entries[index[e], j] = c
+            mat = matrix(A.base_ring(), len(index), len(rows), entries, sparse=False)
+            info(2, datetime.today().ctime() + ": computing left kernel of a " + str(len(rows)) + "x" + str(len(index)) + " matrix...")
+            out = []
+            for w in solver(mat, infolevel=infolevel-3):
+                h = A({e: sum(w[j]*d[e] for j, d in enumerate(data) if e in d and not w[j].is_zero()) for e in others})
+                if not h.is_zero():
+                    cont = gcd(h.coefficients())
+                    out.append(h.map_coefficients(lambda c: c//cont))
+            return out
+
+        if algorithm == "buchberger":
+
+            # buchberger loop
+            info(1, "main loop...")
+            while len(C) > 0:
+                t, u, v, s = C.pop()
+                info(2, datetime.today().ctime() + ": " + str(len(C) + 1) + " pairs left; taking pair with lcm(lm,lm)=" + str(t))
+                uterm = v.lc()*maketerm(t.exp().esub(u.exp()))
+                vterm = u.lc()*maketerm(t.exp().esub(v.exp()))
+                spol = uterm*u - vterm*v
+                spol.sugar = s
+                G, C = update(G, C, spol.reduce(G, normalize=True, infolevel=infolevel-2, coerce=False))
+
+        else:
+
+            # f4 loop
+            if solver is None:
+                solver = A._solver()
+            info(1, "main loop...")
+            while len(C) > 0:
+                s = C[-1][-1]
+                pairs = []
+                while len(C) > 0 and C[-1][-1] == s:
+                    pairs.append(C.pop())
+                info(2, datetime.today().ctime() + ": " + str(len(C) + len(pairs)) + " pairs left; taking " + str(len(pairs)) + " pairs of sugar " + str(s))
+                for h in f4_reduce(G, pairs):
+                    h.sugar = s
+                    G, C = update(G, C, h.reduce(G, normalize=True, infolevel=infolevel-2, coerce=False))
 
         # autoreduction
         info(2, "autoreduction...")
@@ -771,7 +922,8 @@ class OreLeftIdeal(Ideal_nc):
         info(1, "Entering FGLM...")
         return B.ideal(fglm(B, one, mats, infolevel=infolevel-1, solver=B._solver(R0), early_termination=early_termination), is_known_to_be_a_groebner_basis=True)
 
-    def ct(self, D, algebra=None, certificates=True, early_termination=False, infolevel=0, iteration_limit=0):
+    def ct(self, D, algebra=None, certificates=True, early_termination=False, infolevel=0, iteration_limit=0,
+           solver=None, modular=False, ncpus=1):
         """
         Computes an ideal of telescopers for ``self``.
 
@@ -794,12 +946,26 @@ class OreLeftIdeal(Ideal_nc):
         - iteration_limit -- if set to a positive integer, the computation is
           terminated as soon as the support of the telescopers in the ansatz
           exceeds the specified number.
+        - solver -- callable to be used for the linear systems arising in the
+          ansatz once a homomorphic image indicates that they have nontrivial
+          solutions.
+        - modular -- if True and no solver is given, these linear systems are
+          solved modulo several primes and at several evaluation points, and
+          the solutions are reconstructed by Chinese remaindering and
+          interpolation.
+        - ncpus -- number of primes to be processed in parallel when
+          ``modular`` is True.
 
         OUTPUT:
 
         The ideal of all telescopers of self with respect to D, and (if
         requested) a list of corresponding certificates
 
+        The ansatz is enlarged by one monomial at a time. The solutions of the
+        linear systems which are already known from the previous ansatz are
+        reused, so that only the contribution of the new monomial needs to be
+        determined.
+
         EXAMPLES::
 
             sage: from ore_algebra import *
@@ -824,6 +990,14 @@ class OreLeftIdeal(Ideal_nc):
             sage: A.<Dx,Dy> = OreAlgebra(R)
             sage: A.ideal([x*Dx-1,y*Dy-1]).annihilator_of_composition(x=t).ct(Dy, certificates=False)
             [(252*x^5 - 108*x^4 - 81*x^3 + 36*x^2)*Dx^2 + (-504*x^4 + 108*x^3 + 36*x)*Dx + 224*x^3 + 360*x^2 + 66*x - 16]
+
+            sage: # the same with modular linear algebra
+            sage: R.<t,n,x> = ZZ[]
+            sage: A.<Dt,Dx,Sn> = OreAlgebra(R)
+            sage: I = A.ideal([(-t+t*x^2)*Dx + (-1-n)*Sn+(t*x+n*t*x),(2+n)*Sn^2+(-3*t*x-2*n*t*x)*Sn+(t^2+n*t^2), t*Dt-n])
+            sage: T = I.ct(Sn-1, certificates=False, modular=True, ncpus=2)
+            sage: A.ideal(T) == A.ideal([(-t^2 + 2*t*x - 1)*Dx + t, (-t^2 + 2*t*x - 1)*Dt - t + x])
+            True
         """
 
         def info(i, msg):
@@ -913,14 +1087,21 @@ class OreLeftIdeal(Ideal_nc):
         telescopers = []
         iterator = MonomialIterator(algebra)
         terms = {next(iterator)[0]: vector(GG, [1] + [0]*(len(T)-1))}
-        coresolver = nullspace.kronecker(nullspace.gauss())
+        if solver is not None:
+            coresolver = solver
+        elif modular:
+            coresolver = nullspace.clear(nullspace.cra(nullspace.kronecker(nullspace.lagrange(nullspace.sage_native)), ncpus=ncpus))
+        else:
+            coresolver = nullspace.kronecker(nullspace.gauss())
         zerocount = [0]  # so many zero telescopers have been found so far
         solver = [nullspace.quick_check(coresolver, cutoffdim=0)]
+        levels = [None]  # partial solutions for the current ansatz, see _solve_triangular_system
 
         def findrelation():
             zero = 0
             sol = []
-            for g, c in solve_triangular_system(T, rhs, solver=solver[0]):
+            xsol, xlevels = _solve_triangular_system(T, rhs, solver=solver[0], previous=levels[0])
+            for g, c in xsol:
                 if all(q.is_zero() for q in c):
                     zero += 1
                 else:
@@ -929,6 +1110,7 @@ class OreLeftIdeal(Ideal_nc):
                 zerocount[0] = zero
                 solver[0] = nullspace.quick_check(coresolver, cutoffdim=zero)
             if not sol:
+                levels[0] = xlevels
                 return None
             P, Q = add([sol[0][1][i]*B[i] for i in range(len(B))]), None
             if certificates:
@@ -1056,6 +1238,132 @@ class MonomialIterator:
         self.__pool = [tau for tau in self.__pool if tau is not None]
 
 
+def _modular_groebner_basis(A, gens, ncpus=1, infolevel=0):
+    """
+    Multi-modular computation of the Groebner basis of the left ideal
+    generated by ``gens``.
+
+    INPUT:
+
+    - A -- Ore algebra over a polynomial ring K[x,...] with K = ZZ or QQ
+    - gens -- list of nonzero elements of A
+    - ncpus -- number of primes to process in parallel
+    - infolevel -- verbosity of progress reports
+
+    OUTPUT:
+
+    The reduced Groebner basis, as computed by
+    :meth:`OreLeftIdeal.groebner_basis`, or ``None`` if A is not supported.
+    """
+    R = A.base_ring()
+    if R.base_ring() is not ZZ and R.base_ring() is not QQ:
+        return None
+
+    def info(i, msg):
+        if infolevel >= i:
+            print(msg)
+
+    RQ = R.change_ring(QQ)
+    X = A.gens()
+    exps = [g.exp() for g in gens]
+
+    def image(p):
+        # basis modulo p, normalized such that it is the image of the basis
+        # over QQ normalized in the same way, as a dictionary
+        Rp = R.change_ring(GF(p))
+        try:
+            gens_p = [g.change_ring(Rp) for g in gens]
+        except ZeroDivisionError:
+            return None
+        if [g.exp() for g in gens_p] != exps:
+            return None
+        G = A.change_ring(Rp).ideal(gens_p).groebner_basis()
+        key, data = [], []
+        for g in G:
+            cont = gcd(g.coefficients())
+            g = g.map_coefficients(lambda c: c//cont)
+            inv = ~g.lc().lc()
+            key.append(tuple(g.exp()))
+            data.append({(tuple(e), tuple(f)): ZZ(a*inv)
+                         for e, c in g.dict().items() for f, a in c.dict().items()})
+        return tuple(key), data
+
+    if ncpus > 1:
+        @parallel(ncpus=ncpus)
+        def forked_image(p):
+            return image(p)
+
+    def rebuild(cand):
+        G = []
+        for data in cand:
+            den = lcm([a.denominator() for a in data.values()])
+            coeffs = {}
+            for (e, f), a in data.items():
+                coeffs.setdefault(e, {})[f] = ZZ(a*den)
+            G.append(A({e: R(RQ(c)) for e, c in coeffs.items()}))
+        return G
+
+    def check(G):
+        for g in gens:
+            if not g.reduce(G, normalize=True, coerce=False).is_zero():
+                return False
+        for i in range(len(G)):
+            for j in range(i):
+                u, v = G[i], G[j]
+                t = u.exp().emax(v.exp())
+                uterm = v.lc()*prod(x**k for x, k in zip(X, t.esub(u.exp())))
+                vterm = u.lc()*prod(x**k for x, k in zip(X, t.esub(v.exp())))
+                if not (uterm*u - vterm*v).reduce(G, normalize=True, coerce=False).is_zero():
+                    return False
+        return True
+
+    images = {}  # key -> [combined image, modulus, number of primes, last candidate]
+    p = MAX_MODULUS
+    while True:
+
+        primes = []
+        for _ in range(ncpus):
+            p = previous_prime(p)
+            primes.append(p)
+        if ncpus == 1:
+            new = [(p, image(p))]
+        else:
+            new = [(args[0][0], img) for args, img in forked_image(primes)]
+
+        for m, img in sorted(new, key=lambda u: u[0]):
+            if img is None:
+                info(2, "skipping modulus " + str(m))
+                continue
+            key, W = img
+            if key not in images:
+                if images:
+                    info(1, "modulus " + str(m) + " gives new leading monomials")
+                images[key] = [W, m, 1, None]
+                continue
+            V, M = images[key][:2]
+            V = [{e: crt(v.get(e, 0), w.get(e, 0), M, m) for e in set(v).union(w)}
+                 for v, w in zip(V, W)]
+            images[key][:3] = [V, M*m, images[key][2] + 1]
+
+        if not images:
+            continue
+        key = max(images, key=lambda k: images[k][2])
+        V, M, _, last = images[key]
+        info(1, datetime.today().ctime() + ": " + str(M.nbits()) + " bits of modulus")
+
+        try:
+            cand = [{e: ZZ(a).rational_reconstruction(M) for e, a in v.items()} for v in V]
+        except (ValueError, ArithmeticError):
+            continue
+        if cand == last:
+            G = rebuild(cand)
+            if check(G):
+                info(1, "completion completed, Groebner basis has " + str(len(G)) + " elements.")
+                return G
+            info(1, "reconstruction failed, adding more primes")
+        images[key][3] = cand
+
+
 def fglm(algebra, one_vector, gen_matrices, infolevel=0, solver=None, early_termination=False):
     """
     Constructs a Groebner basis using linear algebra.
@@ -1280,22 +1588,54 @@ def solve_triangular_system(mat, rhs, solver=None):
     """
 
     n = len(mat)
-    m = len(mat[0])
 
     for i in range(n):
         for j in range(i):
             assert mat[i][j].is_zero()
 
-    sol = tuple(([0]*len(mat), [1 if i == j else 0 for j in range(len(rhs))]) for i in range(len(rhs)))  # init
+    return _solve_triangular_system(mat, rhs, solver=solver)[0]
+
+
+def _solve_triangular_system(mat, rhs, solver=None, previous=None):
+    """
+    Same as solve_triangular_system, but also returns the list of bases of the
+    solution spaces of the subsystems consisting of the rows i,...,m-1, for
+    i=0,...,m-1.
+
+    If ``previous`` is not ``None``, it must be the list of bases returned by
+    a call to this function for the right hand sides ``rhs[:-1]``. The solutions
+    which do not involve the last right hand side are then taken from there, so
+    that the subsystems need only be solved again as long as the last right
+    hand side contributes to their solutions.
+    """
+    m = len(mat[0])
+    r = len(rhs)
+
+    sol = tuple(([0]*len(mat), [1 if i == j else 0 for j in range(r)]) for i in range(r))  # init
+    if previous is not None:
+        new = sol[-1]  # partial solution involving the last right hand side, if any
+    levels = [None]*m
     for i in range(m - 1, -1, -1):
-        xrhs = tuple(sum(s[1][j]*rhs[j][i] for j in range(len(rhs)))-sum(mat[i][j](s[0][j]) for j in range(i+1, m)) for s in sol)
+        if previous is not None:
+            old = [(s[0], s[1] + [ZZ.zero()]) for s in previous[i]]
+            if new is None:
+                levels[i] = sol = old
+                continue
+        xrhs = tuple(sum(s[1][j]*rhs[j][i] for j in range(r))-sum(mat[i][j](s[0][j]) for j in range(i+1, m)) for s in sol)
         xsol = list(map(list, mat[i][i].rational_solutions(rhs=xrhs, solver=solver)))
+        if previous is not None:
+            # the solutions in which the last element of sol does not appear
+            # are spanned by the old ones
+            xsol = [s for s in xsol if s[-1] != 0][:1]
         for k in range(len(xsol)):
             xsol[k][0] = [xsol[k][0]]*(i+1) + [sum(xsol[k][l+1]*sol[l][0][j] for l in range(len(xrhs))) for j in range(i+1, m)]
-            xsol[k] = (xsol[k][0], [sum(xsol[k][l+1]*sol[l][1][j] for l in range(len(xrhs))) for j in range(len(rhs))])
-        sol = xsol
+            xsol[k] = (xsol[k][0], [sum(xsol[k][l+1]*sol[l][1][j] for l in range(len(xrhs))) for j in range(r)])
+        if previous is not None:
+            new = xsol[0] if xsol else None
+            xsol = old + xsol
+        levels[i] = sol = xsol
 
-    return sol
+    return sol, levels
 
 
 smallest_lt_first = cmp_to_key(
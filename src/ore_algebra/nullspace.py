@@ -176,6 +176,7 @@ from sage.arith.all import CRT_basis, xgcd, gcd, lcm, previous_prime as pp
 from sage.misc.all import prod
 from sage.misc.cachefunc import cached_function
 from sage.misc.lazy_string import lazy_string
+from sage.misc.prandom import sample
 from sage.rings.polynomial.polynomial_element import Polynomial
 from sage.rings.polynomial.polynomial_ring_constructor import PolynomialRing
 from sage.rings.polynomial.multi_polynomial_libsingular import MPolynomialRing_libsingular
@@ -518,7 +519,12 @@ def gauss(pivot=_pivot, ncpus=1, fun=None):
       The default function chooses `(i,j)` such that ``mat`` has many zeros in row `i` and column `j`,
       and ``mat[i][j]`` has a small number of terms. 
       
-    - ``ncpus`` -- maximum number of cpus that may be used in parallel by this solver
+    - ``ncpus`` -- maximum number of cpus that may be used in parallel by this solver. If greater
+      than 1, the rows affected by the elimination step for a pivot are split into ``ncpus`` groups,
+      which are eliminated and freed from their content in parallel by forked processes, provided
+      that the step involves enough coefficient operations to outweigh the cost of forking. Likewise,
+      the backward substitution is done for groups of nullspace basis vectors in parallel if it is
+      expensive enough.
     
     - ``fun`` -- if different from ``None``, at the beginning of each iteration of the outer loops of
       forward and backward elimination, the solver calls ``fun(mat, idx)``, where ``mat`` is the current
@@ -539,6 +545,11 @@ def gauss(pivot=_pivot, ncpus=1, fun=None):
        sage: A*V[0]
        (0, 0, 0, 0)
 
+       sage: A = MatrixSpace(ZZ['x'], 12, 15).random_element(degree=2)
+       sage: V = gauss(ncpus=2)(A)
+       sage: len(V), all(not any(A*v) for v in V)
+       (3, True)
+
     ALGORITHM: fraction-free gaussian elimination with heuristic content removal and Markoviz pivot search.
     """
     def gauss_solver(mat, degrees=[], infolevel=0):
@@ -557,9 +568,6 @@ def _gauss(pivot, ncpus, fun, mat, degrees, infolevel):
     one = R.one()
     _launch_info(infolevel, "gauss", dim=(n, m), domain=R)
 
-    if ncpus > 1:
-        print("Parallel gaussian elimination not yet implemented. Proceeding sequentially...")
-
     if n == 0:
         return [vector(R, v) for v in VectorSpace(QQ, m).basis()]
     mat = list(filter(any, [ [ R(el) for el in row ] for row in mat ] )) # discard zero rows.
@@ -572,6 +580,17 @@ def _gauss(pivot, ncpus, fun, mat, degrees, infolevel):
     for j in range(m):
         col_perm[j] = j
 
+    if ncpus > 1:
+        # the forked processes read the current state of mat from their copy of the
+        # parent's memory, so only row indices are passed and only new rows are returned.
+        @parallel(ncpus=ncpus)
+        def forked_eliminate(r, c, rows):
+            return _gauss_eliminate(mat[r], [mat[i] for i in rows], c, m, R, cancel_constants)
+
+        @parallel(ncpus=ncpus)
+        def forked_substitute(r, js):
+            return _gauss_substitute(mat, r, m, [sol[j] for j in js], zero, one, 0)
+
     _info(infolevel, "forward elimination...", alter = -1)
 
     # forward elimination
@@ -594,38 +613,21 @@ def _gauss(pivot, ncpus, fun, mat, degrees, infolevel):
             mati[c], mati[pc] = mati[pc], mati[c]
         col_perm[c], col_perm[pc] = col_perm[pc], col_perm[c]
         
-        # 2. perform elimination
-        affected_rows = []
-        for i in range(r + 1, n):
-            if mat[i][c]:
-                affected_rows.append(i)
-                matr = mat[r]
-                piv = matr[c]
-                mati = mat[i]
-                elim = mati[c]
-                g = gcd(piv, elim)
-                if not g.is_one():
-                    piv //= g
-                    elim //= g
-                del g
-                for j in range(c + 1, m):
-                    mati[j] = (piv*mati[j] - elim*matr[j])
-                mati[c] = zero
-
-        # 3. cancel common content of all affected rows
-        l = len(affected_rows)
-        my_rows = affected_rows[:l//2] if l >= 4 else affected_rows
-        g = heuristic_row_content([mat[i][j] for i in my_rows for j in range(c + 1, m) if mat[i][j]], R)
-        for i in affected_rows:
-            mat[i][c:] = cancel_heuristic_content(g, mat[i][c:], cancel_constants)
-        del g
-
-        # 4. cancel remaining content of individual rows
-        for i in affected_rows:
-            row = mat[i][c:]
-            g = heuristic_row_content(row, R)
-            mat[i][c:] = cancel_heuristic_content(g, row, cancel_constants)
-            del g
+        # 2. perform elimination and cancel content of the affected rows
+        affected_rows = [ i for i in range(r + 1, n) if mat[i][c] ]
+        # forking and sending back the rows only pays off for large enough elimination steps
+        if (ncpus > 1 and len(affected_rows) >= 2*ncpus
+                and _gauss_work(mat[r], len(affected_rows), c, m) >= _GAUSS_FORK_WORK):
+            chunks = [ tuple(affected_rows[k::ncpus]) for k in range(ncpus) ]
+            for ((_, _, rows), _), new_rows in forked_eliminate([ (r, c, rows) for rows in chunks ]):
+                if not isinstance(new_rows, list): # 'NO DATA' if the worker failed
+                    raise RuntimeError("elimination failed in forked process")
+                for i, row in zip(rows, new_rows):
+                    mat[i] = row
+        else:
+            new_rows = _gauss_eliminate(mat[r], [mat[i] for i in affected_rows], c, m, R, cancel_constants)
+            for i, row in zip(affected_rows, new_rows):
+                mat[i] = row
 
         r = r + 1
 
@@ -641,15 +643,110 @@ def _gauss(pivot, ncpus, fun, mat, degrees, infolevel):
     for i in range(dim):
         sol[-i-1][-i-1] = one
 
+    if ncpus > 1 and dim > 1 and _gauss_substitute_work(mat, r, m, dim) >= _GAUSS_FORK_WORK:
+        chunks = [ tuple(range(k, dim, ncpus)) for k in range(min(ncpus, dim)) ]
+        for ((_, js), _), new_sol in forked_substitute([ (r, js) for js in chunks ]):
+            if not isinstance(new_sol, list): # 'NO DATA' if the worker failed
+                raise RuntimeError("backward substitution failed in forked process")
+            for j, v in zip(js, new_sol):
+                sol[j] = v
+    else:
+        sol = _gauss_substitute(mat, r, m, sol, zero, one, infolevel)
+
+    col_perm_inv = {}
+    for j in range(m):
+        col_perm_inv[col_perm[j]] = j
+
+    sol = [[v[col_perm_inv[i]] for i in range(m)] for v in sol]
+
+    for v in sol:
+        g = heuristic_row_content([p for p in v if p], R)
+        v[:] = cancel_heuristic_content(g, v)
+
+    return _normalize([vector(R, v) for v in sol])
+
+# minimal value of _gauss_work() for which an elimination step is done in parallel
+_GAUSS_FORK_WORK = 10**6
+
+def _gauss_work(matr, nrows, c, m):
+    r"""
+    Rough estimate of the number of coefficient operations needed by nullspace.gauss_ for
+    eliminating column ``c`` from ``nrows`` rows using the pivot row ``matr``.
+    """
+    try:
+        terms = sum(el.number_of_terms() for el in matr[c + 1:m] if el)
+        return nrows*matr[c].number_of_terms()*terms
+    except AttributeError: # entries are not polynomials
+        return nrows*(m - c)
+
+def _gauss_substitute_work(mat, r, m, dim):
+    r"""
+    Rough estimate of the number of coefficient operations needed by the backward substitution
+    of nullspace.gauss_ for ``dim`` solution vectors, using the first ``r`` rows of ``mat``.
+    The entries of the solution vectors are assumed to have about as many terms as the pivots.
+    """
+    try:
+        terms = sum(el.number_of_terms() for row in mat[:r] for el in row[:m] if el)
+        pivot_terms = sum(mat[i][i].number_of_terms() for i in range(r))
+        return dim*terms*(pivot_terms//max(r, 1) + 1)
+    except AttributeError: # entries are not polynomials
+        return dim*r*m
+
+def _gauss_eliminate(matr, rows, c, m, R, cancel_constants):
+    r"""
+    Eliminates the entries in column ``c`` of the given ``rows`` using the pivot row ``matr``
+    and removes the content of the resulting rows. The entries before column ``c`` are
+    assumed to be zero. Returns the list of new rows; the input rows are modified in place.
+
+    Used by nullspace.gauss_; one call handles all rows affected by a pivot (or, in the
+    parallel version, a share of them).
+    """
+    zero = R.zero()
+    piv0 = matr[c]
+    for mati in rows:
+        piv = piv0
+        elim = mati[c]
+        g = gcd(piv, elim)
+        if not g.is_one():
+            piv //= g
+            elim //= g
+        del g
+        for j in range(c + 1, m):
+            mati[j] = (piv*mati[j] - elim*matr[j])
+        mati[c] = zero
+
+    # cancel common content of all rows
+    l = len(rows)
+    my_rows = rows[:l//2] if l >= 4 else rows
+    g = heuristic_row_content([mati[j] for mati in my_rows for j in range(c + 1, m) if mati[j]], R)
+    for mati in rows:
+        mati[c:] = cancel_heuristic_content(g, mati[c:], cancel_constants)
+    del g
+
+    # cancel remaining content of individual rows
+    for mati in rows:
+        row = mati[c:]
+        g = heuristic_row_content(row, R)
+        mati[c:] = cancel_heuristic_content(g, row, cancel_constants)
+        del g
+
+    return rows
+
+def _gauss_substitute(mat, r, m, sol, zero, one, infolevel):
+    r"""
+    Backward substitution for nullspace.gauss_: completes the given partial solution
+    vectors ``sol`` using the first ``r`` rows of the echelon form ``mat``. The vectors
+    are independent from each other, so any subset of them can be processed separately.
+    Returns the list of completed vectors.
+    """
     for i in range(r - 1, -1, -1):
         _info(infolevel, "Coordinate ", i, alter = -2)
         mati = mat[i]
-        for j in range(dim):
-            solj = sol[j]
+        for solj in sol:
             num = -sum(mati[k]*solj[k] for k in range(i + 1, m) if mati[k] and solj[k])
             if num == zero:
                 continue
-            den = mati[i] 
+            den = mati[i]
             # now solj[i] = num/den, but we do it without rational functions
             g = gcd(num, den)
             if g != one:
@@ -663,18 +760,7 @@ def _gauss(pivot, ncpus, fun, mat, degrees, infolevel):
                 for k in range(i + 1, m):
                     solj[k] *= den
             solj[i] = num
-
-    col_perm_inv = {}
-    for j in range(m):
-        col_perm_inv[col_perm[j]] = j
-
-    sol = [[v[col_perm_inv[i]] for i in range(m)] for v in sol]
-
-    for v in sol:
-        g = heuristic_row_content([p for p in v if p], R)
-        v[:] = cancel_heuristic_content(g, v)
-
-    return _normalize([vector(R, v) for v in sol])
+    return sol
 
 def hermite(early_termination=True):
     r"""
@@ -707,12 +793,14 @@ def hermite(early_termination=True):
         return _hermite(early_termination, mat, degrees, infolevel)
     return hermite_solver
 
-def _hermite(early_termination, mat, degrees, infolevel, truncate=None):
+def _hermite(early_termination, mat, degrees, infolevel, truncate=None, return_degrees=False):
     r"""
     internal version of nullspace.hermite_.
     """
     # if the truncate option is set to an integer, approximation proceeds to order x^truncate
     # and, if len(degrees)>0, only solutions whose degree is at most degrees[0] are returned. 
+    # if return_degrees is set to True, the degrees of all the vectors of the approximant basis,
+    # including those which were discarded, are returned as well.
     
     n, m = mat.dimensions()
     matdeg = max( mat[i,j].degree() for i in range(n) for j in range(m) )
@@ -730,6 +818,7 @@ def _hermite(early_termination, mat, degrees, infolevel, truncate=None):
     V, done = _hermite_rec(early_termination, R, mat, deg + 1, [0 for i in range(m) ], \
                            _alter_infolevel(infolevel, -1, 1))
     V = V.transpose()
+    basis_degrees = [max(p.degree() for p in v) for v in V]
     if truncate is not None:
         if len(degrees) > 0:
             V = [ v for v in V if max(p.degree() for p in v) <= degrees[0] ] 
@@ -745,6 +834,8 @@ def _hermite(early_termination, mat, degrees, infolevel, truncate=None):
             piv = one/_leading_coefficient(v[j])
             for k in range(j, m):
                 v[k] *= piv
+    if return_degrees:
+        return list(V), basis_degrees
     return list(V)
 
 def _hermite_base(early_termination, R, A, u, D):
@@ -857,6 +948,10 @@ def _hermite_rec(early_termination, R, A, cut, offset, infolevel):
        The ``offset`` vector will be updated to :math:`[\max_i( \deg(V_{i,j}) + \mathrm{offset}[i] ), j=0,\dots,n-1]`
     """
 
+    # only the coefficients of x^0, ..., x^(cut-1) of A matter
+    if any(A[i,j].degree() >= cut for i in range(A.nrows()) for j in range(A.ncols())):
+        A = A.apply_map(lambda p: p.truncate(cut))
+
     # 0. if cut is small, switch to direct method
     if cut <= 64:
         # B = low degree coeffs of A.
@@ -879,8 +974,10 @@ def _hermite_rec(early_termination, R, A, cut, offset, infolevel):
     if done: # we don't check for false alarm
         return V0, done
 
-    # 3. set B=A1*V0 rem x^ceil(k/2)
-    B = (A*V0).apply_map(lambda p : p.shift(-cut2))
+    # 3. set B=A1*V0 rem x^ceil(k/2), computing only the coefficients needed
+    B = Matrix(R, A.nrows(), V0.ncols(),
+               [[sum(A[i,k]._mul_trunc_(V0[k,j], cut) for k in range(A.ncols())).shift(-cut2)
+                 for j in range(V0.ncols())] for i in range(A.nrows())])
     
     # 4. compute V1 such that B*V1 == 0 mod x^ceil(k/2) recursively
     _info(infolevel, "descending into second recursive call...")
@@ -1323,7 +1420,7 @@ def galois(subsolver, max_modulus=MAX_MODULUS, proof=False):
 def _galois(subsolver, max_modulus, proof, mat, degrees, infolevel):
     raise NotImplementedError
 
-def cra(subsolver, max_modulus=MAX_MODULUS, proof=False, ncpus=1):
+def cra(subsolver, max_modulus=MAX_MODULUS, proof=False, ncpus=1, sample_size=None):
     r"""
     Creates a subsolver based on chinese remaindering for matrices over `K[x]` or `K[x,y,..]` where
     `K` is `ZZ` or `QQ` or `GF(p)`.
@@ -1338,6 +1435,11 @@ def cra(subsolver, max_modulus=MAX_MODULUS, proof=False, ncpus=1):
     - ``proof`` -- a boolean value. If set to ``False`` (default), a termination is only tested in a
       homomorphic image, which saves much time but may, with a very low probability, lead to a wrong output.
     - ``ncpus`` -- number of cpus that may be used in parallel by the solver (default=1).
+    - ``sample_size`` -- a positive integer or ``None`` (default). If an integer is given, rational
+      reconstruction is attempted after each prime only for a random sample of this many coefficients
+      of each solution vector, and the remaining coefficients are only reconstructed once the sampled
+      ones have stabilised and the candidate has passed the termination check. If the check fails,
+      the sample size is doubled. If set to ``None``, all coefficients are reconstructed after each prime.
 
     OUTPUT:
 
@@ -1353,6 +1455,11 @@ def cra(subsolver, max_modulus=MAX_MODULUS, proof=False, ncpus=1):
        sage: A*V[0]
        (0, 0, 0, 0)
 
+       sage: A = MatrixSpace(QQ['x'], 6, 9).random_element(degree=4)
+       sage: V = cra(gauss(), sample_size=5)(A)
+       sage: len(V), A*V[0]
+       (3, (0, 0, 0, 0, 0, 0))
+
     ALGORITHM:
 
     #. If the coefficient domain is a finite field, the problem is delegated to the subsolver and we return
@@ -1360,7 +1467,9 @@ def cra(subsolver, max_modulus=MAX_MODULUS, proof=False, ncpus=1):
     #. For various word-size primes `p`, reduce the coefficients in ``mat`` modulo `p` and call the
        subsolver on the resulting matrix.
     #. Using the Chinese Reminder Algorithm and rational reconstruction, combine these results to a solution
-       candidate with integer coefficients.
+       candidate with integer coefficients. If ``sample_size`` is given, the candidate is only formed once
+       the rational reconstructions of the sampled coefficients agree for two consecutive primes, and
+       it is obtained by multiplying with the common denominator of the sampled coefficients.
     #. If this solution candidate is correct, return it and stop. If ``proof`` is set to ``True``, this check
        is performed rigorously, otherwise (default) only modulo some prime.
     #. If the solution candidate is not correct, consider some more primes and try again.
@@ -1368,10 +1477,10 @@ def cra(subsolver, max_modulus=MAX_MODULUS, proof=False, ncpus=1):
     """
     def cra_solver(mat, degrees=[], infolevel=0) :
         r"""See docstring of cra() for further information."""
-        return _cra(subsolver, max_modulus, proof, ncpus, mat, degrees, infolevel)
+        return _cra(subsolver, max_modulus, proof, ncpus, sample_size, mat, degrees, infolevel)
     return cra_solver
 
-def _cra(subsolver, max_modulus, proof, ncpus, mat, degrees, infolevel):
+def _cra(subsolver, max_modulus, proof, ncpus, sample_size, mat, degrees, infolevel):
     r"""
     Internal version of nullspace.cra_ 
     """
@@ -1393,7 +1502,26 @@ def _cra(subsolver, max_modulus, proof, ncpus, mat, degrees, infolevel):
     check_eval = [ 17*j + 13 for j in range(len(x)) ]
     check_field = GF(check_prime)
     check_mat = mat.apply_map( lambda pol : pol(*check_eval), check_field )
-    
+
+    def check(w):
+        # termination check for a solution candidate w with integer coefficients
+        if proof:
+            return not any(mat * w)
+        return not any(check_mat * vector(check_field, [e(*check_eval) for e in w]))
+
+    # material used for incremental reconstruction (only if sample_size is not None):
+    # positions[i] is a list of pairs (j, k) referring to the coefficient of the monomial
+    # with exponent k in the j-th entry of the i-th solution vector, and last_recon holds
+    # the rational reconstructions of these coefficients obtained in the previous round.
+    positions = last_recon = None
+
+    def choose_positions(size):
+        pos = []
+        for v in V:
+            pos_v = [ (j, k) for j, e in enumerate(v) for k in e.dict() ]
+            pos.append(sample(pos_v, min(size, len(pos_v))))
+        return pos
+
     V = None
     M = 1
     p = check_prime
@@ -1454,6 +1582,9 @@ def _cra(subsolver, max_modulus, proof, ncpus, mat, degrees, infolevel):
             M = m
             degrees = true_degrees
             _info(infolevel, "expecting solution degrees ", degrees, alter = -1)
+            if sample_size is not None:
+                positions = choose_positions(sample_size)
+                last_recon = None
         elif len(V) < len(Vp): # this prime is unlucky, skip it
             _info(infolevel, "unlucky modulus ", m, " discarded (dimension defect)", alter = -1)
             continue
@@ -1472,6 +1603,33 @@ def _cra(subsolver, max_modulus, proof, ncpus, mat, degrees, infolevel):
                 for j in range(len(V[i])):
                     Vi[j] = Vi[j]*M0 + R(Vpi[j])*p0
         
+        if sample_size is not None:
+            # incremental reconstruction: only the sampled coefficients are reconstructed,
+            # and everything else only after they have stabilised.
+            try:
+                recon = [ [ ZZ(V[i][j].dict().get(k, 0)).rational_reconstruction(M) for j, k in positions[i] ]
+                          for i in range(len(V)) ]
+            except (ValueError, ArithmeticError):
+                continue
+            if recon != last_recon:
+                last_recon = recon
+                continue
+            sol = []
+            m = M//2
+            for v, r in zip(V, recon):
+                d = lcm([c.denominator() for c in r] + [ZZ.one()])
+                w = vector(R, [e.map_coefficients( lambda c: ((d*c + m) % M) - m, ZZ ) for e in v ])
+                if not check(w):
+                    break # more primes needed
+                sol.append(w)
+            else:
+                return sol
+            sample_size *= 2
+            _info(infolevel, "sampled coefficients stabilised too early; increasing sample size to ", sample_size, alter = -1)
+            positions = choose_positions(sample_size)
+            last_recon = None
+            continue
+
         # rational reconstruction and check for termination
         try:
             sol = []
@@ -1482,8 +1640,7 @@ def _cra(subsolver, max_modulus, proof, ncpus, mat, degrees, infolevel):
                     for c in e.coefficients():
                         d *= (d*c).rational_reconstruction(M).denominator()
                 w = vector(R, [e.map_coefficients( lambda c: ((d*c + m) % M) - m, ZZ ) for e in v ])
-                if (not proof and any(check_mat * vector(check_field, [e(*check_eval) for e in w]))) or \
-                       (proof and any(mat * w) ):
+                if not check(w):
                     raise ArithmeticError # more primes needed
                 sol.append(w)
             return sol # if no error was raised for any of the v in V, then we are done        
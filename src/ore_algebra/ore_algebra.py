@@ -43,8 +43,6 @@ AUTHOR:
 #  https://www.gnu.org/licenses/                                             #
 #############################################################################
 
-import sys
-
 from sage.categories.algebras import Algebras
 from sage.categories.pushout import ConstructionFunctor
 from sage.misc.cachefunc import cached_method
@@ -94,28 +92,48 @@ if True:
 """
 
 
-def taylor_shift_univ_int_poly(p, i):
-    # assuming that p is an element of ZZ['x']
-    return p(p.parent().gen() + i)
+try:
+    from .shift_c import taylor_shift as _taylor_shift_flint
+except ImportError:
+    _taylor_shift_flint = None
+
+
+def taylor_shift_univ_poly(p, c):
+    r"""
+    Returns ``p(x + c)``, where ``x`` is the generator of the parent of ``p``.
+
+    The Taylor shift functions of FLINT are used when possible.
 
+    EXAMPLES::
 
-def taylor_shift_univ_int_ratfun(q, i):
-    # assuming that q is an element of Frac(ZZ['x'])
-    num = taylor_shift_univ_int_poly(q.numerator(), i)
-    den = taylor_shift_univ_int_poly(q.denominator(), i)
-    return q.parent()(num, den, coerce=False, reduce=False)
+        sage: from ore_algebra.ore_algebra import taylor_shift_univ_poly
+        sage: x = polygen(QQ, 'x')
+        sage: taylor_shift_univ_poly(x^2 + 1/3, 2)
+        x^2 + 4*x + 13/3
+        sage: taylor_shift_univ_poly(x^2 + 1/3, 1/2)
+        x^2 + x + 7/12
+    """
+    if _taylor_shift_flint is not None:
+        q = _taylor_shift_flint(p, c)
+        if q is not None:
+            return q
+    return p(p.parent().gen() + c)
 
 
-def taylor_shift_univ_modp_poly(p, i):
-    # assuming that p is an element of GF(m)['x']
-    return p(p.parent().gen() + i)
+def taylor_shift_univ_ratfun(q, c):
+    r"""
+    Returns ``q(x + c)``, where ``x`` is the generator of the parent of ``q``,
+    for a univariate rational function ``q``.
+    """
+    num = taylor_shift_univ_poly(q.numerator(), c)
+    den = taylor_shift_univ_poly(q.denominator(), c)
+    K = q.parent()
+    return K.element_class(K, num, den, coerce=False, reduce=False)
 
 
-def taylor_shift_univ_modp_ratfun(q, i):
-    # assuming that q is an element of Frac(GF(m)['x'])
-    num = taylor_shift_univ_modp_poly(q.numerator(), i)
-    den = taylor_shift_univ_modp_poly(q.denominator(), i)
-    return q.parent()(num, den, coerce=False, reduce=False)
+# backward compatibility
+taylor_shift_univ_int_poly = taylor_shift_univ_modp_poly = taylor_shift_univ_poly
+taylor_shift_univ_int_ratfun = taylor_shift_univ_modp_ratfun = taylor_shift_univ_ratfun
 
 
 def is_OreAlgebra(A):
@@ -234,14 +252,34 @@ class Sigma_class:
         self.__is_identity = is_id
         self.__powers = {1: my_dict}
 
+        # Detect shifts x -> x + c of univariate polynomials and rational
+        # functions, which are applied using Taylor shifts
+        self.__shift = None
+        Rpol = R.ring() if isinstance(R, FractionField_generic) else R
+        if not is_id and isinstance(Rpol, PolynomialRing_general):
+            x = Rpol.gen()
+            try:
+                c = Rpol(my_dict[str(x)] - x)
+            except (TypeError, ValueError):
+                c = None
+            if c is not None and c.degree() == 0:
+                self.__shift = c[0]
+                self.__is_field = Rpol is not R
+
     def __call__(self, p, exp=1):
 
         if self.__is_identity:
             return p
-        elif exp == 1:
-            return self.__R(p)(**self.__dict)
         elif exp == 0:
             return p
+        elif self.__shift is not None:
+            p = self.__R(p)
+            if self.__is_field:
+                return taylor_shift_univ_ratfun(p, exp*self.__shift)
+            else:
+                return taylor_shift_univ_poly(p, exp*self.__shift)
+        elif exp == 1:
+            return self.__R(p)(**self.__dict)
         elif exp > 1:
 
             pows = self.__powers
@@ -256,10 +294,10 @@ class Sigma_class:
                 if n in pows:
                     return pows[n].copy()
                 elif n % 2 == 0:
-                    d = pow_dict(n/2)
+                    d = pow_dict(n//2)
                     pows[n] = d = merge(d, d)
                 else:
-                    d = pow_dict((n - 1)/2)
+                    d = pow_dict((n - 1)//2)
                     pows[n] = d = merge(merge(d, d), self.__dict)
                 return d
 
@@ -276,6 +314,24 @@ class Sigma_class:
     def is_identity(self):
         return self.__is_identity
 
+    def _shift_amount(self):
+        r"""
+        Returns `c` if ``self`` is the shift `x \mapsto x + c` of a univariate
+        polynomial ring or rational function field, and ``None`` otherwise.
+
+        EXAMPLES::
+
+            sage: from ore_algebra.ore_algebra import Sigma_class
+            sage: R.<x> = ZZ['x']
+            sage: Sigma_class(R, {x: x - 2})._shift_amount()
+            -2
+            sage: Sigma_class(R.fraction_field(), {x: x + 1})(1/x, 3)
+            1/(x + 3)
+            sage: Sigma_class(R, {x: 2*x})._shift_amount() is None
+            True
+        """
+        return self.__shift
+
     def dict(self):
         r"""
         Returns a dictionary representing ``self``
@@ -438,6 +494,17 @@ class Delta_class:
        sage: sorted(delta.dict().items(), key=str)
        [('x1', 1), ('x3', x3)]
 
+    Derivations and finite differences of univariate polynomials and rational
+    functions are computed directly::
+
+       sage: R.<x> = QQ['x']
+       sage: K = R.fraction_field()
+       sage: delta = Delta_class(K, {x: 2}, Sigma_class(K, {x: x + 1}))
+       sage: delta(1/x)
+       -2/(x^2 + x)
+       sage: delta(x^2)
+       4*x + 2
+
     """
 
     def __init__(self, R, d, s):
@@ -471,6 +538,22 @@ class Delta_class:
         self.__dict = my_dict
         self.__sigma = s
 
+        # On univariate polynomials and rational functions, delta = u*d/dx
+        # when sigma is the identity, and delta = u*(sigma - 1) when sigma is
+        # a shift (since any sigma-derivation is determined by its value on
+        # the generator). Store the factor u in these cases.
+        self.__factor = None
+        self.__Rpol = Rpol = R.ring() if isinstance(R, FractionField_generic) else R
+        if not is_zero and isinstance(Rpol, PolynomialRing_general):
+            dx = my_dict[str(Rpol.gen()), 1]
+            if s.is_identity():
+                self.__factor = dx
+            elif s._shift_amount() is not None:
+                try:
+                    self.__factor = R(dx/s._shift_amount())
+                except (TypeError, ValueError):
+                    pass
+
     def __call__(self, p):
 
         if self.__is_zero:
@@ -484,6 +567,12 @@ class Delta_class:
             return R.zero()
 
         R0 = p.parent()
+        if self.__factor is not None and (R0 is R or R0 is self.__Rpol):
+            if sigma.is_identity():
+                return p.derivative()*self.__factor
+            else:
+                return (sigma(p) - p)*self.__factor
+
         if isinstance(R0, FractionField_generic):
             a = p.numerator()
             b = p.denominator()
@@ -949,20 +1038,6 @@ def OreAlgebra(base_ring, *generators, check_base_ring=True, **kwargs):
             elif dx == zero:
                 if sx - x == one:
                     is_shift[i] = True
-                    if R.base_ring() is ZZ and R.ngens() == 1:
-                        if R.is_field():
-                            gens[i][1].set_call(lambda q, k=1: taylor_shift_univ_int_ratfun(R(q), k))
-                            gens[i][1].inverse().set_call(lambda q, k=1: taylor_shift_univ_int_ratfun(R(q), -k))
-                        else:
-                            gens[i][1].set_call(lambda p, k=1: taylor_shift_univ_int_poly(R(p), k))
-                            gens[i][1].inverse().set_call(lambda p, k=1: taylor_shift_univ_int_poly(R(p), -k))
-                    elif 0 < R.characteristic() < sys.maxsize and R.ngens() == 1:
-                        if R.is_field():
-                            gens[i][1].set_call(lambda q, k=1: taylor_shift_univ_modp_ratfun(R(q), k))
-                            gens[i][1].inverse().set_call(lambda q, k=1: taylor_shift_univ_modp_ratfun(R(q), -k))
-                        else:
-                            gens[i][1].set_call(lambda p, k=1: taylor_shift_univ_modp_poly(R(p), k))
-                            gens[i][1].inverse().set_call(lambda p, k=1: taylor_shift_univ_modp_poly(R(p), -k))
                 elif gens[i][1](sx)*x == sx**2:
                     is_qshift[i] = True
             elif dx == x:
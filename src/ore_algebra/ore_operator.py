@@ -20,14 +20,26 @@ from functools import reduce
 
 from sage.structure.element import RingElement, canonical_coercion
 from sage.structure.richcmp import richcmp
-from sage.arith.all import gcd, lcm
+from sage.arith.all import gcd, lcm, previous_prime, xgcd
+from sage.arith.multi_modular import MAX_MODULUS
 from sage.rings.infinity import infinity
 from sage.rings.power_series_ring_element import PowerSeries
 from sage.rings.laurent_series_ring import LaurentSeriesRing
 from sage.rings.laurent_series_ring_element import LaurentSeries
 from sage.functions.generalized import sign
+from sage.matrix.constructor import matrix
+from sage.misc.cachefunc import cached_function
+from sage.misc.misc_c import prod
+from sage.parallel.decorate import parallel
+from sage.rings.finite_rings.all import GF
+from sage.rings.fraction_field import FractionField_generic
+from sage.rings.integer_ring import ZZ
+from sage.rings.rational_field import QQ
+from sage.rings.number_field.number_field_base import NumberField
+from sage.rings.polynomial.polynomial_ring import PolynomialRing_general
 
 from .generalized_series import ContinuousGeneralizedSeries, GeneralizedSeriesMonoid
+from .nullspace import _rational_reconstruction
 
 class OreOperator(RingElement):
     """
@@ -806,6 +818,14 @@ class UnivariateOreOperator(OreOperator):
             return right
 
         R = self.parent() # Ore algebra
+
+        if min(self.order(), right.order()) >= _MUL_EVAL_INTERP_THRESHOLD:
+            kind = _eval_interp_mul_kind(R)
+            if kind == "D":
+                return R(_mul_eval_interp_D(self, right))
+            elif kind == "S":
+                return R(_mul_eval_interp_S(self, right))
+
         sigma = R.sigma()
         delta = R.delta()
         D = R.associated_commutative_algebra().gen()
@@ -952,6 +972,12 @@ class UnivariateOreOperator(OreOperator):
         - ``other`` -- one or more operators which together with ``self`` can be coerced to a common parent.
         - ``prs`` (default: "essential") -- pseudo remainder sequence to be used. Possible values are
           "essential", "primitive", "classic", "subresultant", "monic".
+        - ``algorithm`` (default: "euclid") -- either "euclid", for the Euclidean algorithm with the
+          selected pseudo remainder sequence, or "modular", for computing the gcrd modulo several
+          primes and reconstructing it by Chinese remaindering and rational reconstruction. The
+          modular algorithm is only available for operators with coefficients in `K[x]` or `K(x)`
+          where `K` is ``ZZ`` or ``QQ``; the Euclidean algorithm is used in all other cases.
+        - ``ncpus`` (default: 1) -- number of primes to process in parallel in the modular algorithm.
         
         OUTPUT:
 
@@ -970,11 +996,27 @@ class UnivariateOreOperator(OreOperator):
            sage: L3, S, T = L1.xgcrd(L2)                             
            sage: S*L1 + T*L2 == L3
            True
+           sage: L1.gcrd(L2, algorithm="modular") == G.normalize()
+           True
+
+        The modular algorithm avoids the coefficient growth of the Euclidean algorithm::
+
+           sage: A.<Dx> = OreAlgebra(QQ['x'], 'Dx')
+           sage: x = A.base_ring().gen()
+           sage: G = (x^2 - 3/7)*Dx^2 + 5*x*Dx - 1
+           sage: L1 = ((x + 2)*Dx^3 - x^2*Dx + 7)*G
+           sage: L2 = (3*Dx^2 + (x^3 - 1)*Dx + 11/3*x)*G
+           sage: L1.gcrd(L2, algorithm="modular") == L1.gcrd(L2)
+           True
+           sage: L1.gcrd(L2, algorithm="modular", ncpus=2) == G.normalize()
+           True
+           sage: L1.gcrd(L2 + 1, algorithm="modular")
+           1
 
         """
 
         if len(other) > 1:
-            return reduce(lambda p, q: p.gcrd(q), other, self)
+            return reduce(lambda p, q: p.gcrd(q, **kwargs), other, self)
         elif len(other) == 0:
             return self
 
@@ -991,6 +1033,15 @@ class UnivariateOreOperator(OreOperator):
 
         prs = kwargs["prs"] if "prs" in kwargs else None
         infolevel = kwargs["infolevel"] if "infolevel" in kwargs else 0
+        algorithm = kwargs["algorithm"] if "algorithm" in kwargs else "euclid"
+
+        if algorithm == "modular":
+            ncpus = kwargs["ncpus"] if "ncpus" in kwargs else 1
+            g = self._gcrd_modular(other, "gcrd", ncpus, infolevel)
+            if g is not None:
+                return g
+        elif algorithm != "euclid":
+            raise ValueError("unknown algorithm: " + str(algorithm))
 
         r = (self,other)
         if (r[0].order()<r[1].order()):
@@ -1035,6 +1086,8 @@ class UnivariateOreOperator(OreOperator):
         - ``other`` -- one operator which together with ``self`` can be coerced to a common parent.
         - ``prs`` (default: "essential") -- pseudo remainder sequence to be used. Possible values are
           "essential", "primitive", "classic", "subresultant", "monic".
+        - ``algorithm`` (default: "euclid"), ``ncpus`` (default: 1) -- as in ``gcrd``. With
+          ``algorithm="modular"``, the cofactors are reconstructed along with the gcrd.
         
         OUTPUT:
 
@@ -1054,10 +1107,26 @@ class UnivariateOreOperator(OreOperator):
            sage: L3, S, T = L1.xgcrd(L2)                             
            sage: S*L1 + T*L2 == L3
            True
+           sage: L3, S, T = L1.xgcrd(L2, algorithm="modular")
+           sage: S*L1 + T*L2 == L3 == G.normalize()
+           True
 
         """
         prs = kwargs["prs"] if "prs" in kwargs else None
         infolevel = kwargs["infolevel"] if "infolevel" in kwargs else 0
+        algorithm = kwargs["algorithm"] if "algorithm" in kwargs else "euclid"
+
+        if algorithm == "modular":
+            if self.parent() is not other.parent():
+                A, B = canonical_coercion(self, other)
+                return A.xgcrd(B, **kwargs)
+            ncpus = kwargs["ncpus"] if "ncpus" in kwargs else 1
+            res = self._gcrd_modular(other, "bezout", ncpus, infolevel)
+            if res is not None:
+                return res
+        elif algorithm != "euclid":
+            raise ValueError("unknown algorithm: " + str(algorithm))
+
         return self._xeuclid(other, prs, "bezout", infolevel)
 
     def _xeuclid(self, other, prs=None, retval="bezout", infolevel=0):
@@ -1130,6 +1199,95 @@ class UnivariateOreOperator(OreOperator):
         c = RF.base_ring().one() if prs is __classicPRS__ else ~r.content()
         return (self.parent()(c*r), c*a11, c*a12) if self.order()>=other.order() else (self.parent()(c*r), c*a12, c*a11)
 
+    def _gcrd_modular(self, other, retval="gcrd", ncpus=1, infolevel=0):
+        r"""
+        Multi-modular computation of the gcrd of ``self`` and ``other``.
+
+        The gcrd, made monic, and if ``retval`` is "bezout", the corresponding
+        Bezout cofactors, are computed modulo several primes and reconstructed
+        by Chinese remaindering and rational reconstruction. Primes modulo which
+        the gcrd has a larger order, or the common denominator of the
+        coefficients of the monic gcrd and cofactors a smaller degree, than
+        modulo other primes, are discarded as unlucky. The reconstructed gcrd
+        is checked by pseudo-division (and the cofactors by evaluating the
+        Bezout relation) before being returned.
+
+        Returns the normalized gcrd if ``retval`` is "gcrd", a triple as
+        described in ``xgcrd`` if ``retval`` is "bezout", and ``None`` if the
+        parent of ``self`` is not supported.
+        """
+        A = self.parent()
+        K = A.base_ring()
+        Pol = K.ring() if isinstance(K, FractionField_generic) else K
+        if (not isinstance(Pol, PolynomialRing_general)
+                or not (Pol.base_ring() is ZZ or Pol.base_ring() is QQ)
+                or self.order() <= 0 or other.order() <= 0):
+            return None
+
+        PolZ = Pol.change_ring(ZZ)
+        try:
+            AZ = A.change_ring(PolZ)
+            L1 = AZ(_integer_coefficients(self, PolZ))
+            L2 = AZ(_integer_coefficients(other, PolZ))
+        except (TypeError, ValueError, ArithmeticError):
+            return None
+
+        def image(p):
+            Pp = PolZ.change_ring(GF(p))
+            try:
+                Ap = AZ.change_ring(Pp)
+            except (TypeError, ValueError, ArithmeticError):
+                return None
+            L1p = Ap([Pp(c) for c in L1])
+            L2p = Ap([Pp(c) for c in L2])
+            if L1p.order() < L1.order() or L2p.order() < L2.order():
+                return None
+            if retval == "bezout":
+                g, s, t = L1p.xgcrd(L2p)
+                shape = (s.order(), t.order())
+                cofactors = list(s) + list(t)
+            else:
+                g = L1p.gcrd(L2p)
+                shape = ()
+                cofactors = []
+            u = ~g.leading_coefficient()
+            coeffs = [u*c for c in list(g) + cofactors]
+            den = lcm([c.denominator() for c in coeffs])
+            key = (g.order(), -den.degree()) + shape
+            return key, [c.numerator()*(den // c.denominator()) for c in coeffs]
+
+        def check(key, pols):
+            r = key[0]
+            if r == 0 and retval == "gcrd":
+                # the order of the gcrd is at most that of its modular images
+                return A.one()
+            gnums = pols[:r + 1]
+            d = lcm([c.denominator() for c in gnums])
+            G = AZ([PolZ(d*c) for c in gnums])
+            if not all(L.pseudo_quo_rem(G)[2].is_zero() for L in (L1, L2)):
+                return None
+            g = A(list(G)).normalize()
+            if retval == "gcrd":
+                return g
+            RF = A.change_ring(K.fraction_field())
+            F = RF.base_ring()
+            den = pols[r]  # leading coefficient of the monic gcrd
+            def frac(c):
+                e = lcm(c.denominator(), den.denominator())
+                return F(PolZ(e*c))/F(PolZ(e*den))
+            def op(nums):
+                return RF([frac(c) for c in nums])
+            S = op(pols[r + 1:r + key[2] + 2])
+            T = op(pols[r + key[2] + 2:])
+            if S*RF(list(L1)) + T*RF(list(L2)) != op(gnums):
+                return None
+            u = RF(g.leading_coefficient())
+            e1 = RF(F(L1.leading_coefficient())/F(self.leading_coefficient()))
+            e2 = RF(F(L2.leading_coefficient())/F(other.leading_coefficient()))
+            return g, u*S*e1, u*T*e2
+
+        return _multimodular(image, check, Pol.change_ring(QQ), ncpus, infolevel)
+
     def lclm(self, *other, **kwargs):
         """
         Computes the least common left multiple of ``self`` and ``other``.
@@ -1156,6 +1314,18 @@ class UnivariateOreOperator(OreOperator):
           syzygy between the operators in the input. Further optional arguments
           can be passed as explained in the docstring of ``xgcrd``.
 
+        * ``modular`` -- computes the lclm of all the operators at once, modulo several
+          primes. Modulo each prime, the linear system of ``linalg`` is solved at sample
+          points `x=a`, and the coefficients of the monic lclm are interpolated from the
+          solutions. The order and degree of the result found for one prime determine the
+          number of sample points used for the next ones, and only the final operator is
+          lifted by Chinese remaindering and rational reconstruction. The result is checked
+          by right division by the input operators modulo an additional prime, or, if the
+          optional argument ``proof`` is set to ``True``, over the base ring. The optional
+          argument ``ncpus`` allows to process several primes in parallel. This method is
+          only available for operators with coefficients in `K[x]` or `K(x)` where `K` is
+          ``ZZ`` or ``QQ``; ``linalg`` is used in all other cases.
+
         * ``guess`` -- computes the first terms of a solution of ``self`` and ``other``
           and guesses from these a minimal operator annihilating a generic linear
           combination. Unless the input are recurrence operators, an keyword argument
@@ -1179,10 +1349,36 @@ class UnivariateOreOperator(OreOperator):
             (15*x^2 + 40*x + 25)*Dx^2 + (-37*x^2 - 46*x - 25)*Dx - 8*x^2 + 15*x - 33
             sage: B.lclm(L, A*B) 
             (3225*x^5 + 18275*x^4 + 42050*x^3 + 49550*x^2 + 29925*x + 7375)*Dx^3 + (-7310*x^5 - 32035*x^4 - 64640*x^3 - 70730*x^2 - 40090*x - 9275)*Dx^2 + (-3311*x^5 - 3913*x^4 - 6134*x^3 - 20306*x^2 - 25147*x - 9605)*Dx - 344*x^5 + 645*x^4 - 7180*x^3 + 2054*x^2 + 30044*x + 22509
+            sage: A.lclm(B, algorithm="modular") == L
+            True
+            sage: B.lclm(L, A*B, algorithm="modular", proof=True) == B.lclm(L, A*B)
+            True
 
+        The modular algorithm computes the lclm of several operators in one go::
+
+            sage: Rec.<Sn> = OreAlgebra(QQ['n'], 'Sn')
+            sage: n = Rec.base_ring().gen()
+            sage: ops = [(n + 2*k + 1)*Sn - (n + k) for k in range(5)]
+            sage: L = ops[0].lclm(*ops[1:], algorithm="modular", ncpus=2)
+            sage: L.order()
+            5
+            sage: all(L % M == 0 for M in ops)
+            True
+            sage: L == ops[0].lclm(*ops[1:])
+            True
         
         """
 
+        if ("algorithm" in kwargs and kwargs["algorithm"] == "modular"
+                and other and all(L.parent() is self.parent() for L in other)):
+            if self.is_zero() or any(L.is_zero() for L in other):
+                return self.parent().zero()
+            L = self._lclm_modular(*other, **kwargs)
+            if L is not None:
+                return L
+            kwargs = dict(kwargs)
+            kwargs["algorithm"] = "linalg"
+
         if len(other) != 1:
             # possible improvement: rewrite algorithms to allow multiple arguments where possible
             other = list(other)
@@ -1218,6 +1414,180 @@ class UnivariateOreOperator(OreOperator):
         else:
             raise ValueError("unknown algorithm: " + str(kwargs['algorithm']))
 
+    def _lclm_modular(self, *other, **kwargs):
+        """
+        Multi-modular lclm algorithm based on evaluation and interpolation.
+
+        Returns ``None`` if the parent of ``self`` is not supported.
+
+        see docstring of lclm for further information.
+        """
+
+        proof = kwargs["proof"] if "proof" in kwargs else False
+        ncpus = kwargs["ncpus"] if "ncpus" in kwargs else 1
+        infolevel = kwargs["infolevel"] if "infolevel" in kwargs else 0
+
+        A = self.parent()
+        K = A.base_ring()
+        Pol = K.ring() if isinstance(K, FractionField_generic) else K
+        if (not isinstance(Pol, PolynomialRing_general)
+                or not (Pol.base_ring() is ZZ or Pol.base_ring() is QQ)):
+            return None
+
+        PolZ = Pol.change_ring(ZZ)
+        try:
+            AZ = A.change_ring(PolZ)
+            ops = [AZ(_integer_coefficients(L, PolZ)) for L in (self,) + other]
+        except (TypeError, ValueError, ArithmeticError):
+            return None
+        ops = [L for L in ops if L.order() > 0]
+        if not ops:
+            return A.one()
+        elif len(ops) == 1:
+            return A(list(ops[0])).normalize()
+
+        D = AZ.gen()
+        rows = [[L] for L in ops] # rows[i][j] = D^j*ops[i]
+        systems = {}
+
+        def system(t):
+            # The left multiples of order at most t of the operators span an
+            # operator of order t of the form U_i*ops[i] for all i iff the
+            # block matrix built from the coefficient matrices R_i of the rows
+            # D^j*ops[i], j <= t - ord(ops[i]), has a nontrivial kernel. The
+            # polynomial entries of the R_i are returned in a single integer
+            # matrix, each row of which holds the coefficients of one entry.
+            try:
+                return systems[t]
+            except KeyError:
+                pass
+            sizes = [t - L.order() + 1 for L in ops]
+            entries = []
+            for i, size in enumerate(sizes):
+                while len(rows[i]) < size:
+                    rows[i].append(D*rows[i][-1])
+                for row in rows[i][:size]:
+                    entries.extend(row.coefficients(sparse=False, padd=t))
+            deg = max(e.degree() for e in entries)
+            C = matrix(ZZ, len(entries), deg + 1,
+                       [c for e in entries for c in e.padded_list(deg + 1)])
+            systems[t] = sizes, C
+            return sizes, C
+
+        def evaluate(t, Cp, points):
+            # values at the given points of the coefficients of the monic
+            # operator of order t, or None for the points where this operator
+            # is not determined by the evaluated system, or False for those
+            # where there is no operator of order t
+            Fp = Cp.base_ring()
+            sizes = systems[t][0]
+            k = len(sizes)
+            vander = matrix(Fp, Cp.ncols(), len(points),
+                            lambda e, j: points[j]**e)
+            vals = Cp*vander
+            res = []
+            for j in range(len(points)):
+                R = matrix(Fp, sum(sizes), t + 1, vals.column(j).list())
+                blocks = []
+                start = 0
+                for size in sizes:
+                    blocks.append(R.matrix_from_rows(range(start, start + size)))
+                    start += size
+                ST = matrix(Fp, (k - 1)*(t + 1), sum(sizes))
+                col = sizes[0]
+                for i in range(1, k):
+                    ST.set_block((i - 1)*(t + 1), 0, blocks[0].transpose())
+                    ST.set_block((i - 1)*(t + 1), col, -blocks[i].transpose())
+                    col += sizes[i]
+                ker = ST.right_kernel_matrix()
+                if ker.nrows() != 1:
+                    res.append(None if ker.nrows() > 1 else False)
+                    continue
+                lvec = ker.row(0)[:sizes[0]]*blocks[0]
+                res.append(None if lvec[t].is_zero() else lvec/lvec[t])
+            return res
+
+        # expected order and number of sample points, updated after each prime
+        # (in the main process only)
+        expected = {"order": max(L.order() for L in ops), "points": None}
+
+        def image(p):
+            Fp = GF(p)
+            Pp = PolZ.change_ring(Fp)
+            if any(Pp(L.leading_coefficient()).is_zero() for L in ops):
+                return None
+
+            # order of the lclm modulo p
+            t = expected["order"]
+            while True:
+                Cp = system(t)[1].change_ring(Fp)
+                v = evaluate(t, Cp, [Fp.random_element()])[0]
+                if v is False:
+                    t += 1
+                elif v is None:
+                    return None
+                else:
+                    break
+
+            # sample points, skipping those where the system degenerates
+            npts = expected["points"] or 16
+            points, values = [], []
+            a = 0
+            while True:
+                while len(points) < npts:
+                    chunk = [Fp(a + j) for j in range(npts - len(points))]
+                    a += len(chunk)
+                    for b, v in zip(chunk, evaluate(t, Cp, chunk)):
+                        if v is not None and v is not False:
+                            points.append(b)
+                            values.append(v)
+                # interpolate on all points but two, and use those to check
+                x = Pp.gen()
+                modulus = prod(x - b for b in points[:-2])
+                vander = matrix(Fp, npts - 2, npts - 2,
+                                lambda j, e: points[j]**e)
+                coeffs = vander.inverse()*matrix(Fp, values[:-2])
+                fracs = []
+                for k in range(t):
+                    pol = Pp(coeffs.column(k).list())
+                    try:
+                        num, den = _rational_reconstruction(pol, modulus)
+                    except (ValueError, ArithmeticError, ZeroDivisionError):
+                        break
+                    if den.is_zero() or any(den(b)*v[k] != num(b) for b, v in zip(points[-2:], values[-2:])):
+                        break
+                    fracs.append(num/den)
+                else:
+                    break
+                if infolevel > 1:
+                    print(str(npts) + " sample points are not enough modulo " + str(p))
+                npts *= 2
+
+            den = lcm([c.denominator() for c in fracs])
+            nums = [c.numerator()*(den // c.denominator()) for c in fracs] + [den]
+            expected["order"] = t
+            expected["points"] = 2*max(c.degree() for c in nums) + 4
+            return (-t, -den.degree()), nums
+
+        def check(key, pols):
+            d = lcm([c.denominator() for c in pols])
+            L = AZ([PolZ(d*c) for c in pols])
+            if proof:
+                if any(not L.pseudo_quo_rem(M)[2].is_zero() for M in ops):
+                    return None
+            else:
+                q = previous_prime(ZZ.random_element(MAX_MODULUS//2, MAX_MODULUS))
+                Pq = PolZ.change_ring(GF(q))
+                Aq = AZ.change_ring(Pq)
+                Lq = Aq([Pq(c) for c in L])
+                for M in ops:
+                    Mq = Aq([Pq(c) for c in M])
+                    if Mq.order() == M.order() and not Lq.pseudo_quo_rem(Mq)[2].is_zero():
+                        return None
+            return A(list(L)).normalize()
+
+        return _multimodular(image, check, Pol.change_ring(QQ), ncpus, infolevel)
+
     def _lclm_linalg(self, other, **kwargs):
         """
         lclm algorithm based on ansatz and linear algebra over the base ring. 
@@ -2119,3 +2489,323 @@ def __subresultantPRS__(r,additional):
     additional.extend([phi,d1])
 
     return ((r[1],r2),newRem[0],alpha,beta,True)
+
+#############################################################################################################
+
+# Minimal order of both factors above which products of operators in the
+# standard derivation or shift are computed by evaluation and interpolation
+_MUL_EVAL_INTERP_THRESHOLD = 8
+
+def _eval_interp_mul_kind(R):
+    r"""
+    Return ``"D"`` (resp. ``"S"``) if products in the Ore algebra ``R`` can be
+    computed by :func:`_mul_eval_interp_D` (resp. :func:`_mul_eval_interp_S`),
+    and ``None`` otherwise.
+    """
+    Pol = R.base_ring()
+    if not isinstance(Pol, PolynomialRing_general):
+        return None
+    K = Pol.base_ring()
+    if not (K is ZZ or K is QQ or isinstance(K, NumberField)):
+        return None
+    sigma, delta = R.sigma(), R.delta()
+    if not all(sigma(Pol(c)) == c and delta(Pol(c)).is_zero() for c in K.gens()):
+        return None
+    if R.is_D():
+        return "D"
+    elif R.is_S():
+        return "S"
+    return None
+
+@cached_function
+def _falling_factorial_matrix(K, r, n):
+    r"""
+    Matrix of the values of `t^{\underline i}` at `t = 0, \dots, n-1` for
+    `i = 0, \dots, r`.
+    """
+    rows = [[K.one()]*n]
+    for i in range(1, r + 1):
+        rows.append([c*(t - i + 1) for t, c in enumerate(rows[-1])])
+    mat = matrix(K, rows)
+    mat.set_immutable()
+    return mat
+
+@cached_function
+def _inverse_falling_factorial_matrix(K, n):
+    r"""
+    Inverse of ``_falling_factorial_matrix(K, n - 1, n)``.
+
+    The coefficient of `t^{\underline i}` in a polynomial `p` of degree `< n`
+    is the forward difference `\Delta^i p(0)` divided by `i!`.
+    """
+    from sage.arith.misc import binomial, factorial
+    mat = matrix(K, n, n, {(t, i): (-1)**(i - t)*binomial(i, t)/factorial(i)
+                           for i in range(n) for t in range(i + 1)},
+                 sparse=False)
+    mat.set_immutable()
+    return mat
+
+@cached_function
+def _vandermonde_matrix(K, d, n):
+    r"""
+    Matrix of the values of `t^k` at `t = 0, \dots, n-1` for `k = 0, \dots, d`.
+    """
+    mat = matrix(K, d + 1, n, lambda k, t: t**k)
+    mat.set_immutable()
+    return mat
+
+@cached_function
+def _inverse_vandermonde_matrix(K, n):
+    r"""
+    Inverse of ``_vandermonde_matrix(K, n - 1, n)``.
+    """
+    mat = _vandermonde_matrix(K, n - 1, n).inverse()
+    mat.set_immutable()
+    return mat
+
+def _mul_eval_interp_D(L, M):
+    r"""
+    Coefficients of the product of two operators in the standard derivation
+    `D` with polynomial coefficients, computed by evaluation and
+    interpolation.
+
+    Writing an operator as `\sum_j x^j p_j(\theta)` with `\theta = xD`, it maps
+    `x^n` to `\sum_j p_j(n) x^{n+j}`. The values of the `p_j` associated to
+    ``L*M`` at `n = 0, \dots, r` (where `r` is the order of the product) can
+    thus be read off the product of the banded matrices by which ``L`` and
+    ``M`` act on polynomials of bounded degree. The conversions between the
+    `p_j` and the coefficients of the operators, and the interpolation of
+    the `p_j` in the basis of falling factorials of `\theta`, are matrix
+    products as well, so that the whole computation reduces to a few products
+    of matrices over the constants.
+
+    EXAMPLES::
+
+        sage: from ore_algebra import OreAlgebra
+        sage: from ore_algebra.ore_operator import _mul_eval_interp_D
+        sage: Dops.<Dx> = OreAlgebra(ZZ['x'], 'Dx')
+        sage: x = Dops.base_ring().gen()
+        sage: L = (x^3 - 2)*Dx^4 + 3*x*Dx^3 - Dx + x^2 + 1
+        sage: M = 5*Dx^3 + (x^4 - x)*Dx^2 + x^2*Dx - 7*x
+        sage: Dops(_mul_eval_interp_D(L, M)) == L*M
+        True
+        sage: Dops(_mul_eval_interp_D(M, L)) == M*L
+        True
+
+    TESTS:
+
+    Compare with the generic algorithm, used over rational functions::
+
+        sage: Pol = Dops.base_ring()
+        sage: Rat = OreAlgebra(Pol.fraction_field(), 'Dx')
+        sage: L = Dops([Pol.random_element(10) for _ in range(11)])
+        sage: M = Dops([Pol.random_element(12) for _ in range(10)])
+        sage: L*M == Rat(L)*Rat(M)
+        True
+        sage: Dops(_mul_eval_interp_D(L, Dops(x))) == L*x
+        True
+    """
+    Pol = L.parent().base_ring()
+    K = Pol.base_ring().fraction_field()
+    rL, rM = L.order(), M.order()
+    dL = max(c.degree() for c in L)
+    dM = max(c.degree() for c in M)
+    rT, dT = rL + rM, dL + dM
+    npts = rT + 1
+
+    # Values of the theta-coefficients p_j, -r <= j <= d, at the points
+    # t = 0, 1, ... where they are needed
+    PL = _theta_coefficient_matrix(L, K, dL) * _falling_factorial_matrix(K, rL, npts + dM)
+    PM = _theta_coefficient_matrix(M, K, dM) * _falling_factorial_matrix(K, rM, npts)
+
+    # Matrices of x^t -> L(x^t), t < npts + dM, and x^n -> M(x^n), n < npts.
+    # Entries with negative row indices vanish since t^(falling i) = 0 for t < i.
+    ML = matrix(K, npts + dT, npts + dM,
+                {(t + j, t): PL[j + rL, t]
+                 for j in range(-rL, dL + 1)
+                 for t in range(max(0, -j), npts + dM)}, sparse=False)
+    MM = matrix(K, npts + dM, npts,
+                {(n + k, n): PM[k + rM, n]
+                 for k in range(-rM, dM + 1)
+                 for n in range(max(0, -k), npts)}, sparse=False)
+    prod = ML*MM
+
+    vals = matrix(K, dT + rT + 1, npts,
+                  {(m + rT, n): prod[n + m, n]
+                   for m in range(-rT, dT + 1)
+                   for n in range(max(0, -m), npts)}, sparse=False)
+    coeffs = vals*_inverse_falling_factorial_matrix(K, npts)
+
+    # x^k D^i = x^(k-i) theta^(falling i)
+    return [Pol([coeffs[k - i + rT, i] for k in range(dT + 1)])
+            for i in range(rT + 1)]
+
+def _theta_coefficient_matrix(L, K, d):
+    r"""
+    Matrix whose row `j + r` contains the coefficients of `p_j(\theta)` in the
+    basis of falling factorials, where `L = \sum_{j=-r}^d x^j p_j(\theta)`.
+    """
+    r = L.order()
+    return matrix(K, d + r + 1, r + 1,
+                  {(k - i + r, i): c
+                   for i, a in enumerate(L)
+                   for k, c in enumerate(a.list())}, sparse=False)
+
+def _mul_eval_interp_S(L, M):
+    r"""
+    Coefficients of the product of two operators in the standard shift `S`
+    with polynomial coefficients, computed by evaluation and interpolation.
+
+    The operator `\sum_i a_i(x) S^i` acts on sequences as the banded matrix
+    with entries `a_i(n)` at positions `(n, n+i)`. The values at
+    `n = 0, \dots, d` (where `d` is the degree of the product) of the
+    coefficients of ``L*M`` can thus be read off a product of such matrices
+    evaluated at consecutive integers, and are then interpolated. Evaluation,
+    multiplication and interpolation all reduce to products of matrices over
+    the constants.
+
+    EXAMPLES::
+
+        sage: from ore_algebra import OreAlgebra
+        sage: from ore_algebra.ore_operator import _mul_eval_interp_S
+        sage: Sops.<Sn> = OreAlgebra(QQ['n'], 'Sn')
+        sage: n = Sops.base_ring().gen()
+        sage: L = (n^3 - 2)*Sn^4 + 3*n*Sn^3 - Sn + n^2 + 1/3
+        sage: M = 5*Sn^3 + (n^4 - n)*Sn^2 + n^2*Sn - 7*n
+        sage: Sops(_mul_eval_interp_S(L, M)) == L*M
+        True
+        sage: Sops(_mul_eval_interp_S(M, L)) == M*L
+        True
+
+    TESTS::
+
+        sage: Pol = Sops.base_ring()
+        sage: Rat = OreAlgebra(Pol.fraction_field(), 'Sn')
+        sage: L = Sops([Pol.random_element(7) for _ in range(9)])
+        sage: M = Sops([Pol.random_element(5) for _ in range(12)])
+        sage: L*M == Rat(L)*Rat(M)
+        True
+    """
+    Pol = L.parent().base_ring()
+    K = Pol.base_ring().fraction_field()
+    rL, rM = L.order(), M.order()
+    dL = max(c.degree() for c in L)
+    dM = max(c.degree() for c in M)
+    rT, dT = rL + rM, dL + dM
+    npts = dT + 1
+
+    # Values of the coefficients at the points n = 0, 1, ... where they are
+    # needed
+    VL = matrix(K, [a.padded_list(dL + 1) for a in L])*_vandermonde_matrix(K, dL, npts)
+    VM = matrix(K, [b.padded_list(dM + 1) for b in M])*_vandermonde_matrix(K, dM, npts + rL)
+
+    ML = matrix(K, npts, npts + rL,
+                {(n, n + i): VL[i, n]
+                 for i in range(rL + 1) for n in range(npts)}, sparse=False)
+    MM = matrix(K, npts + rL, npts + rT,
+                {(n, n + j): VM[j, n]
+                 for j in range(rM + 1) for n in range(npts + rL)}, sparse=False)
+    prod = ML*MM
+
+    vals = matrix(K, rT + 1, npts,
+                  lambda t, n: prod[n, n + t])
+    coeffs = vals*_inverse_vandermonde_matrix(K, npts)
+
+    return [Pol(coeffs.row(t).list()) for t in range(rT + 1)]
+
+#############################################################################################################
+
+def _integer_coefficients(L, PolZ):
+    r"""
+    Coefficients in ``PolZ`` of a left multiple of ``L`` by an element of the
+    base ring, where the coefficients of ``L`` are polynomials or rational
+    functions over ``ZZ`` or ``QQ``.
+    """
+    num = L.numerator()
+    coeffs = [c.numerator() if num.base_ring().is_field() else c for c in num]
+    d = lcm([c.denominator() for c in coeffs])
+    return [PolZ(d*c) for c in coeffs]
+
+def _multimodular(image, check, Pol, ncpus=1, infolevel=0):
+    r"""
+    Multi-modular reconstruction of a list of polynomials with rational
+    coefficients.
+
+    INPUT:
+
+    - ``image`` -- function taking a prime `p` and returning either ``None``,
+      if `p` is to be skipped, or a pair ``(key, pols)`` where ``pols`` is the
+      image modulo `p` of the list of polynomials to be reconstructed, and
+      ``key`` is such that the images of smallest key are those modulo lucky
+      primes
+    - ``check`` -- function taking a key and a list of candidate polynomials
+      in ``Pol`` and returning the final result, or ``None`` if the candidate
+      is incorrect
+    - ``Pol`` -- univariate polynomial ring over ``QQ``
+    - ``ncpus`` -- number of primes to process in parallel
+
+    OUTPUT:
+
+    The first result returned by ``check`` on a reconstructed candidate that
+    did not change after the addition of a new prime.
+    """
+
+    if ncpus > 1:
+        @parallel(ncpus=ncpus)
+        def forked_image(p):
+            return image(p)
+
+    key = V = M = last = None
+    p = MAX_MODULUS
+    while True:
+
+        primes = []
+        for _ in range(ncpus):
+            p = previous_prime(p)
+            primes.append(p)
+        if ncpus == 1:
+            images = [(p, image(p))]
+        else:
+            images = [(args[0][0], img) for args, img in forked_image(primes)]
+
+        for m, img in sorted(images, key=lambda u: u[0]):
+            if img is None:
+                if infolevel > 1:
+                    print("skipping modulus " + str(m))
+                continue
+            if not isinstance(img, tuple): # 'NO DATA' if the worker failed
+                raise RuntimeError("computation modulo " + str(m) + " failed in forked process")
+            key_m, pols_m = img
+            pols_m = [pol.change_ring(ZZ) for pol in pols_m]
+            if key is None or key_m < key:
+                # initialization, or all previous primes were unlucky
+                key, V, M, last = key_m, pols_m, m, None
+            elif key_m != key or len(pols_m) != len(V):
+                if infolevel > 0:
+                    print("unlucky modulus " + str(m) + " discarded")
+            else:
+                g, M0, p0 = xgcd(m, M)
+                M0, p0 = M0*m, p0*M
+                M *= m
+                V = [(v*M0 + w*p0).map_coefficients(lambda c: c % M)
+                     for v, w in zip(V, pols_m)]
+
+        if V is None:
+            # all primes skipped so far
+            continue
+
+        if infolevel > 0:
+            print(str(M.nbits()) + " bits of modulus")
+
+        try:
+            cand = [Pol([ZZ(c).rational_reconstruction(M) for c in v.list()])
+                    for v in V]
+        except (ValueError, ArithmeticError):
+            continue
+        if cand == last:
+            res = check(key, cand)
+            if res is not None:
+                return res
+            if infolevel > 0:
+                print("reconstruction failed, adding more primes")
+        last = cand
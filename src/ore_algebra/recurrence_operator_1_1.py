@@ -16,11 +16,12 @@ Univariate recurrence operators over univariate rings
 
 from functools import reduce
 
-from sage.arith.all import gcd
+from sage.arith.all import gcd, lcm
 from sage.functions.all import floor
 from sage.misc.all import prod
 from sage.misc.cachefunc import cached_method
 from sage.rings.rational_field import QQ
+from sage.rings.finite_rings.all import GF
 from sage.rings.integer_ring import ZZ
 from sage.rings.infinity import infinity
 from sage.rings.qqbar import QQbar
@@ -28,7 +29,7 @@ from sage.rings.power_series_ring import PowerSeriesRing
 from sage.rings.laurent_series_ring import LaurentSeriesRing
 from sage.structure.element import canonical_coercion
 
-from .tools import shift_factor, _vect_val_fct, _vect_elim_fct, roots_at_integer_distance, _rec2list
+from .tools import shift_factor, _vect_val_fct, _vect_elim_fct, roots_at_integer_distance, _rec2list, _rec2list_mod
 from .ore_algebra import OreAlgebra_generic
 from .ore_operator import UnivariateOreOperator
 from .ore_operator_1_1 import UnivariateOreOperatorOverUnivariateRing
@@ -213,7 +214,7 @@ class UnivariateRecurrenceOperatorOverUnivariateRing(UnivariateOreOperatorOverUn
         """
         return self.to_D('D').to_T(alg)        
 
-    def to_list(self, init, n, start=0, append=False, padd=False):
+    def to_list(self, init, n, start=0, append=False, padd=False, modulus=None):
         r"""
         Computes the terms of some sequence annihilated by ``self``.
 
@@ -231,6 +232,12 @@ class UnivariateRecurrenceOperatorOverUnivariateRing(UnivariateOreOperatorOverUn
         - ``padd`` (optional) -- if ``True``, the vector of initial values is implicitly
           prolonged to the left (!) by zeros if it is too short. Otherwise (default),
           the method raises a ``ValueError`` if ``init`` is too short.
+        - ``modulus`` (optional) -- a prime `p < 2^{31}`. If given, the terms are
+          computed modulo `p` and returned as elements of `GF(p)`. This requires the
+          base ring of ``self`` to be `ZZ[n]`, `QQ[n]` or `GF(p)[n]`, and is much faster
+          than computing the terms in the fraction field and reducing them afterwards.
+          In this case, terms whose computation requires a division by zero modulo `p`
+          are represented by ``None``, even if they could be computed in characteristic zero.
 
         OUTPUT:
 
@@ -260,8 +267,19 @@ class UnivariateRecurrenceOperatorOverUnivariateRing(UnivariateOreOperatorOverUn
             (46189*x^10 - 109395*x^8 + 90090*x^6 - 30030*x^4 + 3465*x^2 - 63)/256]
            sage: ((n-5)*Sn - 1).to_list([1], 10)
            [1, 1/-5, 1/20, 1/-60, 1/120, -1/120, None, None, None, None]
+
+        Computing terms modulo a prime::
+
+           sage: A.<Sn> = OreAlgebra(QQ['n'], 'Sn'); n = A.base_ring().gen()
+           sage: L = (n + 2)*Sn - (4*n + 2)
+           sage: L.to_list([1], 10, modulus=101)
+           [1, 1, 2, 5, 14, 42, 31, 25, 16, 14]
+           sage: L.to_list([1], 10**5, modulus=1000003)[-1] == catalan_number(10**5 - 1) % 1000003
+           True
         
         """
+        if modulus is not None:
+            return _rec2list_mod(self, init, n, start, append, padd, modulus)
         return _rec2list(self, init, n, start, append, padd, ZZ)
 
     def forward_matrix_bsplit(self, n, start=0):
@@ -510,6 +528,109 @@ class UnivariateRecurrenceOperatorOverUnivariateRing(UnivariateOreOperatorOverUn
 
         return value_M, value_Q
 
+    def nth_term(self, n, ini, start=0, modulus=None):
+        r"""
+        Computes a single term of a sequence annihilated by ``self`` without
+        generating all the preceding terms.
+
+        INPUT:
+
+        - ``n`` -- index of the desired term
+        - ``ini`` -- list of the `r` initial values `c_s, \ldots, c_{s+r-1}`,
+          where `r` is the order of ``self`` and `s` is ``start``
+        - ``start`` (optional) -- index of the first initial value. Defaults to zero.
+        - ``modulus`` (optional) -- a prime `p`. If given, the term is computed
+          modulo `p` and returned as an element of `GF(p)`. The coefficients of
+          ``self`` and the initial values must be reducible modulo `p`.
+
+        OUTPUT:
+
+        The term `c_n`. An error is raised if the leading coefficient of ``self``
+        vanishes (modulo `p`, if applicable) at one of the indices `s, \ldots, n - r`.
+
+        ALGORITHM:
+
+        - Modulo a prime, and over prime fields, the baby-step/giant-step algorithm
+          of Chudnovsky and Chudnovsky as refined by Bostan, Gaudry and Schost:
+          the product of `m \approx \sqrt{n}` consecutive companion matrices is
+          computed as a matrix of polynomials and evaluated at the `n/m` required
+          points using a remainder tree. This takes `\tilde O(\sqrt{n})` operations.
+        - Over `ZZ` and `QQ`, binary splitting on integer matrices after clearing
+          denominators, with common content removed from the partial products and
+          blocks of consecutive steps multiplied out directly at the leaves.
+        - Otherwise, the value is obtained from ``forward_matrix_bsplit``.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: A.<Sn> = OreAlgebra(ZZ['n'], 'Sn'); n = A.base_ring().gen()
+            sage: (Sn^2 - Sn - 1).nth_term(100, [0, 1]) == fibonacci(100)
+            True
+            sage: (Sn^2 - Sn - 1).nth_term(10^6, [0, 1], modulus=1000003) == fibonacci(10^6) % 1000003
+            True
+            sage: L = (n + 2)*Sn - (4*n + 2)
+            sage: L.nth_term(1000, [1]) == catalan_number(1000)
+            True
+            sage: L.nth_term(10^5, [1], modulus=1000003) == catalan_number(10^5) % 1000003
+            True
+            sage: L.nth_term(12, [42], start=5)
+            208012
+            sage: B.<Sk> = OreAlgebra(GF(1009)['k'], 'Sk'); k = B.base_ring().gen()
+            sage: ((k + 1)*Sk - 1).nth_term(1000, [1]) == GF(1009)(1/factorial(1000))
+            True
+
+        TESTS::
+
+            sage: ((n - 5)*Sn - 1).nth_term(7, [1])
+            Traceback (most recent call last):
+            ...
+            ZeroDivisionError: leading coefficient vanishes in the given range
+            sage: L.nth_term(0, [1]), L.nth_term(3, [1], modulus=7)
+            (1, 5)
+            sage: (Sn^2 - Sn - 1).nth_term(4, [0, 1], start=5)
+            Traceback (most recent call last):
+            ...
+            ValueError: n must be at least start
+        """
+        n = ZZ(n)
+        start = ZZ(start)
+        r = self.order()
+        if len(ini) != r:
+            raise ValueError("expected " + str(r) + " initial values")
+        if n < start:
+            raise ValueError("n must be at least start")
+        steps = n - start - r + 1 # number of companion matrices needed to reach c_n
+        K = self.base_ring().base_ring()
+
+        if modulus is None and K.is_prime_field() and K.characteristic() > 0:
+            modulus = K.characteristic()
+
+        if modulus is not None:
+            Kp = GF(modulus)
+            ini = [Kp(c) for c in ini]
+            if steps <= 0:
+                return ini[n - start]
+            coeffs = [c.change_ring(Kp) for c in self]
+            M, Q = _forward_matrix_bsgs(coeffs, steps, start)
+        elif K is ZZ or K is QQ:
+            ini = [QQ(c) for c in ini]
+            if steps <= 0:
+                return ini[n - start]
+            coeffs = [c.change_ring(QQ) for c in self]
+            d = lcm([c.denominator() for p in coeffs for c in p])
+            coeffs = [(d*c).change_ring(ZZ) for c in coeffs]
+            M, Q = _forward_matrix_bsplit_exact(coeffs, steps, start)
+        else:
+            K = K.fraction_field()
+            ini = [K(c) for c in ini]
+            if steps <= 0:
+                return ini[n - start]
+            M, Q = self.forward_matrix_bsplit(steps, start)
+
+        if Q.is_zero():
+            raise ZeroDivisionError("leading coefficient vanishes in the given range")
+        return sum(M[r - 1, i]*ini[i] for i in range(r))/Q
+
     def annihilator_of_sum(self):
         r"""
         Returns an operator `L` which annihilates all the indefinite sums `\sum_{k=0}^n a_k`
@@ -1302,6 +1423,104 @@ class UnivariateRecurrenceOperatorOverUnivariateRing(UnivariateOreOperatorOverUn
     
 #############################################################################################################
 
+def _companion_step(coeffs, j, matrix_ring):
+    r"""
+    Returns the pair `(M, Q)` such that `M/Q` is the companion matrix of the
+    recurrence with coefficients ``coeffs`` at index ``j``.
+    """
+    r = len(coeffs) - 1
+    M = matrix_ring()
+    Q = coeffs[r](j)
+    for i in range(r-1):
+        M[i, i+1] = Q
+    for i in range(r):
+        M[r-1, i] = -coeffs[i](j)
+    return M, Q
+
+def _forward_matrix_bsgs(coeffs, n, start):
+    r"""
+    Baby-step/giant-step version of ``forward_matrix_bsplit`` for recurrences
+    with coefficients ``coeffs`` in `GF(p)[k]`.
+    """
+    from sage.matrix.matrix_space import MatrixSpace
+    from .nullspace import product_tree, multipoint_evaluate
+
+    Rk = coeffs[0].parent()
+    k = Rk.gen()
+    Kp = Rk.base_ring()
+    r = len(coeffs) - 1
+    matrix_ring = MatrixSpace(Kp, r, r)
+    M, Q = matrix_ring.one(), Kp.one()
+
+    m = n.isqrt()
+    g = n // m if m > 0 else 0 # number of giant steps
+
+    if g >= 2:
+        # baby steps: product of m consecutive companion matrices, as polynomials in k
+        poly_matrix_ring = MatrixSpace(Rk, r, r)
+        def bsplit(a, b):
+            if b - a == 1:
+                return _companion_step(coeffs, k + a, poly_matrix_ring)
+            mid = a + (b - a) // 2
+            M1, Q1 = bsplit(a, mid)
+            M2, Q2 = bsplit(mid, b)
+            return M2 * M1, Q2 * Q1
+        PM, PQ = bsplit(0, m)
+
+        # giant steps: evaluate at start, start + m, ..., start + (g - 1)*m
+        points = [Kp(start + j*m) for j in range(g)]
+        tree = product_tree(k, points, 0, g)
+        def evaluate(poly):
+            values = []
+            multipoint_evaluate(poly, points, 0, g, tree, values)
+            return values
+        entries = [[evaluate(PM[i, j]) for j in range(r)] for i in range(r)]
+        denominators = evaluate(PQ)
+        for t in range(g):
+            M = matrix_ring([[entries[i][j][t] for j in range(r)] for i in range(r)]) * M
+            Q *= denominators[t]
+    else:
+        g = m = 0
+
+    for j in range(start + g*m, start + n):
+        Mj, Qj = _companion_step(coeffs, j, matrix_ring)
+        M = Mj * M
+        Q *= Qj
+
+    return M, Q
+
+def _forward_matrix_bsplit_exact(coeffs, n, start, leaf_size=64):
+    r"""
+    Variant of ``forward_matrix_bsplit`` for recurrences with coefficients
+    ``coeffs`` in `ZZ[k]`, which removes the common content of the partial
+    products and multiplies out blocks of at most ``leaf_size`` consecutive
+    companion matrices directly instead of recursing down to single steps.
+    """
+    from sage.matrix.matrix_space import MatrixSpace
+
+    r = len(coeffs) - 1
+    matrix_ring = MatrixSpace(ZZ, r, r)
+
+    def bsplit(a, b):
+        if b - a <= leaf_size:
+            M, Q = matrix_ring.one(), ZZ.one()
+            for j in range(a, b):
+                Mj, Qj = _companion_step(coeffs, j, matrix_ring)
+                M = Mj * M
+                Q *= Qj
+        else:
+            mid = a + (b - a) // 2
+            M1, Q1 = bsplit(a, mid)
+            M2, Q2 = bsplit(mid, b)
+            M, Q = M2 * M1, Q2 * Q1
+        g = gcd(M.list() + [Q])
+        if g > 1:
+            M = matrix_ring([e // g for e in M.list()])
+            Q //= g
+        return M, Q
+
+    return bsplit(start, start + n)
+
 class UnivariateDifferenceOperatorOverUnivariateRing(UnivariateOreOperatorOverUnivariateRing):
     r"""
     Element of an Ore algebra K(x)[F], where F is the forward difference operator F f(x) = f(x+1) - f(x)
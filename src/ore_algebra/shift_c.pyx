@@ -0,0 +1,85 @@
+# cython: language=c++
+# cython: language_level=3
+r"""
+Taylor shifts of univariate polynomials using FLINT
+"""
+
+#############################################################################
+#  Distributed under the terms of the GNU General Public License (GPL)      #
+#  either version 2, or (at your option) any later version                  #
+#                                                                           #
+#  http://www.gnu.org/licenses/                                             #
+#############################################################################
+
+from sage.libs.flint.fmpq_poly cimport *
+from sage.libs.flint.fmpz cimport *
+from sage.libs.flint.fmpz_poly cimport *
+from sage.libs.flint.nmod_poly cimport nmod_poly_taylor_shift
+from sage.libs.flint.types cimport *
+
+from sage.rings.integer cimport Integer
+from sage.rings.polynomial.polynomial_integer_dense_flint cimport Polynomial_integer_dense_flint
+from sage.rings.polynomial.polynomial_rational_flint cimport Polynomial_rational_flint
+from sage.rings.polynomial.polynomial_zmod_flint cimport Polynomial_zmod_flint
+
+cdef extern from "flint_wrap.h":
+    void _fmpz_poly_taylor_shift(fmpz * poly, const fmpz_t c, slong n)
+
+def taylor_shift(pol, c):
+    r"""
+    Compute ``pol(x + c)``, where ``x`` is the variable of ``pol``, using the
+    Taylor shift functions of FLINT.
+
+    Only polynomials over ``ZZ``, ``QQ`` and ``GF(p)`` with a shift that is
+    an integer (resp. an element of the prime field) are supported. Return
+    ``None`` for unsupported input.
+
+    EXAMPLES::
+
+        sage: from ore_algebra.shift_c import taylor_shift
+        sage: x = polygen(ZZ, 'x')
+        sage: taylor_shift(x^3 + 2*x, -1)
+        x^3 - 3*x^2 + 5*x - 3
+        sage: taylor_shift((x^3 + 2*x)/7, 2)
+        1/7*x^3 + 6/7*x^2 + 2*x + 12/7
+        sage: taylor_shift(GF(5)['x'](x^3 + 2*x), 8)
+        x^3 + 4*x^2 + 4*x + 3
+        sage: taylor_shift(x^3 + 2*x, 1/2) is None
+        True
+    """
+    cdef Integer _c
+    cdef fmpz_t fc
+    cdef Polynomial_integer_dense_flint zres
+    cdef Polynomial_rational_flint qres
+    cdef Polynomial_zmod_flint pres
+    try:
+        _c = Integer(c)
+    except TypeError:
+        return None
+    if isinstance(pol, Polynomial_integer_dense_flint):
+        zres = (<Polynomial_integer_dense_flint> pol)._new()
+        fmpz_init(fc)
+        fmpz_set_mpz(fc, _c.value)
+        fmpz_poly_taylor_shift(zres._poly,
+                               (<Polynomial_integer_dense_flint> pol)._poly, fc)
+        fmpz_clear(fc)
+        return zres
+    elif isinstance(pol, Polynomial_rational_flint):
+        # Shifting by an integer preserves the content of the numerator, so
+        # that the result is still in canonical form
+        qres = (<Polynomial_rational_flint> pol)._new()
+        fmpq_poly_set(qres._poly, (<Polynomial_rational_flint> pol)._poly)
+        fmpz_init(fc)
+        fmpz_set_mpz(fc, _c.value)
+        _fmpz_poly_taylor_shift(fmpq_poly_numref(qres._poly), fc,
+                                fmpq_poly_length(qres._poly))
+        fmpz_clear(fc)
+        return qres
+    elif isinstance(pol, Polynomial_zmod_flint):
+        if not pol.parent().base_ring().is_field():
+            return None
+        pres = (<Polynomial_zmod_flint> pol)._new()
+        nmod_poly_taylor_shift(&pres.x, &(<Polynomial_zmod_flint> pol).x,
+                               <ulong> (_c % pol.parent().characteristic()))
+        return pres
+    return None
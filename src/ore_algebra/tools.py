@@ -21,6 +21,7 @@ from sage.rings.power_series_ring import PowerSeriesRing
 from sage.rings.qqbar import QQbar
 from sage.rings.rational_field import QQ
 from sage.rings.integer_ring import ZZ
+from sage.rings.finite_rings.all import GF
 try:
     from sage.rings.complex_mpfr import ComplexField
 except ImportError:
@@ -634,6 +635,136 @@ def _rec2list(L, init, n, start, append, padd, deform, singularity_handler=None)
     return terms
 
 
+def _rec2list_mod(L, init, n, start, append, padd, modulus, block_size=4096):
+    r"""
+    Computes terms of a sequence annihilated by a recurrence operator ``L`` over
+    `K[n]`, with `K` equal to `ZZ`, `QQ` or `GF(p)`, modulo the prime ``modulus``.
+
+    This is a fast variant of ``_rec2list`` for the standard shift. The coefficients
+    of the recurrence are evaluated at blocks of consecutive indices by finite
+    differences on NumPy arrays, and the leading coefficients of each block are
+    inverted at once. Only the recurrence itself is unrolled term by term, using
+    machine integers. The modulus must be a prime less than `2^{31}`.
+
+    Terms whose computation would require dividing by zero modulo ``modulus`` are
+    represented by ``None``, and so are all subsequent terms.
+
+    EXAMPLES::
+
+        sage: from ore_algebra import OreAlgebra
+        sage: from ore_algebra.tools import _rec2list_mod
+        sage: A.<Sn> = OreAlgebra(QQ['n'], 'Sn')
+        sage: n = A.base_ring().gen()
+        sage: L = (n + 2)*Sn - (4*n + 2)  # Catalan numbers
+        sage: _rec2list_mod(L, [1], 10, 0, False, False, 101, block_size=3)
+        [1, 1, 2, 5, 14, 42, 31, 25, 16, 14]
+        sage: [catalan_number(k) % 101 for k in range(10)]
+        [1, 1, 2, 5, 14, 42, 31, 25, 16, 14]
+        sage: _rec2list_mod((n - 5)*Sn - 1, [1], 8, 0, False, False, 101)
+        [1, 20, 96, 69, 16, 85, None, None]
+    """
+    import numpy
+
+    p = ZZ(modulus)
+    if not p.is_prime() or p >= 2**31:
+        raise ValueError("modulus must be a prime less than 2^31")
+    Kp = GF(p)
+    p = int(p)
+
+    r = L.order()
+    terms = init if append else list(init)
+    terms_mod = [None if t is None else int(Kp(t)) for t in terms]
+
+    def result():
+        out = [None if t is None else Kp(t) for t in terms_mod]
+        if append:
+            terms[:] = out
+            return terms
+        return out
+
+    if len(terms_mod) >= n:
+        return result()
+
+    shift = 0
+    if len(terms_mod) < r:
+        if not padd:
+            raise ValueError("not enough initial values.")
+        shift = r - len(terms_mod)
+        terms_mod = [0]*shift + terms_mod
+        start -= shift
+        n += shift
+
+    if None in terms_mod:
+        terms_mod.extend([None]*(n - len(terms_mod)))
+        terms_mod = terms_mod[shift:]
+        return result()
+
+    # coefficients of the recurrence terms[k] = (rec[0]*terms[k-r] + ... + rec[r-1]*terms[k-1])/lc,
+    # all to be evaluated at k + start, reduced mod p.
+    sigma = L.parent().sigma()
+    rec = [sigma(c, -r) for c in L.numerator().coefficients(sparse=False)]
+    rec = [-c for c in rec[:-1]] + [rec[-1]]
+    rec = [c.change_ring(Kp) for c in rec]
+
+    # diffs[i][j] is the j-th forward difference of rec[i] at the first index of the next block
+    k0 = len(terms_mod)
+    diffs = []
+    for c in rec:
+        d = c.degree()
+        vals = [c(k0 + start + j) for j in range(d + 1)] if d >= 0 else [Kp.zero()]
+        diff = []
+        while vals:
+            diff.append(int(vals[0]))
+            vals = [vals[j + 1] - vals[j] for j in range(len(vals) - 1)]
+        diffs.append(diff)
+
+    def evaluate_block(diff, size):
+        # returns the values of a polynomial at the next size indices and updates diff in place
+        arrays = [numpy.full(size, diff[-1], dtype=numpy.int64)]
+        for j in range(len(diff) - 2, -1, -1):
+            a = numpy.empty(size, dtype=numpy.int64)
+            a[0] = diff[j]
+            numpy.cumsum(arrays[-1][:-1], out=a[1:])
+            a[1:] += diff[j]
+            a %= p
+            arrays.append(a)
+        arrays.reverse()
+        for j in range(len(diff) - 1):
+            diff[j] = int((arrays[j][-1] + arrays[j + 1][-1]) % p)
+        return arrays[0]
+
+    def invert(a):
+        # elementwise a^(p-2) mod p, by square and multiply on the whole array
+        res = numpy.ones_like(a)
+        e = p - 2
+        while e:
+            if e & 1:
+                res = (res*a) % p
+            a = (a*a) % p
+            e >>= 1
+        return res
+
+    while k0 < n:
+        size = min(block_size, n - k0)
+        coeffs = [evaluate_block(diff, size) for diff in diffs]
+        lc = coeffs.pop()
+        coeffs = [c.tolist() for c in coeffs]
+        singular = numpy.flatnonzero(lc == 0)
+        inv = invert(lc).tolist()
+        stop = size if len(singular) == 0 else int(singular[0])
+        for t in range(stop):
+            s = 0
+            for i in range(r):
+                s += terms_mod[k0 + t - r + i]*coeffs[i][t]
+            terms_mod.append(s % p * inv[t] % p)
+        if stop < size:
+            terms_mod.extend([None]*(n - len(terms_mod)))
+            break
+        k0 += size
+
+    terms_mod = terms_mod[shift:]
+    return result()
+
 def _power_series_solutions(op, rec, n, deform):
     r"""
     Common code for computing terms of holonomic and q-holonomic power series.